@@ -37,6 +37,7 @@ __all__ = (
     "ChatMemberHandler",
     "ChosenInlineResultHandler",
     "CommandHandler",
+    "CommandRouter",
     "ContextTypes",
     "ConversationHandler",
     "Defaults",
@@ -54,7 +55,11 @@ __all__ = (
     "PollHandler",
     "PreCheckoutQueryHandler",
     "PrefixHandler",
+    "SQLitePersistence",
+    "ShardedUpdateProcessor",
     "ShippingQueryHandler",
+    "SimpleJobQueue",
+    "SimpleRateLimiter",
     "SimpleUpdateProcessor",
     "StringCommandHandler",
     "StringRegexHandler",
@@ -69,7 +74,11 @@ from ._application import Application, ApplicationHandlerStop
 from ._applicationbuilder import ApplicationBuilder
 from ._basepersistence import BasePersistence, PersistenceInput
 from ._baseratelimiter import BaseRateLimiter
-from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
+from ._baseupdateprocessor import (
+    BaseUpdateProcessor,
+    ShardedUpdateProcessor,
+    SimpleUpdateProcessor,
+)
 from ._callbackcontext import CallbackContext
 from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
 from ._contexttypes import ContextTypes
@@ -85,6 +94,7 @@ from ._handlers.chatjoinrequesthandler import ChatJoinRequestHandler
 from ._handlers.chatmemberhandler import ChatMemberHandler
 from ._handlers.choseninlineresulthandler import ChosenInlineResultHandler
 from ._handlers.commandhandler import CommandHandler
+from ._handlers.commandrouter import CommandRouter
 from ._handlers.conversationhandler import ConversationHandler
 from ._handlers.inlinequeryhandler import InlineQueryHandler
 from ._handlers.messagehandler import MessageHandler
@@ -97,6 +107,8 @@ from ._handlers.shippingqueryhandler import ShippingQueryHandler
 from ._handlers.stringcommandhandler import StringCommandHandler
 from ._handlers.stringregexhandler import StringRegexHandler
 from ._handlers.typehandler import TypeHandler
-from ._jobqueue import Job, JobQueue
+from ._jobqueue import Job, JobQueue, SimpleJobQueue
 from ._picklepersistence import PicklePersistence
+from ._simpleratelimiter import SimpleRateLimiter
+from ._sqlitepersistence import SQLitePersistence
 from ._updater import Updater
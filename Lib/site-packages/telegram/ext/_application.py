@@ -24,8 +24,8 @@ import itertools
 import platform
 import signal
 import sys
+import weakref
 from collections import defaultdict
-from copy import deepcopy
 from pathlib import Path
 from types import MappingProxyType, TracebackType
 from typing import (
@@ -39,6 +39,8 @@ from typing import (
     Dict,
     Generator,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     NoReturn,
@@ -69,6 +71,9 @@ from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._extbot import ExtBot
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._updater import Updater
+from telegram.ext._utils._update_parsing import get_update_type
+from telegram.ext._utils.datacache import DataCache
+from telegram.ext._utils.snapshot import snapshot
 from telegram.ext._utils.stack import was_called_by
 from telegram.ext._utils.trackingdict import TrackingDict
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, RT, UD, ConversationKey, HandlerCallback
@@ -204,6 +209,12 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                   the data associated with a specific chat, e.g. if the bot got removed from that
                   chat, please use :meth:`drop_chat_data`.
 
+            .. versionchanged:: NEXT.VERSION
+                If :meth:`telegram.ext.ApplicationBuilder.lazy_data_loading` is used, only
+                contains the data of the chats that was loaded from the persistence. Entries
+                may be removed automatically, if the size of the cache or the idle time of
+                entries is limited.
+
         user_data (:obj:`types.MappingProxyType`): A dictionary handlers can use to store data for
             the user. For each integer user id, the corresponding value of this mapping is
             available as :attr:`telegram.ext.CallbackContext.user_data` in handler callbacks for
@@ -221,7 +232,18 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                  the data associated with a specific user, e.g. if that user blocked the bot,
                  please use :meth:`drop_user_data`.
 
+            .. versionchanged:: NEXT.VERSION
+                If :meth:`telegram.ext.ApplicationBuilder.lazy_data_loading` is used, only
+                contains the data of the users that was loaded from the persistence. Entries
+                may be removed automatically, if the size of the cache or the idle time of
+                entries is limited.
+
         bot_data (:obj:`dict`): A dictionary handlers can use to store data for the bot.
+
+            .. versionchanged:: NEXT.VERSION
+                Accessing :attr:`bot_data` marks it to be updated on the next run of
+                :meth:`update_persistence`. If it is not accessed between two runs, the
+                persistence is not updated.
         persistence (:class:`telegram.ext.BasePersistence`): The persistence class to
             store data that should be persistent over restarts.
         handlers (Dict[:obj:`int`, List[:class:`telegram.ext.BaseHandler`]]): A dictionary mapping
@@ -258,19 +280,24 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             "__update_persistence_lock",
             "__update_persistence_task",
             "__stop_running_marker",
+            "_bot_data",
+            "_bot_data_to_be_updated_in_persistence",
             "_chat_data",
             "_chat_ids_to_be_deleted_in_persistence",
             "_chat_ids_to_be_updated_in_persistence",
             "_conversation_handler_conversations",
+            "_data_cache_size",
+            "_data_idle_timeout",
+            "_handler_index",
             "_initialized",
             "_job_queue",
+            "_lazy_data_loading",
             "_running",
             "_update_processor",
             "_user_data",
             "_user_ids_to_be_deleted_in_persistence",
             "_user_ids_to_be_updated_in_persistence",
             "bot",
-            "bot_data",
             "chat_data",
             "context_types",
             "error_handlers",
@@ -310,6 +337,10 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         post_stop: Optional[
             Callable[["Application[BT, CCT, UD, CD, BD, JQ]"], Coroutine[Any, Any, None]]
         ],
+        handler_index: bool = False,
+        lazy_data_loading: bool = False,
+        data_cache_size: Optional[int] = None,
+        data_idle_timeout: Optional[float] = None,
     ):
         if not was_called_by(
             inspect.currentframe(), Path(__file__).parent.resolve() / "_applicationbuilder.py"
@@ -337,9 +368,23 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             Callable[[Application[BT, CCT, UD, CD, BD, JQ]], Coroutine[Any, Any, None]]
         ] = post_stop
         self._update_processor = update_processor
-        self.bot_data: BD = self.context_types.bot_data()
-        self._user_data: DefaultDict[int, UD] = defaultdict(self.context_types.user_data)
-        self._chat_data: DefaultDict[int, CD] = defaultdict(self.context_types.chat_data)
+        self._bot_data: BD = self.context_types.bot_data()
+        self._bot_data_to_be_updated_in_persistence: bool = False
+        # With lazy loading, the data of a user or chat is only loaded from the persistence when
+        # it is first needed. See `ApplicationBuilder.lazy_data_loading`
+        self._lazy_data_loading: bool = lazy_data_loading
+        self._data_cache_size: Optional[int] = data_cache_size if lazy_data_loading else None
+        self._data_idle_timeout: Optional[float] = (
+            data_idle_timeout if lazy_data_loading else None
+        )
+        self._user_data: Union[DefaultDict[int, UD], DataCache[UD]]
+        self._chat_data: Union[DefaultDict[int, CD], DataCache[CD]]
+        if lazy_data_loading:
+            self._user_data = DataCache(self.context_types.user_data)
+            self._chat_data = DataCache(self.context_types.chat_data)
+        else:
+            self._user_data = defaultdict(self.context_types.user_data)
+            self._chat_data = defaultdict(self.context_types.chat_data)
         # Read only mapping
         self.user_data: Mapping[int, UD] = MappingProxyType(self._user_data)
         self.chat_data: Mapping[int, CD] = MappingProxyType(self._chat_data)
@@ -361,6 +406,12 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             str, TrackingDict[ConversationKey, object]
         ] = {}
 
+        # Maps each update type to the handlers of each group that can possibly handle such an
+        # update. Only maintained if enabled via `ApplicationBuilder.handler_index`
+        self._handler_index: Optional[Dict[str, Dict[int, List[BaseHandler[Any, CCT]]]]] = (
+            {update_type: {} for update_type in Update.ALL_TYPES} if handler_index else None
+        )
+
         # A number of low-level helpers for the internal logic
         self._initialized = False
         self._running = False
@@ -460,6 +511,18 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         """
         return self._update_processor
 
+    @property
+    def bot_data(self) -> BD:
+        # documented in the class docstring
+        # The data may be modified by whoever accesses it, so it has to be persisted next time
+        self._bot_data_to_be_updated_in_persistence = True
+        return self._bot_data
+
+    @bot_data.setter
+    def bot_data(self, bot_data: BD) -> None:
+        self._bot_data_to_be_updated_in_persistence = True
+        self._bot_data = bot_data
+
     @staticmethod
     def _raise_system_exit() -> NoReturn:
         raise SystemExit
@@ -573,13 +636,24 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         if not self.persistence:
             return
 
-        if self.persistence.store_data.user_data:
-            self._user_data.update(await self.persistence.get_user_data())
-        if self.persistence.store_data.chat_data:
-            self._chat_data.update(await self.persistence.get_chat_data())
+        if self._lazy_data_loading:
+            for kind in ("user_data", "chat_data"):
+                if getattr(self.persistence.store_data, kind) and (
+                    getattr(type(self.persistence), f"load_{kind}")
+                    is getattr(BasePersistence, f"load_{kind}")
+                ):
+                    raise TypeError(
+                        f"Lazy loading of {kind} requires the persistence to implement "
+                        f"`load_{kind}`."
+                    )
+        else:
+            if self.persistence.store_data.user_data:
+                self._user_data.update(await self.persistence.get_user_data())
+            if self.persistence.store_data.chat_data:
+                self._chat_data.update(await self.persistence.get_chat_data())
         if self.persistence.store_data.bot_data:
-            self.bot_data = await self.persistence.get_bot_data()
-            if not isinstance(self.bot_data, self.context_types.bot_data):
+            self._bot_data = await self.persistence.get_bot_data()
+            if not isinstance(self._bot_data, self.context_types.bot_data):
                 raise ValueError(
                     f"bot_data must be of type {self.context_types.bot_data.__name__}"
                 )
@@ -597,6 +671,44 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                     persistent_data
                 )
 
+    def _data_caches(
+        self,
+    ) -> Iterator[Tuple[str, DataCache[Any], Callable[[int], Awaitable[Any]]]]:
+        """Yields the kinds of lazily loaded data that are stored by the persistence, together
+        with their caches and the methods loading a single entry.
+        """
+        if not (self._lazy_data_loading and self.persistence):
+            return
+        if self.persistence.store_data.chat_data:
+            yield (
+                "chat_data",
+                self._chat_data,  # type: ignore[misc]
+                self.persistence.load_chat_data,
+            )
+        if self.persistence.store_data.user_data:
+            yield (
+                "user_data",
+                self._user_data,  # type: ignore[misc]
+                self.persistence.load_user_data,
+            )
+
+    async def _load_data(
+        self, context: CCT, chat_id: Optional[int], user_id: Optional[int]
+    ) -> None:
+        """Loads the ``chat_data`` and ``user_data`` for the context from the persistence, if
+        lazy loading is used. If entries are evicted from the cache, these are kept until the
+        context is garbage collected.
+        """
+        evicts = self._data_cache_size is not None or self._data_idle_timeout is not None
+        for kind, cache, loader in self._data_caches():
+            key = chat_id if kind == "chat_data" else user_id
+            if key is None:
+                continue
+            await cache.load(key, loader)
+            if evicts:
+                cache.acquire(key)
+                weakref.finalize(context, cache.release, key)
+
     async def start(self) -> None:
         """Starts
 
@@ -1293,7 +1405,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         context = None
         any_blocking = False  # Flag which is set to True if any handler specifies block=True
 
-        for handlers in self.handlers.values():
+        for handlers in self._get_handler_groups(update):
             try:
                 for handler in handlers:
                     check = handler.check_update(update)  # Should the handler handle this update?
@@ -1417,6 +1529,19 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
 
         self.handlers[group].append(handler)
 
+        if self._handler_index is not None:
+            update_types = handler.UPDATE_TYPES
+            for update_type, groups in self._handler_index.items():
+                if update_types is not None and update_type not in update_types:
+                    continue
+                if group not in groups:
+                    # Assign a new dict instead of editing in place, as `process_update` may
+                    # currently be iterating over the old one
+                    groups = self._handler_index[update_type] = dict(
+                        sorted({**groups, group: []}.items())
+                    )
+                groups[group].append(handler)
+
     def add_handlers(
         self,
         handlers: Union[
@@ -1483,6 +1608,27 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             if not self.handlers[group]:
                 del self.handlers[group]
 
+            if self._handler_index is not None:
+                for update_type, groups in self._handler_index.items():
+                    if handler in groups.get(group, ()):
+                        groups[group].remove(handler)
+                        if not groups[group]:
+                            self._handler_index[update_type] = {
+                                key: value for key, value in groups.items() if key != group
+                            }
+
+    def _get_handler_groups(self, update: object) -> Iterable[List[BaseHandler[Any, CCT]]]:
+        """Returns the handlers of all groups in order of priority. If the handler index is
+        enabled, only the handlers that can possibly handle :paramref:`update` are included.
+        """
+        if self._handler_index is None or not isinstance(update, Update):
+            return self.handlers.values()
+
+        update_type = get_update_type(update)
+        if update_type is None:
+            return self.handlers.values()
+        return self._handler_index[update_type].values()
+
     def drop_chat_data(self, chat_id: int) -> None:
         """Drops the corresponding entry from the :attr:`chat_data`. Will also be deleted from
         the persistence on the next run of :meth:`update_persistence`, if applicable.
@@ -1604,10 +1750,13 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                 self._user_ids_to_be_updated_in_persistence.add(job.user_id)
 
     def mark_data_for_update_persistence(
-        self, chat_ids: Optional[SCT[int]] = None, user_ids: Optional[SCT[int]] = None
+        self,
+        chat_ids: Optional[SCT[int]] = None,
+        user_ids: Optional[SCT[int]] = None,
+        bot_data: bool = False,
     ) -> None:
-        """Mark entries of :attr:`chat_data` and :attr:`user_data` to be updated on the next
-        run of :meth:`update_persistence`.
+        """Mark entries of :attr:`chat_data` and :attr:`user_data` or :attr:`bot_data` to be
+        updated on the next run of :meth:`update_persistence`.
 
         Tip:
             Use this method sparingly. If you have to use this method, it likely means that you
@@ -1620,6 +1769,12 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         Args:
             chat_ids (:obj:`int` | Collection[:obj:`int`], optional): Chat IDs to mark.
             user_ids (:obj:`int` | Collection[:obj:`int`], optional): User IDs to mark.
+            bot_data (:obj:`bool`, optional): Whether to mark :attr:`bot_data`. This is only
+                needed if :attr:`bot_data` is modified through a reference that was obtained
+                before the last run of :meth:`update_persistence`, since any access of
+                :attr:`bot_data` marks it anyway. Defaults to :obj:`False`.
+
+                .. versionadded:: NEXT.VERSION
 
         """
         if chat_ids:
@@ -1632,6 +1787,8 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                 self._user_ids_to_be_updated_in_persistence.add(user_ids)
             else:
                 self._user_ids_to_be_updated_in_persistence.update(user_ids)
+        if bot_data:
+            self._bot_data_to_be_updated_in_persistence = True
 
     async def _persistence_updater(self) -> None:
         # Update the persistence in regular intervals. Exit only when the stop event has been set
@@ -1669,8 +1826,13 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             no need to call it manually.
 
         Note:
-            Any data is deep copied with :func:`copy.deepcopy` before handing it over to the
-            persistence in order to avoid race conditions, so all persisted data must be copyable.
+            Any data is deep copied before handing it over to the persistence in order to avoid
+            race conditions, so all persisted data must be copyable with :func:`copy.deepcopy`.
+            Builtin containers and immutable values are copied without the overhead of
+            :func:`copy.deepcopy`.
+
+            .. versionchanged:: NEXT.VERSION
+                Builtin containers are no longer copied with :func:`copy.deepcopy` itself.
 
         .. seealso:: :attr:`telegram.ext.BasePersistence.update_interval`,
             :meth:`mark_data_for_update_persistence`
@@ -1685,6 +1847,9 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         _LOGGER.debug("Starting next run of updating the persistence.")
 
         coroutines: Set[Coroutine] = set()
+        # ids of the lazily loaded data written in this run, by kind of data
+        written_ids: Dict[str, Tuple[Set[int], Set[int]]] = {}
+        postponed_ids = await self.__load_marked_data()
 
         # Mypy doesn't know that persistence.set_bot (see above) already checks that
         # self.bot is an instance of ExtBot if callback_data should be stored ...
@@ -1693,14 +1858,18 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         ):
             coroutines.add(
                 self.persistence.update_callback_data(
-                    deepcopy(
+                    snapshot(
                         self.bot.callback_data_cache.persistence_data  # type: ignore[attr-defined]
                     )
                 )
             )
 
-        if self.persistence.store_data.bot_data:
-            coroutines.add(self.persistence.update_bot_data(deepcopy(self.bot_data)))
+        if (
+            self.persistence.store_data.bot_data
+            and self._bot_data_to_be_updated_in_persistence
+        ):
+            self._bot_data_to_be_updated_in_persistence = False
+            coroutines.add(self.__update_bot_data(snapshot(self._bot_data)))
 
         if self.persistence.store_data.chat_data:
             update_ids = self._chat_ids_to_be_updated_in_persistence
@@ -1710,10 +1879,12 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
 
             # We don't want to update any data that has been deleted!
             update_ids -= delete_ids
+            update_ids -= postponed_ids.get("chat_data", set())
+            written_ids["chat_data"] = (update_ids, delete_ids)
 
             for chat_id in update_ids:
                 coroutines.add(
-                    self.persistence.update_chat_data(chat_id, deepcopy(self.chat_data[chat_id]))
+                    self.persistence.update_chat_data(chat_id, snapshot(self.chat_data[chat_id]))
                 )
             for chat_id in delete_ids:
                 coroutines.add(self.persistence.drop_chat_data(chat_id))
@@ -1726,10 +1897,12 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
 
             # We don't want to update any data that has been deleted!
             update_ids -= delete_ids
+            update_ids -= postponed_ids.get("user_data", set())
+            written_ids["user_data"] = (update_ids, delete_ids)
 
             for user_id in update_ids:
                 coroutines.add(
-                    self.persistence.update_user_data(user_id, deepcopy(self.user_data[user_id]))
+                    self.persistence.update_user_data(user_id, snapshot(self.user_data[user_id]))
                 )
             for user_id in delete_ids:
                 coroutines.add(self.persistence.drop_user_data(user_id))
@@ -1787,6 +1960,68 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             )
         )
 
+        if not self._lazy_data_loading:
+            return
+        failed = any(isinstance(result, Exception) for result in results)
+        for kind, cache, _ in self._data_caches():
+            update_ids, delete_ids = self.__ids_to_be_written(kind)
+            update_ids |= postponed_ids.get(kind, set())
+            if failed:
+                # The data may not have been stored. Instead of evicting it, we write it again
+                # on the next run.
+                update_ids |= written_ids[kind][0] - delete_ids
+                delete_ids |= written_ids[kind][1]
+            elif self._data_cache_size is not None or self._data_idle_timeout is not None:
+                evicted = cache.evict(
+                    self._data_cache_size,
+                    self._data_idle_timeout,
+                    keep=update_ids | delete_ids,
+                )
+                if evicted:
+                    _LOGGER.debug("Evicted %d entries from %s.", len(evicted), kind)
+
+    def __ids_to_be_written(self, kind: str) -> Tuple[Set[int], Set[int]]:
+        if kind == "chat_data":
+            return (
+                self._chat_ids_to_be_updated_in_persistence,
+                self._chat_ids_to_be_deleted_in_persistence,
+            )
+        return (
+            self._user_ids_to_be_updated_in_persistence,
+            self._user_ids_to_be_deleted_in_persistence,
+        )
+
+    async def __update_bot_data(self, data: BD) -> None:
+        try:
+            await self.persistence.update_bot_data(data)  # type: ignore[union-attr]
+        except Exception:
+            # The bot_data may not have been stored, so it is written again on the next run
+            self._bot_data_to_be_updated_in_persistence = True
+            raise
+
+    async def __load_marked_data(self) -> Dict[str, Set[int]]:
+        """Entries that were created without loading the stored data, e.g. by accessing
+        :attr:`user_data` directly, are merged with the stored data before they overwrite it.
+
+        Returns:
+            Dict[:obj:`str`, Set[:obj:`int`]]: The ids that could not be loaded by kind of data.
+                Writing them is postponed to the next run.
+        """
+        postponed_ids: Dict[str, Set[int]] = {}
+        for kind, cache, loader in self._data_caches():
+            update_ids, _ = self.__ids_to_be_written(kind)
+            keys = list(update_ids - cache.loaded)
+            if not keys:
+                continue
+            results = await asyncio.gather(
+                *(cache.load(key, loader) for key in keys), return_exceptions=True
+            )
+            for key, result in zip(keys, results):
+                if isinstance(result, Exception):
+                    postponed_ids.setdefault(kind, set()).add(key)
+                    await self.process_error(error=result, update=None)
+        return postponed_ids
+
     def add_error_handler(
         self,
         callback: HandlerCallback[object, CCT, None],
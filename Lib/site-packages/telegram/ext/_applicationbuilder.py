@@ -43,7 +43,7 @@ from telegram.ext._application import Application
 from telegram.ext._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
 from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._extbot import ExtBot
-from telegram.ext._jobqueue import JobQueue
+from telegram.ext._jobqueue import JobQueue, SimpleJobQueue
 from telegram.ext._updater import Updater
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, UD
 from telegram.request import BaseRequest
@@ -137,9 +137,12 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_base_file_url",
         "_base_url",
         "_bot",
+        "_callback_data_max_bytes",
         "_connect_timeout",
         "_connection_pool_size",
         "_context_types",
+        "_data_cache_size",
+        "_data_idle_timeout",
         "_defaults",
         "_get_updates_connect_timeout",
         "_get_updates_connection_pool_size",
@@ -150,8 +153,10 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_get_updates_request",
         "_get_updates_socket_options",
         "_get_updates_write_timeout",
+        "_handler_index",
         "_http_version",
         "_job_queue",
+        "_lazy_data_loading",
         "_local_mode",
         "_media_write_timeout",
         "_persistence",
@@ -199,6 +204,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._private_key_password: ODVInput[bytes] = DEFAULT_NONE
         self._defaults: ODVInput[Defaults] = DEFAULT_NONE
         self._arbitrary_callback_data: Union[DefaultValue[bool], int] = DEFAULT_FALSE
+        self._callback_data_max_bytes: Optional[int] = None
         self._local_mode: DVType[bool] = DEFAULT_FALSE
         self._bot: DVInput[Bot] = DEFAULT_NONE
         self._update_queue: DVType[Queue[Union[Update, object]]] = DefaultValue(Queue())
@@ -208,7 +214,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         except RuntimeError as exc:
             if "PTB must be installed via" not in str(exc):
                 raise
-            self._job_queue = DEFAULT_NONE
+            self._job_queue = DefaultValue(SimpleJobQueue())
 
         self._persistence: ODVInput[BasePersistence] = DEFAULT_NONE
         self._context_types: DVType[ContextTypes] = DefaultValue(ContextTypes())
@@ -217,6 +223,10 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._update_processor: BaseUpdateProcessor = SimpleUpdateProcessor(
             max_concurrent_updates=1
         )
+        self._handler_index: bool = False
+        self._lazy_data_loading: bool = False
+        self._data_cache_size: Optional[int] = None
+        self._data_idle_timeout: Optional[float] = None
         self._updater: ODVInput[Updater] = DEFAULT_NONE
         self._post_init: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._post_shutdown: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
@@ -277,6 +287,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             private_key_password=DefaultValue.get_value(self._private_key_password),
             defaults=DefaultValue.get_value(self._defaults),
             arbitrary_callback_data=DefaultValue.get_value(self._arbitrary_callback_data),
+            callback_data_max_bytes=self._callback_data_max_bytes,
             request=self._build_request(get_updates=False),
             get_updates_request=self._build_request(get_updates=True),
             rate_limiter=DefaultValue.get_value(self._rate_limiter),
@@ -335,6 +346,10 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             post_init=self._post_init,
             post_shutdown=self._post_shutdown,
             post_stop=self._post_stop,
+            handler_index=self._handler_index,
+            lazy_data_loading=self._lazy_data_loading,
+            data_cache_size=self._data_cache_size,
+            data_idle_timeout=self._data_idle_timeout,
             **self._application_kwargs,  # For custom Application subclasses
         )
 
@@ -989,20 +1004,17 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         return self
 
     def arbitrary_callback_data(
-        self: BuilderType, arbitrary_callback_data: Union[bool, int]
+        self: BuilderType,
+        arbitrary_callback_data: Union[bool, int],
+        max_bytes: Optional[int] = None,
     ) -> BuilderType:
         """Specifies whether :attr:`telegram.ext.Application.bot` should allow arbitrary objects as
         callback data for :class:`telegram.InlineKeyboardButton` and how many keyboards should be
         cached in memory. If not called, only strings can be used as callback data and no data will
         be stored in memory.
 
-        Important:
-            If you want to use this feature, you must install PTB with the optional requirement
-            ``callback-data``, i.e.
-
-            .. code-block:: bash
-
-               pip install "python-telegram-bot[callback-data]"
+        .. versionchanged:: NEXT.VERSION
+            This feature no longer requires the optional requirement ``callback-data``.
 
         Examples:
             :any:`Arbitrary callback_data Bot <examples.arbitrarycallbackdatabot>`
@@ -1013,6 +1025,10 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             arbitrary_callback_data (:obj:`bool` | :obj:`int`): If :obj:`True` is passed, the
                 default cache size of ``1024`` will be used. Pass an integer to specify a different
                 cache size.
+            max_bytes (:obj:`int`, optional): Maximum number of bytes occupied by the cached
+                keyboards. See :paramref:`telegram.ext.CallbackDataCache.max_bytes`.
+
+                .. versionadded:: NEXT.VERSION
 
         Returns:
             :class:`ApplicationBuilder`: The same builder with the updated argument.
@@ -1020,6 +1036,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._bot_check("arbitrary_callback_data")
         self._updater_check("arbitrary_callback_data")
         self._arbitrary_callback_data = arbitrary_callback_data
+        self._callback_data_max_bytes = max_bytes
         return self
 
     def local_mode(self: BuilderType, local_mode: bool) -> BuilderType:
@@ -1127,6 +1144,100 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._update_processor: BaseUpdateProcessor = concurrent_updates  # type: ignore[no-redef]
         return self
 
+    def handler_index(self: BuilderType, handler_index: bool) -> BuilderType:
+        """Specifies whether :class:`telegram.ext.Application` should maintain an index from
+        update types to the handlers that can possibly handle them. If enabled,
+        :meth:`telegram.ext.Application.process_update` calls
+        :meth:`~telegram.ext.BaseHandler.check_update` only on handlers whose
+        :attr:`~telegram.ext.BaseHandler.UPDATE_TYPES` include the type of the update, e.g. a
+        :class:`~telegram.ext.CallbackQueryHandler` is never checked against a message. The
+        order and priority of groups and handlers stay exactly the same. If not called, all
+        handlers are checked.
+
+        Tip:
+            This pays off for bots with many handlers. Handlers whose
+            :attr:`~telegram.ext.BaseHandler.UPDATE_TYPES` is :obj:`None`, e.g.
+            :class:`~telegram.ext.ConversationHandler` and :class:`~telegram.ext.TypeHandler`,
+            are checked against all updates.
+
+        Note:
+            The index is maintained by :meth:`telegram.ext.Application.add_handler` and
+            :meth:`telegram.ext.Application.remove_handler`. Modifying
+            :attr:`telegram.ext.Application.handlers` directly is not reflected in the index.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            handler_index (:obj:`bool`): Whether to maintain the index.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._handler_index = handler_index
+        return self
+
+    def lazy_data_loading(
+        self: BuilderType,
+        cache_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> BuilderType:
+        """Specifies that :class:`telegram.ext.Application` should load the ``user_data`` and
+        ``chat_data`` from the persistence one id at a time, when they are first needed, instead
+        of loading all of them on :meth:`~telegram.ext.Application.initialize`. The data is
+        loaded via :meth:`telegram.ext.BasePersistence.load_user_data` and
+        :meth:`telegram.ext.BasePersistence.load_chat_data` by
+        :meth:`telegram.ext.CallbackContext.refresh_data`, i.e. before a handler callback or job
+        callback is run for the user or chat. If not called, all data is loaded on
+        initialization.
+
+        If :paramref:`cache_size` is passed, the data of at most that many users and chats,
+        respectively, is kept in memory. After each run of
+        :meth:`~telegram.ext.Application.update_persistence`, the least recently used entries
+        that are already stored are removed from
+        :attr:`~telegram.ext.Application.user_data` and
+        :attr:`~telegram.ext.Application.chat_data`. If :paramref:`idle_timeout` is passed,
+        entries that were not used for that long are removed as well, such that memory usage
+        is proportional to the number of active users and chats. Removed entries are loaded
+        again when needed. Data that is used by a :class:`~telegram.ext.CallbackContext` that
+        is still alive is never removed.
+
+        Tip:
+            This pays off for bots with many users, most of which are inactive, when using a
+            persistence that can load single entries cheaply, such as
+            :class:`telegram.ext.SQLitePersistence`.
+
+        Note:
+            :attr:`telegram.ext.Application.user_data` and
+            :attr:`telegram.ext.Application.chat_data` only contain the data of users and chats
+            that was loaded. Accessing them directly outside of a handler callback for the
+            respective user or chat creates an empty entry, which is merged with the stored data
+            before it is written to the persistence.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            cache_size (:obj:`int`, optional): The maximum number of entries of
+                :attr:`~telegram.ext.Application.user_data` and
+                :attr:`~telegram.ext.Application.chat_data` each to keep in memory. Defaults to
+                :obj:`None`, i.e. the number of entries is not limited.
+            idle_timeout (:obj:`int` | :obj:`float`, optional): Time (in seconds) after which
+                entries that were not used are removed from memory. As entries are removed after
+                updating the persistence, they may be kept in memory for up to
+                :attr:`telegram.ext.BasePersistence.update_interval` seconds longer. Defaults to
+                :obj:`None`, i.e. entries are not removed because of idleness.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("`cache_size` must not be negative.")
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError("`idle_timeout` must not be negative.")
+        self._lazy_data_loading = True
+        self._data_cache_size = cache_size
+        self._data_idle_timeout = idle_timeout
+        return self
+
     def job_queue(
         self: "ApplicationBuilder[BT, CCT, UD, CD, BD, JQ]",
         job_queue: InJQ,
@@ -1134,6 +1245,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         """Sets a :class:`telegram.ext.JobQueue` instance for
         :attr:`telegram.ext.Application.job_queue`. If not called, a job queue will be
         instantiated if the requirements of :class:`telegram.ext.JobQueue` are installed.
+        Otherwise, a :class:`telegram.ext.SimpleJobQueue` will be instantiated.
+
+        .. versionchanged:: NEXT.VERSION
+            Falls back to :class:`telegram.ext.SimpleJobQueue` instead of using no job queue, if
+            the requirements of :class:`telegram.ext.JobQueue` are not installed.
 
         Examples:
             :any:`Timer Bot <examples.timerbot>`
@@ -1146,9 +1262,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             * The job queue will be automatically started and stopped by
               :meth:`telegram.ext.Application.start` and :meth:`telegram.ext.Application.stop`,
               respectively.
-            * When passing :obj:`None` or when the requirements of :class:`telegram.ext.JobQueue`
-              are not installed, :attr:`telegram.ext.ConversationHandler.conversation_timeout`
-              can not be used, as this uses :attr:`telegram.ext.Application.job_queue` internally.
+            * When passing :obj:`None`,
+              :attr:`telegram.ext.ConversationHandler.conversation_timeout` can not be used, as
+              this uses :attr:`telegram.ext.Application.job_queue` internally.
 
         Args:
             job_queue (:class:`telegram.ext.JobQueue`): The job queue. Pass :obj:`None` if you
@@ -405,6 +405,50 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
                 The ``chat_data`` of a single chat.
         """
 
+    async def load_user_data(self, user_id: int) -> Optional[UD]:
+        """Will be called by the :class:`telegram.ext.Application` if
+        :meth:`~telegram.ext.ApplicationBuilder.lazy_data_loading` is used, before the
+        ``user_data`` of a user is passed to a callback for the first time. It should return the
+        stored ``user_data`` of this user or :obj:`None`, if none was stored.
+
+        Must be overridden, if lazy loading is used and :attr:`PersistenceInput.user_data` is
+        :obj:`True`. :meth:`get_user_data` is not called in that case.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            user_id (:obj:`int`): The user ID to load the ``user_data`` of.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.user_data` | :obj:`None`: The
+                restored user data.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support loading data lazily."
+        )
+
+    async def load_chat_data(self, chat_id: int) -> Optional[CD]:
+        """Will be called by the :class:`telegram.ext.Application` if
+        :meth:`~telegram.ext.ApplicationBuilder.lazy_data_loading` is used, before the
+        ``chat_data`` of a chat is passed to a callback for the first time. It should return the
+        stored ``chat_data`` of this chat or :obj:`None`, if none was stored.
+
+        Must be overridden, if lazy loading is used and :attr:`PersistenceInput.chat_data` is
+        :obj:`True`. :meth:`get_chat_data` is not called in that case.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            chat_id (:obj:`int`): The chat ID to load the ``chat_data`` of.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.chat_data` | :obj:`None`: The
+                restored chat data.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support loading data lazily."
+        )
+
     @abstractmethod
     async def refresh_bot_data(self, bot_data: BD) -> None:
         """Will be called by the :class:`telegram.ext.Application` before passing the
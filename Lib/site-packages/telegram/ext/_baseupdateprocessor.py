@@ -17,10 +17,25 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the BaseProcessor class."""
+import asyncio
+import sys
 from abc import ABC, abstractmethod
 from asyncio import BoundedSemaphore
 from types import TracebackType
-from typing import Any, AsyncContextManager, Awaitable, Optional, Type, TypeVar, final
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    final,
+)
+
+from telegram._update import Update
 
 _BUPT = TypeVar("_BUPT", bound="BaseUpdateProcessor")
 
@@ -182,3 +197,159 @@ class SimpleUpdateProcessor(BaseUpdateProcessor):
 
     async def shutdown(self) -> None:
         """Does nothing."""
+
+
+class ShardedUpdateProcessor(BaseUpdateProcessor):
+    """Instance of :class:`telegram.ext.BaseUpdateProcessor` that processes updates of different
+    chats concurrently while keeping the updates of each chat strictly in order.
+
+    Every update is assigned to one of :attr:`shard_count` worker queues by hashing the id of
+    :attr:`telegram.Update.effective_chat` or, if there is none,
+    :attr:`telegram.Update.effective_user`. Each worker processes its queue one update at a time,
+    so all updates of one chat are handled in the order they were received. This is e.g. what
+    :class:`telegram.ext.ConversationHandler` needs to be correct under concurrency. Updates
+    without chat and user and objects that are not a :class:`telegram.Update` are processed
+    right away without any ordering guarantees.
+
+    Note:
+        While waiting for their worker, updates count towards :attr:`max_concurrent_updates`.
+        Choose :paramref:`max_concurrent_updates` larger than :paramref:`shard_count` if single
+        chats may send bursts of updates.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_concurrent_updates (:obj:`int`): The maximum number of updates to be processed
+            concurrently, including those waiting for their worker.
+        shard_count (:obj:`int`, optional): The number of worker queues, i.e. the maximum number
+            of chats whose updates are processed in parallel. Defaults to
+            :paramref:`max_concurrent_updates`.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrent_updates` or :paramref:`shard_count` is a
+            non-positive integer.
+    """
+
+    __slots__ = ("_queues", "_shard_count", "_workers")
+
+    def __init__(self, max_concurrent_updates: int, shard_count: Optional[int] = None):
+        super().__init__(max_concurrent_updates)
+        self._shard_count: int = (
+            shard_count if shard_count is not None else max_concurrent_updates
+        )
+        if self._shard_count < 1:
+            raise ValueError("`shard_count` must be a positive integer!")
+        self._queues: List[asyncio.Queue[Tuple[Awaitable[Any], asyncio.Future]]] = []
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def shard_count(self) -> int:
+        """:obj:`int`: The number of worker queues."""
+        return self._shard_count
+
+    @staticmethod
+    def get_shard_key(update: object) -> Optional[Hashable]:
+        """Returns the key that decides which worker processes the update. Updates with the same
+        key are processed in the order they were passed to :meth:`do_process_update`.
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+
+        Returns:
+            :obj:`int` | :obj:`None`: The id of the effective chat or user of the update, or
+            :obj:`None` if the update should be processed right away.
+        """
+        if not isinstance(update, Update):
+            return None
+        if update.effective_chat:
+            return update.effective_chat.id
+        if update.effective_user:
+            return update.effective_user.id
+        return None
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: "Awaitable[Any]",
+    ) -> None:
+        """Puts the coroutine into the queue of the worker responsible for the update and waits
+        until the worker has awaited it.
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+            coroutine (:term:`Awaitable`): The coroutine that will be awaited to process the
+                update.
+
+        Raises:
+            :exc:`RuntimeError`: If the processor was not initialized.
+        """
+        key = self.get_shard_key(update)
+        if key is None:
+            await coroutine
+            return
+        if not self._workers:
+            raise RuntimeError("This ShardedUpdateProcessor was not initialized!")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues[hash(key) % self._shard_count].put_nowait((coroutine, future))
+        await future
+
+    async def _worker(self, queue: "asyncio.Queue[Tuple[Awaitable[Any], asyncio.Future]]") -> None:
+        while True:
+            coroutine, future = await queue.get()
+            if future.cancelled():
+                _close(coroutine)
+                continue
+            try:
+                await coroutine
+            except BaseException as exc:
+                if not future.done():
+                    if isinstance(exc, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(exc)
+                # Only cancelling the worker ends it. A coroutine raising CancelledError on its
+                # own must not, as all following updates of the shard would wait forever
+                if isinstance(exc, asyncio.CancelledError) and _is_cancelling():
+                    raise
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+    async def initialize(self) -> None:
+        """Starts one worker task per shard."""
+        if self._workers:
+            return
+        self._queues = [asyncio.Queue() for _ in range(self._shard_count)]
+        self._workers = [
+            asyncio.create_task(self._worker(queue), name=f"ShardedUpdateProcessor:worker:{i}")
+            for i, queue in enumerate(self._queues)
+        ]
+
+    async def shutdown(self) -> None:
+        """Stops the worker tasks. Updates that are still queued are cancelled."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for queue in self._queues:
+            while not queue.empty():
+                coroutine, future = queue.get_nowait()
+                future.cancel()
+                _close(coroutine)
+        self._queues = []
+
+
+def _is_cancelling() -> bool:
+    # Whether the current task was cancelled, as opposed to having caught a CancelledError
+    # raised by the coroutine it awaits
+    if sys.version_info >= (3, 11):
+        return asyncio.current_task().cancelling() > 0  # type: ignore[union-attr]
+    # Before Python 3.11 the two can't be told apart, so the task is assumed to be cancelled
+    return True
+
+
+def _close(coroutine: "Awaitable[Any]") -> None:
+    # Avoids "coroutine was never awaited" warnings for coroutines that won't be processed
+    if asyncio.iscoroutine(coroutine):
+        coroutine.close()
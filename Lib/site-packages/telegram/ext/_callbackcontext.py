@@ -122,6 +122,7 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
 
     __slots__ = (
         "__dict__",
+        "__weakref__",
         "_application",
         "_chat_id",
         "_user_id",
@@ -230,10 +231,21 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
         :meth:`telegram.ext.Job.run`.
 
         .. versionadded:: 13.6
+
+        .. versionchanged:: NEXT.VERSION
+            If :meth:`telegram.ext.ApplicationBuilder.lazy_data_loading` is used, first loads
+            :attr:`chat_data` and :attr:`user_data` from the persistence, if they were not loaded
+            yet.
         """
         if self.application.persistence:
+            await self.application._load_data(  # pylint: disable=protected-access
+                self, chat_id=self._chat_id, user_id=self._user_id
+            )
             if self.application.persistence.store_data.bot_data:
-                await self.application.persistence.refresh_bot_data(self.bot_data)
+                # Reading Application.bot_data would mark it for the next persistence update
+                await self.application.persistence.refresh_bot_data(
+                    self.application._bot_data  # pylint: disable=protected-access
+                )
             if self.application.persistence.store_data.chat_data and self._chat_id is not None:
                 await self.application.persistence.refresh_chat_data(
                     chat_id=self._chat_id,
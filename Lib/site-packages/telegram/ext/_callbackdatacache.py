@@ -17,20 +17,31 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the CallbackDataCache class."""
+import contextlib
+import itertools
+import secrets
+import string
+import sys
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, MutableMapping, Optional, Tuple, Union, cast
-from uuid import uuid4
-
-try:
-    from cachetools import LRUCache
-
-    CACHE_TOOLS_AVAILABLE = True
-except ImportError:
-    CACHE_TOOLS_AVAILABLE = False
-
-
-import contextlib
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    ItemsView,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    ValuesView,
+    cast,
+)
 
 from telegram import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message, User
 from telegram._utils.datetime import to_float_timestamp
@@ -40,6 +51,27 @@ from telegram.ext._utils.types import CDCData
 if TYPE_CHECKING:
     from telegram.ext import ExtBot
 
+_VT = TypeVar("_VT")
+# The digits of the keyboard and button ids, which are URL-safe base64 digits
+_ID_ALPHABET: Final[str] = string.ascii_uppercase + string.ascii_lowercase + string.digits + "-_"
+# Separates the keyboard id from the button id in the callback data. Not part of _ID_ALPHABET
+_ID_SEPARATOR: Final[str] = "."
+# Number of random bytes of the prefix of the keyboard ids of each cache instance
+_ID_PREFIX_BYTES: Final[int] = 6
+
+
+def _encode_id(number: int) -> str:
+    """Encodes the non-negative :paramref:`number` with the digits of :data:`_ID_ALPHABET`.
+    Numbers below 64 are encoded as single characters, which Python doesn't allocate anew.
+    """
+    if number < 64:
+        return _ID_ALPHABET[number]
+    digits = []
+    while number:
+        number, digit = divmod(number, 64)
+        digits.append(_ID_ALPHABET[digit])
+    return "".join(reversed(digits))
+
 
 class InvalidCallbackData(TelegramError):
     """
@@ -103,6 +135,98 @@ class _KeyboardData:
         """
         return self.keyboard_uuid, self.access_time, self.button_data
 
+    def getsizeof(self) -> int:
+        """Estimates the number of bytes occupied by this object, the keyboard uuid, the button
+        data dict and its keys and values. Objects referenced by the values are not included.
+        """
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.keyboard_uuid)
+            + sys.getsizeof(self.button_data)
+            + sum(map(sys.getsizeof, self.button_data))
+            + sum(map(sys.getsizeof, self.button_data.values()))
+        )
+
+
+class _LRUCache(MutableMapping[str, _VT]):
+    """Mapping that holds at most :paramref:`maxsize` entries and, if given, at most
+    :paramref:`max_bytes` bytes as estimated by :paramref:`getsizeof`. If necessary, the least
+    recently used entries are dropped, but the most recently used one is always kept.
+
+    Setting an entry or calling :meth:`touch` marks an entry as most recently used, reading it
+    does not. Iterating goes from the least to the most recently used entry. All operations
+    except for iterating take O(1) time.
+    """
+
+    __slots__ = ("_data", "_getsizeof", "_sizes", "currsize", "max_bytes", "maxsize")
+
+    def __init__(
+        self,
+        maxsize: int,
+        getsizeof: Callable[[str, _VT], int],
+        max_bytes: Optional[int] = None,
+    ):
+        self.maxsize: int = maxsize
+        self.max_bytes: Optional[int] = max_bytes
+        # the estimated number of bytes of all entries
+        self.currsize: int = 0
+        self._getsizeof: Callable[[str, _VT], int] = getsizeof
+        self._data: OrderedDict[str, _VT] = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+
+    def __getitem__(self, key: str) -> _VT:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: _VT) -> None:
+        size = self._getsizeof(key, value)
+        self.currsize += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        data = self._data
+        while len(data) > self.maxsize or (
+            self.max_bytes is not None and self.currsize > self.max_bytes and len(data) > 1
+        ):
+            self.currsize -= self._sizes.pop(data.popitem(last=False)[0])
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+        self.currsize -= self._sizes.pop(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self) -> ItemsView[str, _VT]:
+        return self._data.items()
+
+    def values(self) -> ValuesView[_VT]:
+        return self._data.values()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._sizes.clear()
+        self.currsize = 0
+
+    def touch(self, key: str) -> None:
+        """Marks :paramref:`key` as the most recently used entry."""
+        self._data.move_to_end(key)
+
+
+def _callback_query_size(callback_query_id: str, keyboard_uuid: str) -> int:
+    return sys.getsizeof(callback_query_id) + sys.getsizeof(keyboard_uuid)
+
+
+def _keyboard_data_size(_: str, keyboard_data: _KeyboardData) -> int:
+    # The key is the keyboard uuid of the keyboard data, which is counted there
+    return keyboard_data.getsizeof()
+
 
 class CallbackDataCache:
     """A custom cache for storing the callback data of a :class:`telegram.ext.ExtBot`. Internally,
@@ -113,15 +237,18 @@ class CallbackDataCache:
 
     The second mapping allows to manually drop data that has been cached for keyboards of messages
     sent via inline mode.
-    If necessary, will drop the least recently used items.
+    If necessary, will drop the least recently used items. The cached keyboards can additionally
+    be limited by their estimated size in memory, see :paramref:`max_bytes`.
 
-    Important:
-        If you want to use this class, you must install PTB with the optional requirement
-        ``callback-data``, i.e.
+    The callback data sent to Telegram consists of the ID of the keyboard, a ``"."`` and the ID of
+    the button. Keyboard IDs consist of a random prefix, which is chosen anew for each instance of
+    this class, followed by a running number. Button IDs are the index of the button within the
+    keyboard. Both numbers are encoded with the 64 URL-safe base64 digits. This keeps the callback
+    data of most buttons shorter than 16 characters.
 
-        .. code-block:: bash
-
-           pip install "python-telegram-bot[callback-data]"
+    .. versionchanged:: NEXT.VERSION
+        Uses short IDs instead of two UUIDs of 32 characters each. Data stored with UUIDs, e.g.
+        by a persistence, can still be resolved.
 
     Examples:
         :any:`Arbitrary Callback Data Bot <examples.arbitrarycallbackdatabot>`
@@ -135,6 +262,10 @@ class CallbackDataCache:
         To use this class, PTB must be installed via
         ``pip install "python-telegram-bot[callback-data]"``.
 
+    .. versionchanged:: NEXT.VERSION
+        This class no longer depends on ``cachetools``, i.e. it can be used without the optional
+        requirement ``callback-data``.
+
     Args:
         bot (:class:`telegram.ext.ExtBot`): The bot this cache is for.
         maxsize (:obj:`int`, optional): Maximum number of items in each of the internal mappings.
@@ -144,30 +275,46 @@ class CallbackDataCache:
         Dict[:obj:`str`, :class:`object`]]], Dict[:obj:`str`, :obj:`str`]], optional): \
         Data to initialize the cache with, as returned by \
         :meth:`telegram.ext.BasePersistence.get_callback_data`.
+        max_bytes (:obj:`int`, optional): Maximum number of bytes occupied by the cached
+            keyboards, as estimated by :attr:`memory_usage`. If exceeded, the least recently used
+            keyboards are dropped, except for the most recently used one. By default, only
+            :paramref:`maxsize` applies.
+
+            .. versionadded:: NEXT.VERSION
 
     Attributes:
         bot (:class:`telegram.ext.ExtBot`): The bot this cache is for.
 
     """
 
-    __slots__ = ("_callback_queries", "_keyboard_data", "_maxsize", "bot")
+    __slots__ = (
+        "_callback_queries",
+        "_keyboard_data",
+        "_keyboard_numbers",
+        "_keyboard_prefix",
+        "_maxsize",
+        "bot",
+    )
 
     def __init__(
         self,
         bot: "ExtBot[Any]",
         maxsize: int = 1024,
         persistent_data: Optional[CDCData] = None,
+        max_bytes: Optional[int] = None,
     ):
-        if not CACHE_TOOLS_AVAILABLE:
-            raise RuntimeError(
-                "To use `CallbackDataCache`, PTB must be installed via `pip install "
-                '"python-telegram-bot[callback-data]"`.'
-            )
-
         self.bot: ExtBot[Any] = bot
         self._maxsize: int = maxsize
-        self._keyboard_data: MutableMapping[str, _KeyboardData] = LRUCache(maxsize=maxsize)
-        self._callback_queries: MutableMapping[str, str] = LRUCache(maxsize=maxsize)
+        # The keyboards are ordered by their access time, which allows clear_callback_data to
+        # stop at the first keyboard that is not older than the cutoff
+        self._keyboard_data: _LRUCache[_KeyboardData] = _LRUCache(
+            maxsize, _keyboard_data_size, max_bytes
+        )
+        self._callback_queries: _LRUCache[str] = _LRUCache(maxsize, _callback_query_size)
+        # The random prefix makes sure that the callback data of keyboards sent by other instances,
+        # e.g. before a restart without persistence, is not mistaken for newer keyboards
+        self._keyboard_prefix: str = secrets.token_urlsafe(_ID_PREFIX_BYTES)
+        self._keyboard_numbers: Iterator[int] = itertools.count()
 
         if persistent_data:
             self.load_persistence_data(persistent_data)
@@ -189,10 +336,17 @@ class CallbackDataCache:
         keyboard_data, callback_queries = persistent_data
         for key, value in callback_queries.items():
             self._callback_queries[key] = value
-        for uuid, access_time, data in keyboard_data:
-            self._keyboard_data[uuid] = _KeyboardData(
-                keyboard_uuid=uuid, access_time=access_time, button_data=data
-            )
+        loaded = {
+            uuid: _KeyboardData(keyboard_uuid=uuid, access_time=access_time, button_data=data)
+            for uuid, access_time, data in keyboard_data
+        }
+        # The keyboards are kept ordered by access time, which clear_callback_data relies on, so
+        # the loaded keyboards are merged with those already in the cache
+        merged = [data for uuid, data in self._keyboard_data.items() if uuid not in loaded]
+        merged.extend(loaded.values())
+        self._keyboard_data.clear()
+        for data in sorted(merged, key=attrgetter("access_time")):
+            self._keyboard_data[data.keyboard_uuid] = data
 
     @property
     def maxsize(self) -> int:
@@ -203,6 +357,24 @@ class CallbackDataCache:
         """
         return self._maxsize
 
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """:obj:`int`: Optional. The maximum number of bytes occupied by the cached keyboards.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._keyboard_data.max_bytes
+
+    @property
+    def memory_usage(self) -> int:
+        """:obj:`int`: The estimated number of bytes occupied by the cached keyboards and callback
+        query IDs. For each keyboard, this includes the keyboard and button IDs and the button
+        data objects themselves, but not objects referenced by them.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._keyboard_data.currsize + self._callback_queries.currsize
+
     @property
     def persistence_data(self) -> CDCData:
         """Tuple[List[Tuple[:obj:`str`, :obj:`float`, Dict[:obj:`str`, :class:`object`]]],
@@ -229,7 +401,7 @@ class CallbackDataCache:
             :class:`telegram.InlineKeyboardMarkup`: The keyboard to be passed to Telegram.
 
         """
-        keyboard_uuid = uuid4().hex
+        keyboard_uuid = self.__next_keyboard_id()
         keyboard_data = _KeyboardData(keyboard_uuid)
 
         # Built a new nested list of buttons by replacing the callback data if needed
@@ -257,15 +429,22 @@ class CallbackDataCache:
         self._keyboard_data[keyboard_uuid] = keyboard_data
         return InlineKeyboardMarkup(buttons)
 
+    def __next_keyboard_id(self) -> str:
+        keyboard_id = f"{self._keyboard_prefix}{_encode_id(next(self._keyboard_numbers))}"
+        while keyboard_id in self._keyboard_data:
+            # Only possible if a loaded keyboard happens to have the same random prefix
+            keyboard_id = f"{self._keyboard_prefix}{_encode_id(next(self._keyboard_numbers))}"
+        return keyboard_id
+
     @staticmethod
     def __put_button(callback_data: object, keyboard_data: _KeyboardData) -> str:
         """Stores the data for a single button in :attr:`keyboard_data`.
         Returns the string that should be passed instead of the callback_data, which is
-        ``keyboard_uuid + button_uuids``.
+        ``keyboard_id + "." + button_id``.
         """
-        uuid = uuid4().hex
-        keyboard_data.button_data[uuid] = callback_data
-        return f"{keyboard_data.keyboard_uuid}{uuid}"
+        button_id = _encode_id(len(keyboard_data.button_data))
+        keyboard_data.button_data[button_id] = callback_data
+        return f"{keyboard_data.keyboard_uuid}{_ID_SEPARATOR}{button_id}"
 
     def __get_keyboard_uuid_and_button_data(
         self, callback_data: str
@@ -276,8 +455,9 @@ class CallbackDataCache:
             # we don't want to update in that case
             keyboard_data = self._keyboard_data[keyboard]
             button_data = keyboard_data.button_data[button]
-            # Update the timestamp for the LRU
+            # Update the timestamp and the position for the LRU
             keyboard_data.update_access_time()
+            self._keyboard_data.touch(keyboard)
         except KeyError:
             return None, InvalidCallbackData(callback_data)
         return keyboard, button_data
@@ -286,6 +466,9 @@ class CallbackDataCache:
     def extract_uuids(callback_data: str) -> Tuple[str, str]:
         """Extracts the keyboard uuid and the button uuid from the given :paramref:`callback_data`.
 
+        .. versionchanged:: NEXT.VERSION
+            Also extracts the short IDs used since this version.
+
         Args:
             callback_data (:obj:`str`): The
                 :paramref:`~telegram.InlineKeyboardButton.callback_data` as present in the button.
@@ -294,7 +477,11 @@ class CallbackDataCache:
             (:obj:`str`, :obj:`str`): Tuple of keyboard and button uuid
 
         """
-        # Extract the uuids as put in __put_button
+        # Extract the ids as put in __put_button
+        keyboard_id, separator, button_id = callback_data.partition(_ID_SEPARATOR)
+        if separator:
+            return keyboard_id, button_id
+        # callback data of keyboards cached with two uuids by earlier versions
         return callback_data[:32], callback_data[32:]
 
     def process_message(self, message: Message) -> None:
@@ -450,6 +637,9 @@ class CallbackDataCache:
     def __clear(
         self, mapping: MutableMapping, time_cutoff: Optional[Union[float, datetime]] = None
     ) -> None:
+        """Clears :paramref:`mapping`. If :paramref:`time_cutoff` is passed, the mapping must be
+        ordered by the access time of its values, such that only the entries to drop are visited.
+        """
         if not time_cutoff:
             mapping.clear()
             return
@@ -463,6 +653,10 @@ class CallbackDataCache:
 
         # We need a list instead of a generator here, as the list doesn't change it's size
         # during the iteration
-        to_drop = [key for key, data in mapping.items() if data.access_time < effective_cutoff]
+        to_drop = []
+        for key, data in mapping.items():
+            if data.access_time >= effective_cutoff:
+                break
+            to_drop.append(key)
         for key in to_drop:
             mapping.pop(key)
@@ -19,7 +19,7 @@
 """This module contains the DictPersistence class."""
 import json
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple, cast
 
 from telegram.ext import BasePersistence, PersistenceInput
 from telegram.ext._utils.types import CDCData, ConversationDict, ConversationKey
@@ -45,11 +45,19 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         * This implementation of :class:`BasePersistence` does not handle data that cannot be
           serialized by :func:`json.dumps`.
 
+        * The JSON encodings of the data of each user, chat and conversation handler are cached
+          and only renewed when the respective data changes. Hence, reading the JSON properties
+          after an update only serializes the changed parts. :meth:`iter_ndjson` exports all data
+          line by line instead of as one large string.
+
     .. seealso:: :wiki:`Making Your Bot Persistent <Making-your-bot-persistent>`
 
     .. versionchanged:: 20.0
         The parameters and attributes ``store_*_data`` were replaced by :attr:`store_data`.
 
+    .. versionchanged:: NEXT.VERSION
+        The JSON encodings are cached per user, chat and conversation handler.
+
     Args:
         store_data (:class:`~telegram.ext.PersistenceInput`, optional): Specifies which kinds of
             data will be saved by this persistence instance. By default, all available kinds of
@@ -84,10 +92,13 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         "_callback_data_json",
         "_chat_data",
         "_chat_data_json",
+        "_chat_fragments",
         "_conversations",
+        "_conversations_fragments",
         "_conversations_json",
         "_user_data",
         "_user_data_json",
+        "_user_fragments",
     )
 
     def __init__(
@@ -111,6 +122,10 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         self._bot_data_json: Optional[str] = None
         self._callback_data_json: Optional[str] = None
         self._conversations_json: Optional[str] = None
+        # JSON encodings of the single entries of the data, which are kept until the entry changes
+        self._user_fragments: Dict[int, str] = {}
+        self._chat_fragments: Dict[int, str] = {}
+        self._conversations_fragments: Dict[str, str] = {}
         if user_data_json:
             try:
                 self._user_data = self._decode_user_chat_data_from_json(user_data_json)
@@ -177,9 +192,11 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
     @property
     def user_data_json(self) -> str:
         """:obj:`str`: The user_data serialized as a JSON-string."""
-        if self._user_data_json:
-            return self._user_data_json
-        return json.dumps(self.user_data)
+        if not self._user_data_json:
+            self._user_data_json = self._encode_user_chat_data_to_json(
+                self.user_data, self._user_fragments
+            )
+        return self._user_data_json
 
     @property
     def chat_data(self) -> Optional[Dict[int, Dict[Any, Any]]]:
@@ -189,9 +206,11 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
     @property
     def chat_data_json(self) -> str:
         """:obj:`str`: The chat_data serialized as a JSON-string."""
-        if self._chat_data_json:
-            return self._chat_data_json
-        return json.dumps(self.chat_data)
+        if not self._chat_data_json:
+            self._chat_data_json = self._encode_user_chat_data_to_json(
+                self.chat_data, self._chat_fragments
+            )
+        return self._chat_data_json
 
     @property
     def bot_data(self) -> Optional[Dict[Any, Any]]:
@@ -201,9 +220,9 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
     @property
     def bot_data_json(self) -> str:
         """:obj:`str`: The bot_data serialized as a JSON-string."""
-        if self._bot_data_json:
-            return self._bot_data_json
-        return json.dumps(self.bot_data)
+        if not self._bot_data_json:
+            self._bot_data_json = json.dumps(self.bot_data)
+        return self._bot_data_json
 
     @property
     def callback_data(self) -> Optional[CDCData]:
@@ -220,9 +239,9 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
 
         .. versionadded:: 13.6
         """
-        if self._callback_data_json:
-            return self._callback_data_json
-        return json.dumps(self.callback_data)
+        if not self._callback_data_json:
+            self._callback_data_json = json.dumps(self.callback_data)
+        return self._callback_data_json
 
     @property
     def conversations(self) -> Optional[Dict[str, ConversationDict]]:
@@ -232,11 +251,53 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
     @property
     def conversations_json(self) -> str:
         """:obj:`str`: The conversations serialized as a JSON-string."""
-        if self._conversations_json:
-            return self._conversations_json
-        if self.conversations:
-            return self._encode_conversations_to_json(self.conversations)
-        return json.dumps(self.conversations)
+        if not self._conversations_json:
+            if self.conversations:
+                self._conversations_json = self._join_fragments(
+                    self._conversations_fragments_items()
+                )
+            else:
+                self._conversations_json = json.dumps(self.conversations)
+        return self._conversations_json
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """Exports the stored data as
+        `newline delimited JSON <https://github.com/ndjson/ndjson-spec>`_, such that the data of a
+        large bot can be written or sent incrementally, e.g. with
+        ``file.writelines(persistence.iter_ndjson())``.
+
+        Each line is a JSON object with the key ``"kind"``, which is one of ``"user_data"``,
+        ``"chat_data"``, ``"bot_data"``, ``"callback_data"`` and ``"conversations"``, and the key
+        ``"data"``. Lines of ``"user_data"`` and ``"chat_data"`` hold the data of a single user or
+        chat and its ``"id"``. Lines of ``"conversations"`` hold the states of a single
+        conversation handler and its ``"name"``, with the keys encoded like in
+        :attr:`conversations_json`. Kinds of data that were never set or loaded are skipped.
+
+        Just like the JSON properties, this reuses the cached JSON encodings of unchanged entries.
+
+        .. versionadded:: NEXT.VERSION
+
+        Yields:
+            :obj:`str`: The lines, each terminated by ``"\\n"``.
+        """
+        for kind, data, fragments in (
+            ("user_data", self.user_data, self._user_fragments),
+            ("chat_data", self.chat_data, self._chat_fragments),
+        ):
+            if data is None:
+                continue
+            for entry_id, fragment in self._fragments_items(data, fragments):
+                yield f'{{"kind": "{kind}", "id": {json.dumps(entry_id)}, "data": {fragment}}}\n'
+        if self.bot_data is not None:
+            yield f'{{"kind": "bot_data", "data": {self.bot_data_json}}}\n'
+        if self.callback_data is not None:
+            yield f'{{"kind": "callback_data", "data": {self.callback_data_json}}}\n'
+        if self.conversations is not None:
+            for name, fragment in self._conversations_fragments_items():
+                yield (
+                    f'{{"kind": "conversations", "name": {json.dumps(name)}, '
+                    f'"data": {fragment}}}\n'
+                )
 
     async def get_user_data(self) -> Dict[int, Dict[object, object]]:
         """Returns the user_data created from the ``user_data_json`` or an empty :obj:`dict`.
@@ -309,6 +370,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         if self._conversations.setdefault(name, {}).get(key) == new_state:
             return
         self._conversations[name][key] = new_state
+        self._conversations_fragments.pop(name, None)
         self._conversations_json = None
 
     async def update_user_data(self, user_id: int, data: Dict[Any, Any]) -> None:
@@ -323,6 +385,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         if self._user_data.get(user_id) == data:
             return
         self._user_data[user_id] = data
+        self._user_fragments.pop(user_id, None)
         self._user_data_json = None
 
     async def update_chat_data(self, chat_id: int, data: Dict[Any, Any]) -> None:
@@ -337,6 +400,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         if self._chat_data.get(chat_id) == data:
             return
         self._chat_data[chat_id] = data
+        self._chat_fragments.pop(chat_id, None)
         self._chat_data_json = None
 
     async def update_bot_data(self, data: Dict[Any, Any]) -> None:
@@ -376,6 +440,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         if self._chat_data is None:
             return
         self._chat_data.pop(chat_id, None)
+        self._chat_fragments.pop(chat_id, None)
         self._chat_data_json = None
 
     async def drop_user_data(self, user_id: int) -> None:
@@ -389,6 +454,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         if self._user_data is None:
             return
         self._user_data.pop(user_id, None)
+        self._user_fragments.pop(user_id, None)
         self._user_data_json = None
 
     async def refresh_user_data(self, user_id: int, user_data: Dict[Any, Any]) -> None:
@@ -405,6 +471,28 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_chat_data`
         """
 
+    async def load_user_data(self, user_id: int) -> Optional[Dict[object, object]]:
+        """Returns the user_data of a single user created from the ``user_data_json``, if it
+        contains the user.
+
+        .. versionadded:: NEXT.VERSION
+        .. seealso:: :meth:`telegram.ext.BasePersistence.load_user_data`
+        """
+        if self.user_data is None:
+            return None
+        return deepcopy(self.user_data.get(user_id))
+
+    async def load_chat_data(self, chat_id: int) -> Optional[Dict[object, object]]:
+        """Returns the chat_data of a single chat created from the ``chat_data_json``, if it
+        contains the chat.
+
+        .. versionadded:: NEXT.VERSION
+        .. seealso:: :meth:`telegram.ext.BasePersistence.load_chat_data`
+        """
+        if self.chat_data is None:
+            return None
+        return deepcopy(self.chat_data.get(chat_id))
+
     async def refresh_bot_data(self, bot_data: Dict[Any, Any]) -> None:
         """Does nothing.
 
@@ -419,6 +507,53 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         .. seealso:: :meth:`telegram.ext.BasePersistence.flush`
         """
 
+    @staticmethod
+    def _fragments_items(
+        data: Dict[Any, Any], fragments: Dict[Any, str]
+    ) -> Iterator[Tuple[Any, str]]:
+        """Helper method that yields the keys of :paramref:`data` along with the JSON encodings
+        of their values. Encodings missing in :paramref:`fragments` are created and added.
+        """
+        for key, value in data.items():
+            fragment = fragments.get(key)
+            if fragment is None:
+                fragment = fragments[key] = json.dumps(value)
+            yield key, fragment
+
+    @staticmethod
+    def _join_fragments(items: Iterator[Tuple[Any, str]]) -> str:
+        """Helper method to join the JSON encodings of the values of a dict to the JSON encoding
+        of the dict. The result is the same as calling :func:`json.dumps` on the dict.
+        """
+        # The ids of users and chats don't need escaping
+        joined = ", ".join(
+            f'"{key}": {fragment}' if type(key) is int else f"{json.dumps(key)}: {fragment}"
+            for key, fragment in items
+        )
+        return f"{{{joined}}}"
+
+    def _encode_user_chat_data_to_json(
+        self, data: Optional[Dict[int, Dict[Any, Any]]], fragments: Dict[int, str]
+    ) -> str:
+        """Helper method to encode chat or user data to JSON, reusing and filling the cached
+        encodings of the single entries in :paramref:`fragments`.
+        """
+        if data is None:
+            return json.dumps(data)
+        return self._join_fragments(self._fragments_items(data, fragments))
+
+    def _conversations_fragments_items(self) -> Iterator[Tuple[str, str]]:
+        """Helper method that yields the names of the conversation handlers along with the
+        JSON encodings of their states, as created by :meth:`_encode_conversations_to_json`.
+        """
+        for name, states in (self.conversations or {}).items():
+            fragment = self._conversations_fragments.get(name)
+            if fragment is None:
+                fragment = self._conversations_fragments[name] = json.dumps(
+                    {json.dumps(key): state for key, state in states.items()}
+                )
+            yield name, fragment
+
     @staticmethod
     def _encode_conversations_to_json(conversations: Dict[str, ConversationDict]) -> str:
         """Helper method to encode a conversations dict (that uses tuples as keys) to a
@@ -171,6 +171,11 @@ class ExtBot(Bot, Generic[RLARGS]):
             limiting the number of requests made by the bot per time interval.
 
             .. versionadded:: 20.0
+        callback_data_max_bytes (:obj:`int`, optional): Maximum number of bytes occupied by the
+            keyboards cached for :paramref:`arbitrary_callback_data`. See
+            :paramref:`telegram.ext.CallbackDataCache.max_bytes`.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
@@ -194,6 +199,7 @@ class ExtBot(Bot, Generic[RLARGS]):
         defaults: Optional["Defaults"] = None,
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
+        callback_data_max_bytes: Optional[int] = None,
     ): ...
 
     @overload
@@ -210,6 +216,7 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        callback_data_max_bytes: Optional[int] = None,
     ): ...
 
     def __init__(
@@ -225,6 +232,7 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        callback_data_max_bytes: Optional[int] = None,
     ):
         super().__init__(
             token=token,
@@ -250,7 +258,9 @@ class ExtBot(Bot, Generic[RLARGS]):
             else:
                 maxsize = 1024
 
-            self._callback_data_cache = CallbackDataCache(bot=self, maxsize=maxsize)
+            self._callback_data_cache = CallbackDataCache(
+                bot=self, maxsize=maxsize, max_bytes=callback_data_max_bytes
+            )
 
     def __repr__(self) -> str:
         """Give a string representation of the bot in the form ``ExtBot[token=...]``.
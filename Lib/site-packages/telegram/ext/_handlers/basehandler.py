@@ -18,11 +18,12 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the base class for handlers as used by the Application."""
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, ClassVar, FrozenSet, Generic, Optional, TypeVar, Union
 
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
@@ -31,6 +32,18 @@ if TYPE_CHECKING:
 RT = TypeVar("RT")
 UT = TypeVar("UT")
 
+# The update types that contain a message which is considered by filters
+MESSAGE_UPDATE_TYPES: FrozenSet[str] = frozenset(
+    {
+        UpdateType.MESSAGE,
+        UpdateType.EDITED_MESSAGE,
+        UpdateType.CHANNEL_POST,
+        UpdateType.EDITED_CHANNEL_POST,
+        UpdateType.BUSINESS_MESSAGE,
+        UpdateType.EDITED_BUSINESS_MESSAGE,
+    }
+)
+
 
 class BaseHandler(Generic[UT, CCT], ABC):
     """The base class for all update handlers. Create custom handlers by inheriting from it.
@@ -88,6 +101,21 @@ class BaseHandler(Generic[UT, CCT], ABC):
         "callback",
     )
 
+    UPDATE_TYPES: ClassVar[Optional[FrozenSet[str]]] = None
+    """FrozenSet[:obj:`str`] | :obj:`None`: The types of :class:`telegram.Update` (see
+    :attr:`telegram.Update.ALL_TYPES`) that :meth:`check_update` can accept at all, or :obj:`None`
+    if this can't be known in advance. Used by :class:`telegram.ext.Application` to skip handlers
+    that can never match an update, if
+    :meth:`~telegram.ext.ApplicationBuilder.handler_index` is enabled.
+
+    Tip:
+        Custom handlers may set this to enable the skipping. Subclasses that override
+        :meth:`check_update` such that it accepts other types of updates must adjust it
+        accordingly.
+
+    .. versionadded:: NEXT.VERSION
+    """
+
     def __init__(
         self,
         callback: HandlerCallback[UT, CCT, RT],
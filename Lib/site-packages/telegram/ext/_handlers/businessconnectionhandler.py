@@ -22,6 +22,7 @@ from typing import Optional, TypeVar
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -64,6 +65,8 @@ class BusinessConnectionHandler(BaseHandler[Update, CCT]):
         "_usernames",
     )
 
+    UPDATE_TYPES = frozenset({UpdateType.BUSINESS_CONNECTION})
+
     def __init__(
         self,
         callback: HandlerCallback[Update, CCT, RT],
@@ -24,6 +24,7 @@ from typing import TYPE_CHECKING, Any, Callable, Match, Optional, Pattern, TypeV
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
@@ -124,6 +125,8 @@ class CallbackQueryHandler(BaseHandler[Update, CCT]):
 
     __slots__ = ("game_pattern", "pattern")
 
+    UPDATE_TYPES = frozenset({UpdateType.CALLBACK_QUERY})
+
     def __init__(
         self,
         callback: HandlerCallback[Update, CCT, RT],
@@ -21,6 +21,7 @@
 from typing import Final, Optional
 
 from telegram import Update
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -75,6 +76,8 @@ class ChatBoostHandler(BaseHandler[Update, CCT]):
         "chat_boost_types",
     )
 
+    UPDATE_TYPES = frozenset({UpdateType.CHAT_BOOST, UpdateType.REMOVED_CHAT_BOOST})
+
     CHAT_BOOST: Final[int] = -1
     """ :obj:`int`: Used as a constant to handle only :attr:`telegram.Update.chat_boost`."""
     REMOVED_CHAT_BOOST: Final[int] = 0
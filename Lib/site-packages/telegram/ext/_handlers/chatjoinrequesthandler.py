@@ -23,6 +23,7 @@ from typing import Optional
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import RT, SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -80,6 +81,8 @@ class ChatJoinRequestHandler(BaseHandler[Update, CCT]):
         "_usernames",
     )
 
+    UPDATE_TYPES = frozenset({UpdateType.CHAT_JOIN_REQUEST})
+
     def __init__(
         self,
         callback: HandlerCallback[Update, CCT, RT],
@@ -22,6 +22,7 @@ from typing import Final, Optional, TypeVar
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -78,6 +79,8 @@ class ChatMemberHandler(BaseHandler[Update, CCT]):
         "_chat_ids",
         "chat_member_types",
     )
+
+    UPDATE_TYPES = frozenset({UpdateType.MY_CHAT_MEMBER, UpdateType.CHAT_MEMBER})
     MY_CHAT_MEMBER: Final[int] = -1
     """:obj:`int`: Used as a constant to handle only :attr:`telegram.Update.my_chat_member`."""
     CHAT_MEMBER: Final[int] = 0
@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING, Any, Match, Optional, Pattern, TypeVar, Union,
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
@@ -75,6 +76,8 @@ class ChosenInlineResultHandler(BaseHandler[Update, CCT]):
 
     __slots__ = ("pattern",)
 
+    UPDATE_TYPES = frozenset({UpdateType.CHOSEN_INLINE_RESULT})
+
     def __init__(
         self,
         callback: HandlerCallback[Update, CCT, RT],
@@ -18,13 +18,14 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the CommandHandler class."""
 import re
-from typing import TYPE_CHECKING, Any, FrozenSet, List, Optional, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Any, FrozenSet, List, Optional, Tuple, TypeVar, Union, cast
 
-from telegram import MessageEntity, Update
+from telegram import Message, MessageEntity, Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext import filters as filters_module
-from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._handlers.basehandler import MESSAGE_UPDATE_TYPES, BaseHandler
 from telegram.ext._utils.types import CCT, FilterDataDict, HandlerCallback
 
 if TYPE_CHECKING:
@@ -32,6 +33,34 @@ if TYPE_CHECKING:
 
 RT = TypeVar("RT")
 
+_ParsedCommand = Tuple[str, Optional[str], List[str]]
+
+
+def parse_command(message: Message) -> Optional[_ParsedCommand]:
+    """Parses the bot command at the start of the message, if any.
+
+    Args:
+        message (:class:`telegram.Message`): The message.
+
+    Returns:
+        Tuple[:obj:`str`, :obj:`str` | :obj:`None`, List[:obj:`str`]] | :obj:`None`: The lower
+        case command without ``/``, the lower case bot username after ``@`` (if given) and the
+        arguments of the command. :obj:`None`, if the message doesn't start with a bot command.
+    """
+    if (
+        message.entities
+        and message.entities[0].type == MessageEntity.BOT_COMMAND
+        and message.entities[0].offset == 0
+        and message.text
+    ):
+        command_parts = message.text[1 : message.entities[0].length].split("@")
+        return (
+            command_parts[0].lower(),
+            command_parts[1].lower() if len(command_parts) > 1 else None,
+            message.text.split()[1:],
+        )
+    return None
+
 
 class CommandHandler(BaseHandler[Update, CCT]):
     """Handler class to handle Telegram commands.
@@ -117,6 +146,8 @@ class CommandHandler(BaseHandler[Update, CCT]):
 
     __slots__ = ("commands", "filters", "has_args")
 
+    UPDATE_TYPES = MESSAGE_UPDATE_TYPES | {UpdateType.CALLBACK_QUERY}
+
     def __init__(
         self,
         command: SCT[str],
@@ -172,35 +203,36 @@ class CommandHandler(BaseHandler[Update, CCT]):
 
         """
         if isinstance(update, Update) and update.effective_message:
-            message = update.effective_message
-
-            if (
-                message.entities
-                and message.entities[0].type == MessageEntity.BOT_COMMAND
-                and message.entities[0].offset == 0
-                and message.text
-                and message.get_bot()
-            ):
-                command = message.text[1 : message.entities[0].length]
-                args = message.text.split()[1:]
-                command_parts = command.split("@")
-                command_parts.append(message.get_bot().username)
-
-                if not (
-                    command_parts[0].lower() in self.commands
-                    and command_parts[1].lower() == message.get_bot().username.lower()
-                ):
-                    return None
-
-                if not self._check_correct_args(args):
-                    return None
-
-                filter_result = self.filters.check_update(update)
-                if filter_result:
-                    return args, filter_result
-                return False
+            parsed_command = parse_command(update.effective_message)
+            if parsed_command:
+                return self._check_parsed_command(update, parsed_command)
         return None
 
+    def _check_parsed_command(
+        self, update: Update, parsed_command: _ParsedCommand
+    ) -> Optional[Union[bool, Tuple[List[str], Optional[Union[bool, FilterDataDict]]]]]:
+        """Does the checks of :meth:`check_update` for the result of :func:`parse_command`, which
+        lets :class:`telegram.ext.CommandRouter` parse the command only once for all handlers.
+        """
+        message = cast(Message, update.effective_message)
+        if not message.get_bot():
+            return None
+        command, username, args = parsed_command
+
+        if not (
+            command in self.commands
+            and (username is None or username == message.get_bot().username.lower())
+        ):
+            return None
+
+        if not self._check_correct_args(args):
+            return None
+
+        filter_result = self.filters.check_update(update)
+        if filter_result:
+            return args, filter_result
+        return False
+
     def collect_additional_context(
         self,
         context: CCT,
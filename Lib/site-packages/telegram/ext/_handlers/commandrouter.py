@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the CommandRouter class."""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from telegram import Update
+from telegram._utils.defaultvalue import DEFAULT_TRUE
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.types import DVType
+from telegram.constants import UpdateType
+from telegram.ext._handlers.basehandler import MESSAGE_UPDATE_TYPES, BaseHandler
+from telegram.ext._handlers.commandhandler import CommandHandler, parse_command
+from telegram.ext._handlers.prefixhandler import PrefixHandler, split_prefix_command
+from telegram.ext._utils.types import CCT
+
+if TYPE_CHECKING:
+    from telegram.ext import Application
+
+RT = TypeVar("RT")
+
+_RoutedHandler = Union[CommandHandler[CCT], PrefixHandler[CCT]]
+
+
+class CommandRouter(BaseHandler[Update, CCT]):
+    """Handler class that routes commands to a number of :class:`telegram.ext.CommandHandler` and
+    :class:`telegram.ext.PrefixHandler` instances.
+
+    Instead of checking every handler one after another, the command of an update is parsed once
+    and looked up in a dictionary mapping each command to the handlers registered for it. Only
+    those handlers are checked, so that :paramref:`~CommandHandler.filters`,
+    :paramref:`~CommandHandler.has_args` and the bot username after ``@`` are respected just
+    as if the handlers were added on their own. The first handler in the order of
+    :paramref:`handlers` that accepts the update handles it.
+
+    The router can be used wherever a handler can be used, e.g. in the
+    :paramref:`~telegram.ext.ConversationHandler.states` of a
+    :class:`telegram.ext.ConversationHandler`, where it also passes on the return value of the
+    callback of the selected handler.
+
+    Example:
+        .. code:: python
+
+            application.add_handler(
+                CommandRouter([CommandHandler("start", start), CommandHandler("help", help)])
+            )
+
+    Note:
+        The :paramref:`block` setting of the router applies to all routed handlers. The
+        :attr:`~telegram.ext.BaseHandler.block` settings of the routed handlers are ignored.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        handlers (Sequence[:class:`telegram.ext.CommandHandler` | \
+            :class:`telegram.ext.PrefixHandler`]): The handlers to route commands to.
+        block (:obj:`bool`, optional): Determines whether the callback of the selected handler
+            should be awaited before processing the next handler in
+            :meth:`telegram.ext.Application.process_update`. Defaults to :obj:`True`.
+
+            .. seealso:: :wiki:`Concurrency`
+
+    Raises:
+        :exc:`TypeError`: If one of the :paramref:`handlers` is neither a
+            :class:`telegram.ext.CommandHandler` nor a :class:`telegram.ext.PrefixHandler`.
+
+    Attributes:
+        handlers (Tuple[:class:`telegram.ext.CommandHandler` | \
+            :class:`telegram.ext.PrefixHandler`]): The handlers to route commands to.
+        block (:obj:`bool`): Determines whether the callback will run in a blocking way.
+    """
+
+    __slots__ = ("_commands", "_prefix_commands", "handlers")
+
+    UPDATE_TYPES = MESSAGE_UPDATE_TYPES | {UpdateType.CALLBACK_QUERY}
+
+    def __init__(
+        self,
+        handlers: Sequence[_RoutedHandler],
+        block: DVType[bool] = DEFAULT_TRUE,
+    ):
+        # The callback of the selected handler is called instead
+        super().__init__(callback=None, block=block)  # type: ignore[arg-type]
+
+        self.handlers: Tuple[_RoutedHandler, ...] = tuple(handlers)
+        # Both map a command to the handlers for it along with their position in `handlers`
+        self._commands: Dict[str, List[Tuple[int, CommandHandler[CCT]]]] = {}
+        self._prefix_commands: Dict[str, List[Tuple[int, PrefixHandler[CCT]]]] = {}
+
+        for position, handler in enumerate(self.handlers):
+            if isinstance(handler, CommandHandler):
+                for command in handler.commands:
+                    self._commands.setdefault(command, []).append((position, handler))
+            elif isinstance(handler, PrefixHandler):
+                for command in handler.commands:
+                    self._prefix_commands.setdefault(command, []).append((position, handler))
+            else:
+                raise TypeError(
+                    f"handler {handler} is neither a CommandHandler nor a PrefixHandler"
+                )
+
+    def __repr__(self) -> str:
+        """Give a string representation of the router in the form
+        ``CommandRouter[handlers=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, handlers=self.handlers)
+
+    def check_update(self, update: object) -> Optional[Tuple[_RoutedHandler, object]]:
+        """Determines whether an update should be passed to one of the routed handlers.
+
+        Args:
+            update (:class:`telegram.Update` | :obj:`object`): Incoming update.
+
+        Returns:
+            Tuple[:class:`telegram.ext.CommandHandler` | :class:`telegram.ext.PrefixHandler`, \
+            :obj:`object`] | :obj:`None`: The selected handler along with the result of its
+            :meth:`~telegram.ext.BaseHandler.check_update`, or :obj:`None`.
+        """
+        if not (isinstance(update, Update) and update.effective_message):
+            return None
+        message = update.effective_message
+
+        # The command is parsed here once and passed to the checks of all candidates
+        parsed_command = parse_command(message) if self._commands else None
+        split_text = split_prefix_command(message) if self._prefix_commands else None
+
+        candidates: List[Tuple[int, _RoutedHandler]] = []
+        if parsed_command:
+            candidates.extend(self._commands.get(parsed_command[0], ()))
+        if split_text:
+            prefix_candidates = self._prefix_commands.get(split_text[0], ())
+            if candidates and prefix_candidates:
+                candidates = sorted([*candidates, *prefix_candidates], key=lambda item: item[0])
+            else:
+                candidates.extend(prefix_candidates)
+
+        for _, handler in candidates:
+            # pylint: disable=protected-access
+            if isinstance(handler, CommandHandler):
+                check_result = handler._check_parsed_command(
+                    update, parsed_command  # type: ignore[arg-type]
+                )
+            else:
+                check_result = handler._check_split_text(
+                    update, split_text  # type: ignore[arg-type]
+                )
+            if check_result is not None and check_result is not False:
+                return handler, check_result
+        return None
+
+    async def handle_update(  # type: ignore[override]
+        self,
+        update: Update,
+        application: "Application[Any, CCT, Any, Any, Any, Any]",
+        check_result: Tuple[_RoutedHandler, object],
+        context: CCT,
+    ) -> RT:
+        """Passes the update on to the handler selected in :meth:`check_update` and returns the
+        return value of its callback.
+
+        Args:
+            update (:class:`telegram.Update`): Incoming telegram update.
+            application (:class:`telegram.ext.Application`): The calling application.
+            check_result (:obj:`tuple`): The result from :meth:`check_update`.
+            context (:class:`telegram.ext.CallbackContext`): The context as provided by
+                the application.
+        """
+        handler, handler_check_result = check_result
+        return await handler.handle_update(update, application, handler_check_result, context)
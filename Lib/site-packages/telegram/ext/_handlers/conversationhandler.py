@@ -19,18 +19,26 @@
 """This module contains the ConversationHandler."""
 import asyncio
 import datetime
+import itertools
+import re
+import time
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
     Final,
+    FrozenSet,
     Generic,
     List,
     NoReturn,
     Optional,
+    Pattern,
+    Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
@@ -50,6 +58,7 @@ from telegram.ext._handlers.inlinequeryhandler import InlineQueryHandler
 from telegram.ext._handlers.stringcommandhandler import StringCommandHandler
 from telegram.ext._handlers.stringregexhandler import StringRegexHandler
 from telegram.ext._handlers.typehandler import TypeHandler
+from telegram.ext._utils._update_parsing import get_update_type
 from telegram.ext._utils.trackingdict import TrackingDict
 from telegram.ext._utils.types import CCT, ConversationDict, ConversationKey
 
@@ -59,12 +68,133 @@ _CheckUpdateType = Tuple[object, ConversationKey, BaseHandler[Update, CCT], obje
 
 _LOGGER = get_logger(__name__, class_name="ConversationHandler")
 
+_REGEX_SPECIAL_CHARACTERS: Final[FrozenSet[str]] = frozenset(".^$*+?{}[]\\|()")
+_REGEX_QUANTIFIERS: Final[FrozenSet[str]] = frozenset("*+?{")
+_HandlerEntry = Tuple[int, BaseHandler[Update, Any]]
+_VT = TypeVar("_VT")
+# Timeouts are checked this many seconds after the earliest deadline, such that conversations
+# timing out shortly after each other are handled in one batch
+_TIMEOUT_RESOLUTION: Final[float] = 0.1
+
+
+def _literal_prefix(pattern: Pattern[str]) -> str:
+    """Returns a string that every string matched by ``re.match(pattern, ...)`` starts with.
+    This is conservative, i.e. for patterns that are not understood, the empty string is returned.
+    """
+    source = pattern.pattern
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE) or "|" in source:
+        return ""
+
+    start = 1 if source.startswith("^") else 0
+    end = start
+    while end < len(source) and source[end] not in _REGEX_SPECIAL_CHARACTERS:
+        end += 1
+    # the last literal character may be repeated zero times, e.g. in "^ab?"
+    if end < len(source) and source[end] in _REGEX_QUANTIFIERS:
+        end -= 1
+    return source[start:end]
+
+
+class _PrefixTrie(Generic[_VT]):
+    """Maps string prefixes to values. :meth:`longest_prefix_value` returns the value of the
+    longest stored prefix of a given string.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, default: _VT) -> None:
+        # every node is a pair of the child nodes by character and the value stored there
+        self._root: List[Any] = [{}, default]
+
+    def __setitem__(self, prefix: str, value: _VT) -> None:
+        node = self._root
+        for character in prefix:
+            node = node[0].setdefault(character, [{}, None])
+        node[1] = value
+
+    def longest_prefix_value(self, text: str) -> _VT:
+        node = self._root
+        value = node[1]
+        for character in text:
+            node = node[0].get(character)
+            if node is None:
+                break
+            if node[1] is not None:
+                value = node[1]
+        return value
+
+
+class _HandlerTable(Generic[CCT]):
+    """Precomputed dispatch table for one list of handlers of a :class:`ConversationHandler`.
+    For an update, :meth:`candidates` returns only those handlers, in their original order, that
+    can possibly accept it, based on :attr:`telegram.ext.BaseHandler.UPDATE_TYPES` and, for
+    callback queries, on the literal prefix of the pattern of :class:`CallbackQueryHandler`.
+    """
+
+    __slots__ = ("_by_type", "_callback_trie", "_size", "handlers")
+
+    def __init__(self, handlers: List[BaseHandler[Update, CCT]]):
+        self.handlers: List[BaseHandler[Update, CCT]] = handlers
+        self._size: int = len(handlers)
+
+        entries: Dict[str, List[_HandlerEntry]] = {name: [] for name in Update.ALL_TYPES}
+        prefixed: List[Tuple[str, _HandlerEntry]] = []
+        for position, handler in enumerate(handlers):
+            entry = (position, handler)
+            update_types = handler.UPDATE_TYPES
+            if update_types is None:
+                update_types = frozenset(Update.ALL_TYPES)
+            elif (
+                type(handler) is CallbackQueryHandler  # pylint: disable=unidiomatic-typecheck
+                and isinstance(handler.pattern, re.Pattern)
+                and isinstance(handler.pattern.pattern, str)
+            ):
+                prefixed.append((_literal_prefix(handler.pattern), entry))
+                continue
+            for update_type in update_types:
+                entries[update_type].append(entry)
+
+        def merge(*groups: List[_HandlerEntry]) -> List[BaseHandler[Update, CCT]]:
+            return [handler for _, handler in sorted(itertools.chain(*groups), key=itemgetter(0))]
+
+        callback_entries = entries[Update.CALLBACK_QUERY]
+        self._by_type: Dict[str, List[BaseHandler[Update, CCT]]] = {
+            update_type: merge(type_entries) for update_type, type_entries in entries.items()
+        }
+        # The pattern is only evaluated for non-empty string data, otherwise the
+        # CallbackQueryHandler decides without it. Hence, all of them are candidates then.
+        self._by_type[Update.CALLBACK_QUERY] = merge(
+            callback_entries, [entry for _, entry in prefixed]
+        )
+        # For string data, the candidates are stored under the longest literal prefix the data
+        # starts with
+        self._callback_trie: _PrefixTrie[List[BaseHandler[Update, CCT]]] = _PrefixTrie(
+            merge(callback_entries, [entry for prefix, entry in prefixed if not prefix])
+        )
+        for prefix in {prefix for prefix, _ in prefixed if prefix}:
+            self._callback_trie[prefix] = merge(
+                callback_entries,
+                [entry for other, entry in prefixed if prefix.startswith(other)],
+            )
+
+    def is_current(self, handlers: List[BaseHandler[Update, CCT]]) -> bool:
+        return handlers is self.handlers and len(handlers) == self._size
+
+    def candidates(self, update: Update) -> Sequence[BaseHandler[Update, CCT]]:
+        update_type = get_update_type(update)
+        if update_type is None:
+            return self.handlers
+
+        if update_type == Update.CALLBACK_QUERY:
+            data = update.callback_query.data  # type: ignore[union-attr]
+            if data and isinstance(data, str):
+                return self._callback_trie.longest_prefix_value(data)
+        return self._by_type[update_type]
+
 
 @dataclass
 class _ConversationTimeoutContext(Generic[CCT]):
-    """Used as a datastore for conversation timeouts. Passed in the
-    :paramref:`JobQueue.run_once.data` parameter. See :meth:`_trigger_timeout`.
-    """
+    """Used as a datastore for conversation timeouts. See :meth:`_trigger_timeout`."""
 
     __slots__ = ("application", "callback_context", "conversation_key", "update")
 
@@ -74,6 +204,63 @@ class _ConversationTimeoutContext(Generic[CCT]):
     callback_context: CCT
 
 
+class _ConversationTimeouts(Generic[CCT]):
+    """Keeps the deadline of each conversation of a :class:`ConversationHandler` with a
+    :attr:`~ConversationHandler.conversation_timeout`.
+
+    As all conversations of a handler have the same timeout, renewing a deadline on activity
+    moves it to the end of the insertion ordered dict, which hence stays ordered by deadline.
+    Renewing and cancelling deadlines is therefore O(1) and doesn't touch the job queue. A single
+    job, :attr:`sweeper`, collects the expired conversations in batches.
+    """
+
+    __slots__ = ("_deadlines", "sweeper")
+
+    def __init__(self) -> None:
+        self._deadlines: Dict[ConversationKey, Tuple[float, _ConversationTimeoutContext[CCT]]] = {}
+        self.sweeper: Optional[Job[Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def sweeper_pending(self) -> bool:
+        """Whether :attr:`sweeper` is still due to run. It isn't once it ran or was removed, e.g.
+        by :meth:`telegram.ext.Job.schedule_removal` or by APScheduler skipping a misfire.
+        """
+        if self.sweeper is None or self.sweeper.removed:
+            return False
+        try:
+            return self.sweeper.next_t is not None
+        except AttributeError:
+            # next_t is only available once the job queue is started, the job is pending until then
+            return True
+
+    def renew(self, timeout: float, timeout_context: _ConversationTimeoutContext[CCT]) -> None:
+        key = timeout_context.conversation_key
+        self._deadlines.pop(key, None)
+        self._deadlines[key] = (time.monotonic() + timeout, timeout_context)
+
+    def cancel(self, key: ConversationKey) -> None:
+        self._deadlines.pop(key, None)
+
+    def pop_expired(self) -> List[_ConversationTimeoutContext[CCT]]:
+        now = time.monotonic()
+        expired: List[_ConversationTimeoutContext[CCT]] = []
+        for deadline, timeout_context in self._deadlines.values():
+            if deadline > now:
+                break
+            expired.append(timeout_context)
+        for timeout_context in expired:
+            del self._deadlines[timeout_context.conversation_key]
+        return expired
+
+    def next_deadline(self) -> Optional[float]:
+        """Returns the number of seconds until the earliest deadline or :obj:`None`."""
+        for deadline, _ in self._deadlines.values():
+            return max(deadline - time.monotonic(), 0)
+        return None
+
+
 @dataclass
 class PendingState:
     """Thin wrapper around :class:`asyncio.Task` to handle block=False handlers. Note that this is
@@ -185,6 +372,16 @@ class ConversationHandler(BaseHandler[Update, CCT]):
         conversation. For an example on nested :class:`ConversationHandler` s, see
         :any:`examples.nestedconversationbot`.
 
+    Note:
+        To find the handler for an update, :class:`ConversationHandler` only checks those handlers
+        of the collections whose :attr:`~telegram.ext.BaseHandler.UPDATE_TYPES` include the type of
+        the update. For callback queries, instances of :class:`CallbackQueryHandler` with a regex
+        pattern are additionally only checked if the data starts with the literal prefix of the
+        pattern. The lookup tables are built on first use and rebuilt when a collection changes
+        in size, so handlers should not be modified in place after the first update.
+
+        .. versionadded:: NEXT.VERSION
+
     Examples:
         * :any:`Conversation Bot <examples.conversationbot>`
         * :any:`Conversation Bot 2 <examples.conversationbot2>`
@@ -223,9 +420,10 @@ class ConversationHandler(BaseHandler[Update, CCT]):
             that are in the state :attr:`ConversationHandler.TIMEOUT`.
 
             Caution:
-                * This feature relies on the :attr:`telegram.ext.Application.job_queue` being set
-                  and hence requires that the dependencies that :class:`telegram.ext.JobQueue`
-                  relies on are installed.
+                * This feature relies on the :attr:`telegram.ext.Application.job_queue` being
+                  set, which is the case by default. Without the dependencies that
+                  :class:`telegram.ext.JobQueue` relies on, a
+                  :class:`telegram.ext.SimpleJobQueue` is used.
                 * Using :paramref:`conversation_timeout` with nested conversations is currently
                   not supported. You can still try to use it, but it will likely behave
                   differently from what you expect.
@@ -273,6 +471,7 @@ class ConversationHandler(BaseHandler[Update, CCT]):
         "_conversations",
         "_entry_points",
         "_fallbacks",
+        "_handler_tables",
         "_map_to_parent",
         "_name",
         "_per_chat",
@@ -280,8 +479,7 @@ class ConversationHandler(BaseHandler[Update, CCT]):
         "_per_user",
         "_persistent",
         "_states",
-        "_timeout_jobs_lock",
-        "timeout_jobs",
+        "_timeouts",
     )
 
     END: Final[int] = -1
@@ -338,12 +536,12 @@ class ConversationHandler(BaseHandler[Update, CCT]):
         self._name: Optional[str] = name
         self._map_to_parent: Optional[Dict[object, object]] = map_to_parent
 
-        # if conversation_timeout is used, this dict is used to schedule a job which runs when the
-        # conv has timed out.
-        self.timeout_jobs: Dict[ConversationKey, Job[Any]] = {}
-        self._timeout_jobs_lock = asyncio.Lock()
+        # if conversation_timeout is used, this keeps track of when the conversations time out
+        self._timeouts: _ConversationTimeouts[CCT] = _ConversationTimeouts()
         self._conversations: ConversationDict = {}
         self._child_conversations: Set[ConversationHandler] = set()
+        # dispatch tables for the handler lists, keyed by the id of the list
+        self._handler_tables: Dict[int, _HandlerTable[CCT]] = {}
 
         if persistent and not self.name:
             raise ValueError("Conversations can't be persistent when handler is unnamed.")
@@ -703,21 +901,73 @@ class ConversationHandler(BaseHandler[Update, CCT]):
         context: CCT,
         conversation_key: ConversationKey,
     ) -> None:
-        """Schedules a job which executes :meth:`_trigger_timeout` upon conversation timeout."""
+        """Sets the deadline after which :meth:`_trigger_timeout` is executed for the
+        conversation and makes sure that the job checking the deadlines is scheduled.
+        """
         if new_state == self.END:
             return
 
+        timeout = self.conversation_timeout
+        if isinstance(timeout, datetime.timedelta):
+            timeout = timeout.total_seconds()
+        self._timeouts.renew(
+            timeout,  # type: ignore[arg-type]
+            _ConversationTimeoutContext(conversation_key, update, application, context),
+        )
+        if not self._timeouts.sweeper_pending():
+            self._schedule_sweeper(application)
+
+    def _schedule_sweeper(
+        self, application: "Application[Any, CCT, Any, Any, Any, JobQueue]"
+    ) -> None:
+        delay = self._timeouts.next_deadline()
+        if delay is None:
+            self._timeouts.sweeper = None
+            return
         try:
             # both job_queue & conversation_timeout are checked before calling _schedule_job
             j_queue = application.job_queue
-            self.timeout_jobs[conversation_key] = j_queue.run_once(  # type: ignore[union-attr]
-                self._trigger_timeout,
-                self.conversation_timeout,  # type: ignore[arg-type]
-                data=_ConversationTimeoutContext(conversation_key, update, application, context),
+            self._timeouts.sweeper = j_queue.run_once(  # type: ignore[union-attr]
+                self._sweep_timeouts,
+                delay + _TIMEOUT_RESOLUTION,
+                name=f"ConversationHandler:{self.name}:timeouts",
             )
         except Exception as exc:
+            self._timeouts.sweeper = None
             _LOGGER.exception("Failed to schedule timeout.", exc_info=exc)
 
+    async def _sweep_timeouts(self, context: CCT) -> None:
+        """Runs :meth:`_trigger_timeout` concurrently for all conversations that timed out and
+        schedules the next run of this method for the next deadline, if any.
+        """
+        application = context.application
+        expired = self._timeouts.pop_expired()
+        # A sweeper that was replaced while it was about to run, see `_schedule_job`, only
+        # collects the expired conversations, so that there is a single sweeper at a time
+        if context.job is self._timeouts.sweeper:
+            self._schedule_sweeper(application)
+        results = await asyncio.gather(
+            *(self._trigger_timeout(timeout_context) for timeout_context in expired),
+            return_exceptions=True,
+        )
+        for timeout_context, result in zip(expired, results):
+            if isinstance(result, Exception):
+                await application.process_error(timeout_context.update, result, job=context.job)
+
+    def _get_candidates(
+        self, handlers: List[BaseHandler[Update, CCT]], update: Update
+    ) -> Sequence[BaseHandler[Update, CCT]]:
+        """Returns the handlers of :paramref:`handlers` that can possibly handle
+        :paramref:`update`, in order. The dispatch table is rebuilt if the list has changed.
+        """
+        if not handlers:
+            return handlers
+
+        table = self._handler_tables.get(id(handlers))
+        if table is None or not table.is_current(handlers):
+            table = self._handler_tables[id(handlers)] = _HandlerTable(handlers)
+        return table.candidates(update)
+
     # pylint: disable=too-many-return-statements
     def check_update(self, update: object) -> Optional[_CheckUpdateType[CCT]]:
         """
@@ -766,7 +1016,7 @@ class ConversationHandler(BaseHandler[Update, CCT]):
 
             # if not then handle WAITING state instead
             else:
-                handlers = self.states.get(self.WAITING, [])
+                handlers = self._get_candidates(self.states.get(self.WAITING, []), update)
                 for handler_ in handlers:
                     check = handler_.check_update(update)
                     if check is not None and check is not False:
@@ -779,7 +1029,7 @@ class ConversationHandler(BaseHandler[Update, CCT]):
 
         # Search entry points for a match
         if state is None or self.allow_reentry:
-            for entry_point in self.entry_points:
+            for entry_point in self._get_candidates(self.entry_points, update):
                 check = entry_point.check_update(update)
                 if check is not None and check is not False:
                     handler = entry_point
@@ -791,7 +1041,7 @@ class ConversationHandler(BaseHandler[Update, CCT]):
 
         # Get the handler list for current state, if we didn't find one yet and we're still here
         if state is not None and handler is None:
-            for candidate in self.states.get(state, []):
+            for candidate in self._get_candidates(self.states.get(state, []), update):
                 check = candidate.check_update(update)
                 if check is not None and check is not False:
                     handler = candidate
@@ -799,7 +1049,7 @@ class ConversationHandler(BaseHandler[Update, CCT]):
 
             # Find a fallback handler if all other handlers fail
             else:
-                for fallback in self.fallbacks:
+                for fallback in self._get_candidates(self.fallbacks, update):
                     check = fallback.check_update(update)
                     if check is not None and check is not False:
                         handler = fallback
@@ -832,12 +1082,8 @@ class ConversationHandler(BaseHandler[Update, CCT]):
         current_state, conversation_key, handler, handler_check_result = check_result
         raise_dp_handler_stop = False
 
-        async with self._timeout_jobs_lock:
-            # Remove the old timeout job (if present)
-            timeout_job = self.timeout_jobs.pop(conversation_key, None)
-
-            if timeout_job is not None:
-                timeout_job.schedule_removal()
+        # The conversation must not time out while the update is handled
+        self._timeouts.cancel(conversation_key)
 
         # Resolution order of "block":
         # 1. Setting of the selected handler
@@ -868,31 +1114,30 @@ class ConversationHandler(BaseHandler[Update, CCT]):
         except ApplicationHandlerStop as exception:
             new_state = exception.state
             raise_dp_handler_stop = True
-        async with self._timeout_jobs_lock:
-            if self.conversation_timeout:
-                if application.job_queue is None:
-                    warn(
-                        "Ignoring `conversation_timeout` because the Application has no JobQueue.",
-                        stacklevel=1,
-                    )
-                elif not application.job_queue.scheduler.running:
-                    warn(
-                        "Ignoring `conversation_timeout` because the Applications JobQueue is "
-                        "not running.",
-                        stacklevel=1,
-                    )
-                elif isinstance(new_state, asyncio.Task):
-                    # Add the new timeout job
-                    # checking if the new state is self.END is done in _schedule_job
-                    application.create_task(
-                        self._schedule_job_delayed(
-                            new_state, application, update, context, conversation_key
-                        ),
-                        update=update,
-                        name=f"ConversationHandler:{update.update_id}:handle_update:timeout_job",
-                    )
-                else:
-                    self._schedule_job(new_state, application, update, context, conversation_key)
+        if self.conversation_timeout:
+            if application.job_queue is None:
+                warn(
+                    "Ignoring `conversation_timeout` because the Application has no JobQueue.",
+                    stacklevel=1,
+                )
+            elif not application.job_queue.scheduler.running:
+                warn(
+                    "Ignoring `conversation_timeout` because the Applications JobQueue is "
+                    "not running.",
+                    stacklevel=1,
+                )
+            elif isinstance(new_state, asyncio.Task):
+                # Renew the timeout
+                # checking if the new state is self.END is done in _schedule_job
+                application.create_task(
+                    self._schedule_job_delayed(
+                        new_state, application, update, context, conversation_key
+                    ),
+                    update=update,
+                    name=f"ConversationHandler:{update.update_id}:handle_update:timeout_job",
+                )
+            else:
+                self._schedule_job(new_state, application, update, context, conversation_key)
 
         if isinstance(self.map_to_parent, dict) and new_state in self.map_to_parent:
             self._update_state(self.END, conversation_key, handler)
@@ -933,27 +1178,17 @@ class ConversationHandler(BaseHandler[Update, CCT]):
                 )
             self._conversations[key] = new_state
 
-    async def _trigger_timeout(self, context: CCT) -> None:
+    async def _trigger_timeout(self, ctxt: _ConversationTimeoutContext[CCT]) -> None:
         """This is run whenever a conversation has timed out. Also makes sure that all handlers
         which are in the :attr:`TIMEOUT` state and whose :meth:`BaseHandler.check_update` returns
         :obj:`True` is handled.
         """
-        job = cast("Job", context.job)
-        ctxt = cast(_ConversationTimeoutContext, job.data)
-
         _LOGGER.debug(
             "Conversation timeout was triggered for conversation %s!", ctxt.conversation_key
         )
 
         callback_context = ctxt.callback_context
 
-        async with self._timeout_jobs_lock:
-            found_job = self.timeout_jobs.get(ctxt.conversation_key)
-            if found_job is not job:
-                # The timeout has been cancelled in handle_update
-                return
-            del self.timeout_jobs[ctxt.conversation_key]
-
         # Now run all handlers which are in TIMEOUT state
         handlers = self.states.get(self.TIMEOUT, [])
         for handler in handlers:
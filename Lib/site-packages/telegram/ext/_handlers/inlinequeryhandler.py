@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING, Any, List, Match, Optional, Pattern, TypeVar,
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
@@ -86,6 +87,8 @@ class InlineQueryHandler(BaseHandler[Update, CCT]):
 
     __slots__ = ("chat_types", "pattern")
 
+    UPDATE_TYPES = frozenset({UpdateType.INLINE_QUERY})
+
     def __init__(
         self,
         callback: HandlerCallback[Update, CCT, RT],
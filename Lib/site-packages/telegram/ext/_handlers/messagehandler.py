@@ -23,7 +23,7 @@ from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
 from telegram.ext import filters as filters_module
-from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._handlers.basehandler import MESSAGE_UPDATE_TYPES, BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
@@ -74,6 +74,8 @@ class MessageHandler(BaseHandler[Update, CCT]):
 
     __slots__ = ("filters",)
 
+    UPDATE_TYPES = MESSAGE_UPDATE_TYPES
+
     def __init__(
         self,
         filters: Optional[filters_module.BaseFilter],
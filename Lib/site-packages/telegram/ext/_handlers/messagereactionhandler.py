@@ -23,6 +23,7 @@ from typing import Final, Optional
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import RT, SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -100,6 +101,8 @@ class MessageReactionHandler(BaseHandler[Update, CCT]):
         "message_reaction_types",
     )
 
+    UPDATE_TYPES = frozenset({UpdateType.MESSAGE_REACTION, UpdateType.MESSAGE_REACTION_COUNT})
+
     MESSAGE_REACTION_UPDATED: Final[int] = -1
     """:obj:`int`: Used as a constant to handle only :attr:`telegram.Update.message_reaction`."""
     MESSAGE_REACTION_COUNT_UPDATED: Final[int] = 0
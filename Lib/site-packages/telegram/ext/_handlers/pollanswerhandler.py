@@ -20,6 +20,7 @@
 
 
 from telegram import Update
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT
 
@@ -58,6 +59,8 @@ class PollAnswerHandler(BaseHandler[Update, CCT]):
 
     __slots__ = ()
 
+    UPDATE_TYPES = frozenset({UpdateType.POLL_ANSWER})
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
@@ -25,6 +25,7 @@ from typing import Optional, Pattern, TypeVar, Union
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
@@ -72,6 +73,8 @@ class PreCheckoutQueryHandler(BaseHandler[Update, CCT]):
 
     __slots__ = ("pattern",)
 
+    UPDATE_TYPES = frozenset({UpdateType.PRE_CHECKOUT_QUERY})
+
     def __init__(
         self,
         callback: HandlerCallback[Update, CCT, RT],
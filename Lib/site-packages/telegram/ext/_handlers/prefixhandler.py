@@ -20,11 +20,12 @@
 import itertools
 from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple, TypeVar, Union
 
-from telegram import Update
+from telegram import Message, Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext import filters as filters_module
-from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._handlers.basehandler import MESSAGE_UPDATE_TYPES, BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
@@ -33,6 +34,21 @@ if TYPE_CHECKING:
 RT = TypeVar("RT")
 
 
+def split_prefix_command(message: Message) -> Optional[Tuple[str, List[str]]]:
+    """Splits the text of the message into its first word and the remaining words.
+
+    Args:
+        message (:class:`telegram.Message`): The message.
+
+    Returns:
+        Tuple[:obj:`str`, List[:obj:`str`]] | :obj:`None`: The lower case first word and the
+        remaining words. :obj:`None`, if the message has no text.
+    """
+    if message.text and (text_list := message.text.split()):
+        return text_list[0].lower(), text_list[1:]
+    return None
+
+
 class PrefixHandler(BaseHandler[Update, CCT]):
     """Handler class to handle custom prefix commands.
 
@@ -122,6 +138,8 @@ class PrefixHandler(BaseHandler[Update, CCT]):
     # 'prefix' is a class property, & 'command' is included in the superclass, so they're left out.
     __slots__ = ("commands", "filters")
 
+    UPDATE_TYPES = MESSAGE_UPDATE_TYPES | {UpdateType.CALLBACK_QUERY}
+
     def __init__(
         self,
         prefix: SCT[str],
@@ -156,18 +174,26 @@ class PrefixHandler(BaseHandler[Update, CCT]):
 
         """
         if isinstance(update, Update) and update.effective_message:
-            message = update.effective_message
-
-            if message.text:
-                text_list = message.text.split()
-                if text_list[0].lower() not in self.commands:
-                    return None
-                filter_result = self.filters.check_update(update)
-                if filter_result:
-                    return text_list[1:], filter_result
-                return False
+            split_text = split_prefix_command(update.effective_message)
+            if split_text:
+                return self._check_split_text(update, split_text)
         return None
 
+    def _check_split_text(
+        self, update: Update, split_text: Tuple[str, List[str]]
+    ) -> Optional[Union[bool, Tuple[List[str], Optional[Union[bool, Dict[Any, Any]]]]]]:
+        """Does the checks of :meth:`check_update` for the result of
+        :func:`split_prefix_command`, which lets :class:`telegram.ext.CommandRouter` split the
+        text only once for all handlers.
+        """
+        command, args = split_text
+        if command not in self.commands:
+            return None
+        filter_result = self.filters.check_update(update)
+        if filter_result:
+            return args, filter_result
+        return False
+
     def collect_additional_context(
         self,
         context: CCT,
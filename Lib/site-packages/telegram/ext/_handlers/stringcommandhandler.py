@@ -70,6 +70,8 @@ class StringCommandHandler(BaseHandler[str, CCT]):
 
     __slots__ = ("command",)
 
+    UPDATE_TYPES = frozenset()
+
     def __init__(
         self,
         command: str,
@@ -73,6 +73,8 @@ class StringRegexHandler(BaseHandler[str, CCT]):
 
     __slots__ = ("pattern",)
 
+    UPDATE_TYPES = frozenset()
+
     def __init__(
         self,
         pattern: Union[str, Pattern[str]],
@@ -16,7 +16,7 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
-"""This module contains the classes JobQueue and Job."""
+"""This module contains the classes JobQueue, SimpleJobQueue and Job."""
 import asyncio
 import datetime
 import weakref
@@ -35,6 +35,7 @@ from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import JSONDict
 from telegram.ext._extbot import ExtBot
+from telegram.ext._utils.scheduler import Scheduler, localize
 from telegram.ext._utils.types import CCT, JobCallback
 
 if TYPE_CHECKING:
@@ -74,6 +75,8 @@ class JobQueue(Generic[CCT]):
         To use this class, PTB must be installed via
         ``pip install "python-telegram-bot[job-queue]"``.
 
+    .. seealso:: :class:`telegram.ext.SimpleJobQueue`, which does not depend on APScheduler.
+
     Attributes:
         scheduler (:class:`apscheduler.schedulers.asyncio.AsyncIOScheduler`): The scheduler.
 
@@ -197,8 +200,8 @@ class JobQueue(Generic[CCT]):
                 datetime.datetime.now(tz=time.tzinfo or self.scheduler.timezone).date(), time
             )
             if date_time.tzinfo is None:
-                date_time = self.scheduler.timezone.localize(date_time)
-            if shift_day and date_time <= datetime.datetime.now(pytz.utc):
+                date_time = localize(date_time, self.scheduler.timezone)
+            if shift_day and date_time <= datetime.datetime.now(datetime.timezone.utc):
                 date_time += datetime.timedelta(days=1)
             return date_time
         return time
@@ -711,10 +714,86 @@ class JobQueue(Generic[CCT]):
         return tuple(job for job in self.jobs() if job.name == name)
 
 
+class SimpleJobQueue(JobQueue[CCT]):
+    """A :class:`telegram.ext.JobQueue` that schedules the jobs with timers of the asyncio event
+    loop instead of APScheduler and hence needs no optional requirements. It is used by
+    :class:`telegram.ext.ApplicationBuilder` by default, if APScheduler is not installed.
+
+    The pending jobs are kept in a heap ordered by their next run time, with a single timer of
+    the event loop waiting for the earliest one. Adding a job takes O(log n) time and removing it
+    via :meth:`telegram.ext.Job.schedule_removal` amortized O(1) time, such that hundreds of
+    thousands of pending jobs, e.g. for the timeouts of many conversations, are handled without
+    noticeable overhead.
+
+    All scheduling methods of :class:`telegram.ext.JobQueue` are supported. However, only the
+    following arguments of :meth:`apscheduler.schedulers.base.BaseScheduler.add_job` can be
+    passed as ``job_kwargs``:
+
+    * ``id``, ``replace_existing``, ``max_instances``, ``misfire_grace_time`` and ``timezone``.
+    * ``trigger`` with the values ``"date"``, ``"interval"`` and ``"cron"`` and the arguments
+      ``run_date``, the arguments of :class:`datetime.timedelta` along with ``start_date`` and
+      ``end_date`` and ``day_of_week``, ``day``, ``hour``, ``minute`` and ``second``,
+      respectively. Passing a trigger object of APScheduler is also supported.
+
+    Missed runs of a job, e.g. due to a blocked event loop, are coalesced into one run. Unlike
+    with APScheduler, late runs are not skipped unless ``misfire_grace_time`` is passed. As with
+    APScheduler, runs are skipped while ``max_instances`` (defaults to ``1``) runs of the same job
+    are still running.
+
+    .. versionadded:: NEXT.VERSION
+
+    Attributes:
+        scheduler: The scheduler, which provides the parts of the interface of
+            :class:`apscheduler.schedulers.asyncio.AsyncIOScheduler` that are described above.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        self._application: Optional[weakref.ReferenceType[Application]] = None
+        self.scheduler = Scheduler()  # type: ignore[assignment]
+
+    @property
+    def scheduler_configuration(self) -> JSONDict:
+        """Provides configuration values that are used by :class:`SimpleJobQueue` for
+        :attr:`scheduler`, i.e. the time zone of :attr:`telegram.ext.Defaults.tzinfo`, if set, or
+        UTC.
+
+        Returns:
+            Dict[:obj:`str`, :obj:`object`]: The configuration values as dictionary.
+        """
+        timezone: datetime.tzinfo = datetime.timezone.utc
+        if (
+            self._application
+            and isinstance(self.application.bot, ExtBot)
+            and self.application.bot.defaults
+        ):
+            timezone = self.application.bot.defaults.tzinfo or timezone
+        return {"timezone": timezone}
+
+    async def start(self) -> None:
+        """Starts the :class:`~telegram.ext.SimpleJobQueue`."""
+        if not self.scheduler.running:
+            self.scheduler.start()
+
+    async def stop(self, wait: bool = True) -> None:
+        """Shuts down the :class:`~telegram.ext.SimpleJobQueue`.
+
+        Args:
+            wait (:obj:`bool`, optional): Whether to wait until all currently running jobs
+                have finished. Otherwise, they are cancelled. Defaults to :obj:`True`.
+
+        """
+        if self.scheduler.running:
+            await self.scheduler.shutdown(wait=wait)  # type: ignore[func-returns-value,misc]
+
+
 class Job(Generic[CCT]):
     """This class is a convenience wrapper for the jobs held in a :class:`telegram.ext.JobQueue`.
-    With the current backend APScheduler, :attr:`job` holds a :class:`apscheduler.job.Job`
-    instance.
+    With the backend APScheduler, :attr:`job` holds a :class:`apscheduler.job.Job` instance.
+    For jobs of a :class:`telegram.ext.SimpleJobQueue`, :attr:`job` holds an object providing the
+    same basic interface, i.e. the attributes ``id``, ``name``, ``trigger`` and
+    ``next_run_time`` and the methods ``pause``, ``resume``, ``remove`` and ``reschedule``.
 
     Objects of this class are comparable in terms of equality. Two objects of this class are
     considered equal, if their :class:`id <apscheduler.job.Job>` is equal.
@@ -722,14 +801,6 @@ class Job(Generic[CCT]):
     This class is a :class:`~typing.Generic` class and accepts one type variable that specifies
     the type of the argument ``context`` of :paramref:`callback`.
 
-    Important:
-        If you want to use this class, you must install PTB with the optional requirement
-        ``job-queue``, i.e.
-
-        .. code-block:: bash
-
-           pip install "python-telegram-bot[job-queue]"
-
     Note:
         All attributes and instance methods of :attr:`job` are also directly available as
         attributes/methods of the corresponding :class:`telegram.ext.Job` object.
@@ -748,6 +819,10 @@ class Job(Generic[CCT]):
        * To use this class, PTB must be installed via
          ``pip install "python-telegram-bot[job-queue]"``.
 
+    .. versionchanged:: NEXT.VERSION
+        This class can be used without the optional requirement ``job-queue``, as it is also
+        used by :class:`telegram.ext.SimpleJobQueue`.
+
     Args:
         callback (:term:`coroutine function`): The callback function that should be executed by the
             new job. Callback signature::
@@ -797,12 +872,6 @@ class Job(Generic[CCT]):
         chat_id: Optional[int] = None,
         user_id: Optional[int] = None,
     ):
-        if not APS_AVAILABLE:
-            raise RuntimeError(
-                "To use `Job`, PTB must be installed via `pip install "
-                '"python-telegram-bot[job-queue]"`.'
-            )
-
         self.callback: JobCallback[CCT] = callback
         self.data: Optional[object] = data
         self.name: Optional[str] = name or callback.__name__
@@ -878,7 +947,9 @@ class Job(Generic[CCT]):
 
     @property
     def job(self) -> "APSJob":
-        """:class:`apscheduler.job.Job`: The APS Job this job is a wrapper for.
+        """:class:`apscheduler.job.Job`: The APS Job this job is a wrapper for. For jobs of a
+        :class:`telegram.ext.SimpleJobQueue`, this is an object providing the same basic
+        interface.
 
         .. versionchanged:: 20.0
             This property is now read-only.
@@ -17,23 +17,70 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the PicklePersistence class."""
+import asyncio
+import os
 import pickle
+from collections import deque
+from contextlib import contextmanager
 from copy import deepcopy
+from itertools import compress, repeat
+from operator import is_not
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar, Union, cast, overload
+from types import MappingProxyType
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 from telegram import Bot, TelegramObject
+from telegram._utils.defaultvalue import DefaultValue
 from telegram._utils.types import FilePathInput
 from telegram._utils.warnings import warn
 from telegram.ext import BasePersistence, PersistenceInput
 from telegram.ext._contexttypes import ContextTypes
+from telegram.ext._utils.compression import (
+    COMPRESSIONS,
+    DECOMPRESSION_ERRORS,
+    compressing_writer,
+    open_for_reading,
+)
 from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
 
 _REPLACED_KNOWN_BOT = "a known bot replaced by PTB's PicklePersistence"
 _REPLACED_UNKNOWN_BOT = "an unknown bot replaced by PTB's PicklePersistence"
+_LOG_HEADER = "an incremental log of PTB's PicklePersistence, version 1"
+# The log is compacted once it has more than twice as many records as there are entries, but
+# small logs are never compacted
+_LOG_MIN_COMPACTION_RECORDS = 1000
+_KINDS = ("user_data", "chat_data", "bot_data", "callback_data", "conversations")
 
 TelegramObj = TypeVar("TelegramObj", bound=TelegramObject)
 
+# The names of the attributes of each TelegramObject subclass in the order used by
+# `_compact_reduction`
+_SLOT_LAYOUTS: Dict[type, Tuple[str, ...]] = {}
+# The layout last unpickled for each class, if it matches the current layout of the class. The
+# same tuple is shared by all objects of a class in one pickle, so usually the layout only needs
+# to be compared once per class and file.
+_VERIFIED_LAYOUTS: Dict[type, Tuple[str, ...]] = {}
+# Whether each pickled type is a subclass of Bot. isinstance(obj, Bot) is slow, since Bot is an
+# abstract base class, and persistent_id is called for every pickled object.
+_IS_BOT_TYPE: Dict[type, bool] = {}
+
 
 def _all_subclasses(cls: Type[TelegramObj]) -> Set[Type[TelegramObj]]:
     """Gets all subclasses of the specified object, recursively. from
@@ -67,6 +114,111 @@ def _custom_reduction(cls: TelegramObj) -> Tuple[Callable, Tuple[Type[TelegramOb
     return _reconstruct_to, (cls.__class__, data)
 
 
+def _slot_layout(cls: Type[TelegramObject]) -> Tuple[str, ...]:
+    layout = _SLOT_LAYOUTS.get(cls)
+    if layout is None:
+        slots = (s for c in cls.__mro__[:-1] for s in getattr(c, "__slots__", ()))
+        layout = _SLOT_LAYOUTS[cls] = tuple(
+            dict.fromkeys(s for s in slots if s not in ("__dict__", "__weakref__"))
+        )
+    return layout
+
+
+def _reconstruct_slots(
+    cls: Type[TelegramObj],
+    layout: Tuple[str, ...],
+    indices: Sequence[int],
+    values: Tuple[object, ...],
+) -> TelegramObj:
+    """
+    This method is used for unpickling objects pickled by `_compact_reduction`. The attributes
+    ``layout[i]`` for ``i`` in `indices` are set to the corresponding `values`, all others to
+    :obj:`None`. This function should be kept in place for backwards compatibility even if the
+    pickling logic is changed.
+    """
+    obj = cls.__new__(cls)
+    names = map(layout.__getitem__, indices)
+    # object.__setattr__ bypasses TelegramObject.__setattr__, which forbids setting attributes
+    # of frozen objects. Consuming the maps with a zero-length deque iterates in C, which is
+    # much faster than a for loop for the many attributes of e.g. Message.
+    set_attribute = object.__setattr__
+    current_layout = _slot_layout(cls)
+    deque(map(set_attribute, repeat(obj), current_layout, repeat(None)), maxlen=0)
+
+    if layout is not _VERIFIED_LAYOUTS.get(cls):
+        if layout != current_layout:
+            # The class changed since pickling. __setstate__ takes care of attributes that
+            # were removed or moved from api_kwargs to dedicated attributes.
+            state: Dict[str, object] = dict(zip(names, values))
+            state.setdefault("api_kwargs", {})
+            obj.__setstate__(state)
+            return obj
+        _VERIFIED_LAYOUTS[cls] = layout
+
+    deque(map(set_attribute, repeat(obj), names, values), maxlen=0)
+    # MappingProxyType is not pickable, so api_kwargs is pickled as dict
+    set_attribute(obj, "api_kwargs", MappingProxyType(obj.api_kwargs or {}))
+    return obj
+
+
+def _compact_reduction(
+    obj: TelegramObj,
+) -> Tuple[Callable, Tuple[Type[TelegramObj], Tuple[str, ...], Sequence[int], Tuple[object, ...]]]:
+    """
+    This method is used for pickling objects without a ``__dict__``. Only the attributes that are
+    not :obj:`None` are pickled, along with their indices in the slots of the class. This is much
+    smaller and faster than the :obj:`dict` of `_custom_reduction`. The indices are pickled as
+    :obj:`bytes` if possible, which takes one byte per index. The bot attribute is preserved so
+    _BotPickler().persistent_id works as intended.
+    """
+    cls = obj.__class__
+    layout = _slot_layout(cls)
+    current = tuple(map(getattr, repeat(obj), layout, repeat(None)))
+    indices = []
+    values = []
+    for index in compress(range(len(layout)), map(is_not, current, repeat(None))):
+        value = current[index]
+        if isinstance(value, DefaultValue):
+            value = value.value
+            if value is None:
+                continue
+        elif isinstance(value, MappingProxyType):
+            # api_kwargs: MappingProxyType is not pickable, so we convert it to a dict
+            if not value:
+                continue
+            value = dict(value)
+        indices.append(index)
+        values.append(value)
+    packed_indices = bytes(indices) if len(layout) <= 256 else tuple(indices)
+    return _reconstruct_slots, (cls, layout, packed_indices, tuple(values))
+
+
+@contextmanager
+def _atomic_open(filepath: Path) -> Iterator[BinaryIO]:
+    """Yields a temporary file next to `filepath` for writing. Once it was written completely, it
+    is synced to the disk and atomically replaces `filepath`, such that a crash never leaves a
+    partially written file behind.
+    """
+    temp_path = filepath.with_name(f"{filepath.name}.tmp")
+    try:
+        with temp_path.open("wb") as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, filepath)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    if os.name == "posix":
+        # The rename itself is only durable once the directory is synced as well
+        directory = os.open(filepath.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
 class _BotPickler(pickle.Pickler):
     __slots__ = ("_bot",)
 
@@ -84,7 +236,9 @@ class _BotPickler(pickle.Pickler):
         if not isinstance(obj, TelegramObject):
             return NotImplemented
 
-        return _custom_reduction(obj)
+        if hasattr(obj, "__dict__"):
+            return _custom_reduction(obj)
+        return _compact_reduction(obj)
 
     def persistent_id(self, obj: object) -> Optional[str]:
         """Used to 'mark' the Bot, so it can be replaced later. See
@@ -92,7 +246,11 @@ class _BotPickler(pickle.Pickler):
         """
         if obj is self._bot:
             return _REPLACED_KNOWN_BOT
-        if isinstance(obj, Bot):
+        cls = obj.__class__
+        is_bot = _IS_BOT_TYPE.get(cls)
+        if is_bot is None:
+            is_bot = _IS_BOT_TYPE[cls] = issubclass(cls, Bot)
+        if is_bot:
             warn(
                 "Unknown bot instance found. Will be replaced by `None` during unpickling",
                 stacklevel=2,
@@ -142,6 +300,11 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         * The parameter and attribute ``filename`` were replaced by :attr:`filepath`.
         * :attr:`filepath` now also accepts :obj:`pathlib.Path` as argument.
 
+    .. versionchanged:: NEXT.VERSION
+        Pickle files are written to a temporary file on a worker thread, synced to the disk and
+        then atomically renamed, such that a crash while writing never corrupts the stored data.
+        While a file is written, further writes of that file are combined into a single one.
+
     Args:
         filepath (:obj:`str` | :obj:`pathlib.Path`): The filepath for storing the pickle files.
             When :attr:`single_file` is :obj:`False` this will be used as a prefix.
@@ -167,6 +330,32 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
 
             .. versionadded:: 20.0
+        incremental (:obj:`bool`, optional): When :obj:`True`, the data is stored in an
+            append-only log at :attr:`filepath`. Each change of a user, chat, conversation key,
+            the bot data or the callback data appends one record instead of re-pickling all data,
+            such that writing only costs as much as the number of changed entries. The log is
+            compacted when most of its records are outdated. :attr:`single_file` is ignored in
+            this mode. Default is :obj:`False`.
+
+            Note:
+                Every record is pickled on its own, so objects shared between different entries
+                are no longer shared after loading.
+
+            .. versionadded:: NEXT.VERSION
+        compression (:obj:`str`, optional): Compresses the pickle file(s) with the given
+            codec of the standard library, one of ``"gzip"``, ``"lzma"`` and ``"zlib"``. The
+            data is compressed and decompressed as a stream while pickling and unpickling, so
+            the serialized data is never held in memory as a whole. Files are always read with
+            the codec they were written with, so the compression of existing files can be
+            changed. Can't be combined with :paramref:`incremental`. Default is :obj:`None`, i.e.
+            no compression.
+
+            .. versionadded:: NEXT.VERSION
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`compression` is not supported or combined with
+            :paramref:`incremental`.
+
     Attributes:
         filepath (:obj:`str` | :obj:`pathlib.Path`): The filepath for storing the pickle files.
             When :attr:`single_file` is :obj:`False` this will be used as a prefix.
@@ -183,15 +372,31 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             in the ``context`` interface.
 
             .. versionadded:: 13.6
+        incremental (:obj:`bool`): Optional. When :obj:`True`, the data is stored in an
+            append-only log at :attr:`filepath` with one record per change.
+
+            .. versionadded:: NEXT.VERSION
+        compression (:obj:`str`): Optional. The codec used for compressing the pickle files.
+
+            .. versionadded:: NEXT.VERSION
     """
 
     __slots__ = (
+        "_dirty",
+        "_loaded",
+        "_loading",
+        "_log_records",
+        "_rewrite_log",
+        "_running_writes",
+        "_scheduled_writes",
         "bot_data",
         "callback_data",
         "chat_data",
+        "compression",
         "context_types",
         "conversations",
         "filepath",
+        "incremental",
         "on_flush",
         "single_file",
         "user_data",
@@ -205,6 +410,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         single_file: bool = True,
         on_flush: bool = False,
         update_interval: float = 60,
+        incremental: bool = False,
+        compression: Optional[str] = None,
     ): ...
 
     @overload
@@ -216,6 +423,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        incremental: bool = False,
+        compression: Optional[str] = None,
     ): ...
 
     def __init__(
@@ -226,6 +435,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        incremental: bool = False,
+        compression: Optional[str] = None,
     ):
         super().__init__(store_data=store_data, update_interval=update_interval)
         self.filepath: Path = Path(filepath)
@@ -239,24 +450,85 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         self.context_types: ContextTypes[Any, UD, CD, BD] = cast(
             ContextTypes[Any, UD, CD, BD], context_types or ContextTypes()
         )
+        self.incremental: bool = incremental
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown compression {compression!r}. Choose one of {COMPRESSIONS}."
+            )
+        if compression is not None and incremental:
+            raise ValueError("`compression` can't be combined with `incremental`.")
+        self.compression: Optional[str] = compression
+        # The entries changed since the last write of the log, as pairs of kind and key, and the
+        # number of records in the log or None if it was not loaded yet
+        self._dirty: Set[Tuple[str, object]] = set()
+        self._log_records: Optional[int] = None
+        # Set if appending to the log failed, such that the next write rewrites it completely
+        self._rewrite_log: bool = False
+        # The kinds of data that were loaded and the running loads, see `_load`
+        self._loaded: Set[str] = set()
+        self._loading: Dict[str, asyncio.Task[None]] = {}
+        # The write of each file that is running and the one that waits for it, see `_dump`
+        self._running_writes: Dict[Path, asyncio.Task[None]] = {}
+        self._scheduled_writes: Dict[Path, asyncio.Task[None]] = {}
+
+    def _default_data(self, kind: str) -> Any:
+        if kind == "bot_data":
+            return self.context_types.bot_data()
+        if kind == "callback_data":
+            return None
+        return {}
 
-    def _load_singlefile(self) -> None:
+    async def _load(self, kind: str) -> None:
+        """Loads the data of the given kind from the file(s) on a worker thread, unless it was
+        loaded before. A single file and the log contain all kinds of data, which are then loaded
+        at once. Concurrent calls wait for the same load.
+        """
+        if kind in self._loaded:
+            return
+        source = "all" if self.incremental or self.single_file else kind
+        task = self._loading.get(source)
+        if task is None:
+            task = self._loading[source] = asyncio.create_task(self._run_load(kind, source))
+        await asyncio.shield(task)
+
+    async def _run_load(self, kind: str, source: str) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            if self.incremental:
+                data, self._log_records = await loop.run_in_executor(None, self._read_log)
+            elif self.single_file:
+                data = await loop.run_in_executor(None, self._read_singlefile)
+            else:
+                stored = await loop.run_in_executor(
+                    None, self._load_file, Path(f"{self.filepath}_{kind}")
+                )
+                data = {kind: stored or self._default_data(kind)}
+        finally:
+            del self._loading[source]
+
+        for name, value in data.items():
+            if name not in self._loaded:
+                setattr(self, name, value)
+                self._loaded.add(name)
+
+    def _read_singlefile(self) -> Dict[str, Any]:
         try:
-            with self.filepath.open("rb") as file:
+            with open_for_reading(self.filepath) as file:
                 data = _BotUnpickler(self.bot, file).load()
 
-            self.user_data = data["user_data"]
-            self.chat_data = data["chat_data"]
-            # For backwards compatibility with files not containing bot data
-            self.bot_data = data.get("bot_data", self.context_types.bot_data())
-            self.callback_data = data.get("callback_data", {})
-            self.conversations = data["conversations"]
+            return {
+                "user_data": data["user_data"],
+                "chat_data": data["chat_data"],
+                # For backwards compatibility with files not containing bot data
+                "bot_data": data.get("bot_data", self.context_types.bot_data()),
+                "callback_data": data.get("callback_data", {}),
+                "conversations": data["conversations"],
+            }
+        except DECOMPRESSION_ERRORS as exc:
+            filename = self.filepath.name
+            raise TypeError(f"File {filename} does not contain valid compressed data") from exc
         except OSError:
-            self.conversations = {}
-            self.user_data = {}
-            self.chat_data = {}
-            self.bot_data = self.context_types.bot_data()
-            self.callback_data = None
+            return {kind: self._default_data(kind) for kind in _KINDS}
         except pickle.UnpicklingError as exc:
             filename = self.filepath.name
             raise TypeError(f"File {filename} does not contain valid pickle data") from exc
@@ -265,9 +537,12 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
 
     def _load_file(self, filepath: Path) -> Any:
         try:
-            with filepath.open("rb") as file:
+            with open_for_reading(filepath) as file:
                 return _BotUnpickler(self.bot, file).load()
 
+        except DECOMPRESSION_ERRORS as exc:
+            filename = filepath.name
+            raise TypeError(f"File {filename} does not contain valid compressed data") from exc
         except OSError:
             return None
         except pickle.UnpicklingError as exc:
@@ -275,20 +550,218 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         except Exception as exc:
             raise TypeError(f"Something went wrong unpickling {filepath.name}") from exc
 
-    def _dump_singlefile(self) -> None:
-        data = {
-            "conversations": self.conversations,
-            "user_data": self.user_data,
-            "chat_data": self.chat_data,
-            "bot_data": self.bot_data,
-            "callback_data": self.callback_data,
-        }
-        with self.filepath.open("wb") as file:
-            _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
-
-    def _dump_file(self, filepath: Path, data: object) -> None:
-        with filepath.open("wb") as file:
-            _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
+    def _read_log(self) -> Tuple[Dict[str, Any], int]:
+        """Returns the data stored in the log along with the number of records in the log."""
+        data = {kind: self._default_data(kind) for kind in _KINDS}
+        records = 0
+        try:
+            file = self.filepath.open("rb")
+        except OSError:
+            return data, records
+
+        with file:
+            size = os.fstat(file.fileno()).st_size
+            try:
+                header = _BotUnpickler(self.bot, file).load()
+            except Exception as exc:
+                raise TypeError(f"File {self.filepath.name} does not contain a valid log") from exc
+            if header != _LOG_HEADER:
+                raise TypeError(f"File {self.filepath.name} does not contain a valid log")
+
+            end = file.tell()
+            try:
+                while end < size:
+                    self._apply_record(data, *_BotUnpickler(self.bot, file).load())
+                    records += 1
+                    end = file.tell()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # An interrupted append leaves an incomplete record at the end, which is dropped
+                # so that the next records are appended to a valid log
+                warn(f"Dropping an incomplete record at the end of {self.filepath.name}.")
+        if end < size:
+            with self.filepath.open("r+b") as file:
+                file.truncate(end)
+        return data, records
+
+    def _apply_record(self, data: Dict[str, Any], kind: str, key: Any, value: Any) -> None:
+        if kind in ("user_data", "chat_data"):
+            data[kind][key] = value
+        elif kind in ("drop_user_data", "drop_chat_data"):
+            data[kind[5:]].pop(key, None)
+        elif kind in ("bot_data", "callback_data"):
+            data[kind] = value
+        elif kind == "conversations":
+            name, conversation_key = key
+            data[kind].setdefault(name, {})[conversation_key] = value
+        else:
+            raise TypeError(f"File {self.filepath.name} contains an unknown record {kind}")
+
+    def _get_record(self, kind: str, key: Any) -> Tuple[str, Any, Any]:
+        """Returns the record that stores the current value of the entry."""
+        if kind in ("user_data", "chat_data"):
+            data = getattr(self, kind)
+            if key not in data:
+                return f"drop_{kind}", key, None
+            return kind, key, data[key]
+        if kind == "conversations":
+            name, conversation_key = key
+            return kind, key, self.conversations[name][conversation_key]  # type: ignore[index]
+        return kind, None, getattr(self, kind)
+
+    def _iter_records(self) -> Iterator[Tuple[str, Any, Any]]:
+        """Yields the records that store all current data."""
+        for user_id, user_data in (self.user_data or {}).items():
+            yield "user_data", user_id, user_data
+        for chat_id, chat_data in (self.chat_data or {}).items():
+            yield "chat_data", chat_id, chat_data
+        for name, conversations in (self.conversations or {}).items():
+            for key, state in conversations.items():
+                yield "conversations", (name, key), state
+        if self.bot_data is not None:
+            yield "bot_data", None, self.bot_data
+        if self.callback_data is not None:
+            yield "callback_data", None, self.callback_data
+
+    def _dump_record(self, file: IO[bytes], record: object) -> None:
+        _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(record)
+
+    async def _mark_dirty(self, kind: str, key: object = None) -> None:
+        self._dirty.add((kind, key))
+        if not self.on_flush:
+            await self._dump_log()
+
+    async def _dump_log(self) -> None:
+        """Appends the records of the changed entries to the log on a worker thread and compacts
+        the log if most of its records are outdated. Shares the handling of concurrent writes
+        with the other files, see `_dump`.
+        """
+        if not self._dirty and not self._rewrite_log:
+            return
+        try:
+            await self._dump(self.filepath, self._get_log_records, self._write_log)
+        except Exception:
+            # The records of the failed write are lost and an incomplete record may be left at
+            # the end of the log, so the next write replaces the log as a whole
+            self._rewrite_log = True
+            raise
+
+    def _get_log_records(self) -> Tuple[bool, List[Tuple[str, Any, Any]]]:
+        """Returns whether the log is to be compacted and the records to write. Called on the
+        event loop when the write starts.
+        """
+        if self._log_records is None:
+            self._log_records = 0
+        entries = (
+            len(self.user_data or {})
+            + len(self.chat_data or {})
+            + sum(len(conversations) for conversations in (self.conversations or {}).values())
+        )
+        compact = self._rewrite_log or self._log_records + len(self._dirty) > max(
+            2 * entries, _LOG_MIN_COMPACTION_RECORDS
+        )
+        if compact:
+            records = list(self._iter_records())
+            self._log_records = len(records)
+            self._rewrite_log = False
+        else:
+            records = [self._get_record(kind, key) for kind, key in self._dirty]
+            self._log_records += len(records)
+        self._dirty.clear()
+        return compact, records
+
+    def _write_log(self, filepath: Path, data: Tuple[bool, List[Tuple[str, Any, Any]]]) -> None:
+        compact, records = data
+        if compact:
+            # Rewrites the log such that it contains one record per entry
+            with _atomic_open(filepath) as file:
+                self._dump_record(file, _LOG_HEADER)
+                for record in records:
+                    self._dump_record(file, record)
+        elif records:
+            with filepath.open("ab") as file:
+                if file.seek(0, os.SEEK_END) == 0:
+                    self._dump_record(file, _LOG_HEADER)
+                for record in records:
+                    self._dump_record(file, record)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def _copy_data(self, kind: str) -> object:
+        """Returns a copy of the containers of the data of the given kind, which can be pickled
+        on a worker thread while the data is updated on the event loop. The values are not
+        copied, since they are replaced rather than modified by the update methods.
+        """
+        data = getattr(self, kind)
+        if kind == "conversations" and data is not None:
+            return {name: dict(conversation) for name, conversation in data.items()}
+        if isinstance(data, dict):
+            return dict(data)
+        return data
+
+    async def _dump_singlefile(self) -> None:
+        await self._dump(
+            self.filepath,
+            lambda: {
+                kind: self._copy_data(kind)
+                for kind in (
+                    "conversations",
+                    "user_data",
+                    "chat_data",
+                    "bot_data",
+                    "callback_data",
+                )
+            },
+        )
+
+    async def _dump_file(self, kind: str) -> None:
+        await self._dump(Path(f"{self.filepath}_{kind}"), lambda: self._copy_data(kind))
+
+    async def _dump(
+        self,
+        filepath: Path,
+        get_data: Callable[[], Any],
+        write: Optional[Callable[[Path, Any], None]] = None,
+    ) -> None:
+        """Writes the data returned by `get_data` to `filepath` on a worker thread, by default
+        with `_write_file`. While a file is written, all further calls for that file share a
+        single write, which starts once the running one is done and uses the data at that time.
+        Hence, at most one write per file is running and the data is never written more often
+        than needed.
+        """
+        scheduled = self._scheduled_writes.get(filepath)
+        if scheduled is None:
+            scheduled = self._scheduled_writes[filepath] = asyncio.create_task(
+                self._run_dump(
+                    filepath,
+                    get_data,
+                    write or self._write_file,
+                    self._running_writes.get(filepath),
+                )
+            )
+        await asyncio.shield(scheduled)
+
+    async def _run_dump(
+        self,
+        filepath: Path,
+        get_data: Callable[[], Any],
+        write: Callable[[Path, Any], None],
+        previous: Optional["asyncio.Task[None]"],
+    ) -> None:
+        if previous is not None:
+            # Errors of the previous write are raised to its callers
+            await asyncio.wait((previous,))
+        del self._scheduled_writes[filepath]
+        task = self._running_writes[filepath] = asyncio.current_task()  # type: ignore[assignment]
+        try:
+            data = get_data()
+            await asyncio.get_running_loop().run_in_executor(None, write, filepath, data)
+        finally:
+            if self._running_writes.get(filepath) is task:
+                del self._running_writes[filepath]
+
+    def _write_file(self, filepath: Path, data: object) -> None:
+        with _atomic_open(filepath) as file, compressing_writer(file, self.compression) as stream:
+            _BotPickler(self.bot, stream, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
 
     async def get_user_data(self) -> Dict[int, UD]:
         """Returns the user_data from the pickle file if it exists or an empty :obj:`dict`.
@@ -296,15 +769,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Returns:
             Dict[:obj:`int`, :obj:`dict`]: The restored user data.
         """
-        if self.user_data:
-            pass
-        elif not self.single_file:
-            data = self._load_file(Path(f"{self.filepath}_user_data"))
-            if not data:
-                data = {}
-            self.user_data = data
-        else:
-            self._load_singlefile()
+        await self._load("user_data")
         return deepcopy(self.user_data)  # type: ignore[arg-type]
 
     async def get_chat_data(self) -> Dict[int, CD]:
@@ -313,15 +778,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Returns:
             Dict[:obj:`int`, :obj:`dict`]: The restored chat data.
         """
-        if self.chat_data:
-            pass
-        elif not self.single_file:
-            data = self._load_file(Path(f"{self.filepath}_chat_data"))
-            if not data:
-                data = {}
-            self.chat_data = data
-        else:
-            self._load_singlefile()
+        await self._load("chat_data")
         return deepcopy(self.chat_data)  # type: ignore[arg-type]
 
     async def get_bot_data(self) -> BD:
@@ -331,15 +788,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Returns:
             :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`: The restored bot data.
         """
-        if self.bot_data:
-            pass
-        elif not self.single_file:
-            data = self._load_file(Path(f"{self.filepath}_bot_data"))
-            if not data:
-                data = self.context_types.bot_data()
-            self.bot_data = data
-        else:
-            self._load_singlefile()
+        await self._load("bot_data")
         return deepcopy(self.bot_data)  # type: ignore[return-value]
 
     async def get_callback_data(self) -> Optional[CDCData]:
@@ -352,15 +801,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             Dict[:obj:`str`, :obj:`str`]] | :obj:`None`: The restored metadata or :obj:`None`,
             if no data was stored.
         """
-        if self.callback_data:
-            pass
-        elif not self.single_file:
-            data = self._load_file(Path(f"{self.filepath}_callback_data"))
-            if not data:
-                data = None
-            self.callback_data = data
-        else:
-            self._load_singlefile()
+        await self._load("callback_data")
         if self.callback_data is None:
             return None
         return deepcopy(self.callback_data)
@@ -374,15 +815,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Returns:
             :obj:`dict`: The restored conversations for the handler.
         """
-        if self.conversations:
-            pass
-        elif not self.single_file:
-            data = self._load_file(Path(f"{self.filepath}_conversations"))
-            if not data:
-                data = {name: {}}
-            self.conversations = data
-        else:
-            self._load_singlefile()
+        await self._load("conversations")
         return self.conversations.get(name, {}).copy()  # type: ignore[union-attr]
 
     async def update_conversation(
@@ -396,16 +829,17 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             key (:obj:`tuple`): The key the state is changed for.
             new_state (:class:`object`): The new state for the given key.
         """
-        if not self.conversations:
-            self.conversations = {}
-        if self.conversations.setdefault(name, {}).get(key) == new_state:
+        await self._load("conversations")
+        if self.conversations.setdefault(name, {}).get(key) == new_state:  # type: ignore
             return
-        self.conversations[name][key] = new_state
-        if not self.on_flush:
+        self.conversations[name][key] = new_state  # type: ignore[index]
+        if self.incremental:
+            await self._mark_dirty("conversations", (name, key))
+        elif not self.on_flush:
             if not self.single_file:
-                self._dump_file(Path(f"{self.filepath}_conversations"), self.conversations)
+                await self._dump_file("conversations")
             else:
-                self._dump_singlefile()
+                await self._dump_singlefile()
 
     async def update_user_data(self, user_id: int, data: UD) -> None:
         """Will update the user_data and depending on :attr:`on_flush` save the pickle file.
@@ -414,16 +848,17 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             user_id (:obj:`int`): The user the data might have been changed for.
             data (:obj:`dict`): The :attr:`telegram.ext.Application.user_data` ``[user_id]``.
         """
-        if self.user_data is None:
-            self.user_data = {}
-        if self.user_data.get(user_id) == data:
+        await self._load("user_data")
+        if self.user_data.get(user_id) == data:  # type: ignore[union-attr]
             return
-        self.user_data[user_id] = data
-        if not self.on_flush:
+        self.user_data[user_id] = data  # type: ignore[index]
+        if self.incremental:
+            await self._mark_dirty("user_data", user_id)
+        elif not self.on_flush:
             if not self.single_file:
-                self._dump_file(Path(f"{self.filepath}_user_data"), self.user_data)
+                await self._dump_file("user_data")
             else:
-                self._dump_singlefile()
+                await self._dump_singlefile()
 
     async def update_chat_data(self, chat_id: int, data: CD) -> None:
         """Will update the chat_data and depending on :attr:`on_flush` save the pickle file.
@@ -432,16 +867,17 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             chat_id (:obj:`int`): The chat the data might have been changed for.
             data (:obj:`dict`): The :attr:`telegram.ext.Application.chat_data` ``[chat_id]``.
         """
-        if self.chat_data is None:
-            self.chat_data = {}
-        if self.chat_data.get(chat_id) == data:
+        await self._load("chat_data")
+        if self.chat_data.get(chat_id) == data:  # type: ignore[union-attr]
             return
-        self.chat_data[chat_id] = data
-        if not self.on_flush:
+        self.chat_data[chat_id] = data  # type: ignore[index]
+        if self.incremental:
+            await self._mark_dirty("chat_data", chat_id)
+        elif not self.on_flush:
             if not self.single_file:
-                self._dump_file(Path(f"{self.filepath}_chat_data"), self.chat_data)
+                await self._dump_file("chat_data")
             else:
-                self._dump_singlefile()
+                await self._dump_singlefile()
 
     async def update_bot_data(self, data: BD) -> None:
         """Will update the bot_data and depending on :attr:`on_flush` save the pickle file.
@@ -450,14 +886,17 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`): The
                 :attr:`telegram.ext.Application.bot_data`.
         """
+        await self._load("bot_data")
         if self.bot_data == data:
             return
         self.bot_data = data
-        if not self.on_flush:
+        if self.incremental:
+            await self._mark_dirty("bot_data")
+        elif not self.on_flush:
             if not self.single_file:
-                self._dump_file(Path(f"{self.filepath}_bot_data"), self.bot_data)
+                await self._dump_file("bot_data")
             else:
-                self._dump_singlefile()
+                await self._dump_singlefile()
 
     async def update_callback_data(self, data: CDCData) -> None:
         """Will update the callback_data (if changed) and depending on :attr:`on_flush` save the
@@ -470,14 +909,17 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
                 Dict[:obj:`str`, :class:`object`]]], Dict[:obj:`str`, :obj:`str`]]):
                 The relevant data to restore :class:`telegram.ext.CallbackDataCache`.
         """
+        await self._load("callback_data")
         if self.callback_data == data:
             return
         self.callback_data = data
-        if not self.on_flush:
+        if self.incremental:
+            await self._mark_dirty("callback_data")
+        elif not self.on_flush:
             if not self.single_file:
-                self._dump_file(Path(f"{self.filepath}_callback_data"), self.callback_data)
+                await self._dump_file("callback_data")
             else:
-                self._dump_singlefile()
+                await self._dump_singlefile()
 
     async def drop_chat_data(self, chat_id: int) -> None:
         """Will delete the specified key from the ``chat_data`` and depending on
@@ -488,15 +930,16 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Args:
             chat_id (:obj:`int`): The chat id to delete from the persistence.
         """
-        if self.chat_data is None:
-            return
-        self.chat_data.pop(chat_id, None)
+        await self._load("chat_data")
+        self.chat_data.pop(chat_id, None)  # type: ignore[union-attr]
 
-        if not self.on_flush:
+        if self.incremental:
+            await self._mark_dirty("chat_data", chat_id)
+        elif not self.on_flush:
             if not self.single_file:
-                self._dump_file(Path(f"{self.filepath}_chat_data"), self.chat_data)
+                await self._dump_file("chat_data")
             else:
-                self._dump_singlefile()
+                await self._dump_singlefile()
 
     async def drop_user_data(self, user_id: int) -> None:
         """Will delete the specified key from the ``user_data`` and depending on
@@ -507,15 +950,16 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Args:
             user_id (:obj:`int`): The user id to delete from the persistence.
         """
-        if self.user_data is None:
-            return
-        self.user_data.pop(user_id, None)
+        await self._load("user_data")
+        self.user_data.pop(user_id, None)  # type: ignore[union-attr]
 
-        if not self.on_flush:
+        if self.incremental:
+            await self._mark_dirty("user_data", user_id)
+        elif not self.on_flush:
             if not self.single_file:
-                self._dump_file(Path(f"{self.filepath}_user_data"), self.user_data)
+                await self._dump_file("user_data")
             else:
-                self._dump_singlefile()
+                await self._dump_singlefile()
 
     async def refresh_user_data(self, user_id: int, user_data: UD) -> None:
         """Does nothing.
@@ -531,6 +975,24 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_chat_data`
         """
 
+    async def load_user_data(self, user_id: int) -> Optional[UD]:
+        """Returns the user_data of a single user from the pickle file(s), if it was stored.
+
+        .. versionadded:: NEXT.VERSION
+        .. seealso:: :meth:`telegram.ext.BasePersistence.load_user_data`
+        """
+        await self._load("user_data")
+        return deepcopy(self.user_data.get(user_id))  # type: ignore[union-attr]
+
+    async def load_chat_data(self, chat_id: int) -> Optional[CD]:
+        """Returns the chat_data of a single chat from the pickle file(s), if it was stored.
+
+        .. versionadded:: NEXT.VERSION
+        .. seealso:: :meth:`telegram.ext.BasePersistence.load_chat_data`
+        """
+        await self._load("chat_data")
+        return deepcopy(self.chat_data.get(chat_id))  # type: ignore[union-attr]
+
     async def refresh_bot_data(self, bot_data: BD) -> None:
         """Does nothing.
 
@@ -540,7 +1002,9 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
 
     async def flush(self) -> None:
         """Will save all data in memory to pickle file(s)."""
-        if self.single_file:
+        if self.incremental:
+            await self._dump_log()
+        elif self.single_file:
             if (
                 self.user_data
                 or self.chat_data
@@ -548,15 +1012,15 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
                 or self.callback_data
                 or self.conversations
             ):
-                self._dump_singlefile()
+                await self._dump_singlefile()
         else:
             if self.user_data:
-                self._dump_file(Path(f"{self.filepath}_user_data"), self.user_data)
+                await self._dump_file("user_data")
             if self.chat_data:
-                self._dump_file(Path(f"{self.filepath}_chat_data"), self.chat_data)
+                await self._dump_file("chat_data")
             if self.bot_data:
-                self._dump_file(Path(f"{self.filepath}_bot_data"), self.bot_data)
+                await self._dump_file("bot_data")
             if self.callback_data:
-                self._dump_file(Path(f"{self.filepath}_callback_data"), self.callback_data)
+                await self._dump_file("callback_data")
             if self.conversations:
-                self._dump_file(Path(f"{self.filepath}_conversations"), self.conversations)
+                await self._dump_file("conversations")
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an implementation of the BaseRateLimiter class based on token buckets,
+which doesn't require any additional libraries.
+"""
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+
+from telegram._utils.logging import get_logger
+from telegram._utils.types import JSONDict
+from telegram.error import RetryAfter
+from telegram.ext._baseratelimiter import BaseRateLimiter
+
+_LOGGER = get_logger(__name__, class_name="SimpleRateLimiter")
+
+
+class _TokenBucket:
+    """Token bucket holding up to :paramref:`capacity` tokens, which is refilled with
+    :paramref:`rate` tokens per second.
+
+    Tokens are taken in advance: If the bucket is empty, :meth:`reserve` still takes a token, such
+    that the number of tokens becomes negative, and returns the time until the token is refilled.
+    That way, concurrent requests are served in the order of their arrival without keeping a queue
+    of waiters.
+    """
+
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity: float = capacity
+        self.rate: float = rate
+        self.tokens: float = capacity
+        self.updated: float = now
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Takes a token and returns the number of seconds to wait until it may be used."""
+        self._refill(now)
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0
+
+    def refund(self) -> None:
+        """Returns a token taken by :meth:`reserve` that won't be used."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def is_full(self, now: float) -> bool:
+        """Whether the bucket would be full at :paramref:`now`, i.e. doesn't limit anything."""
+        return self.tokens + (now - self.updated) * self.rate >= self.capacity
+
+
+class SimpleRateLimiter(BaseRateLimiter[int]):
+    """
+    Implementation of :class:`~telegram.ext.BaseRateLimiter` based on token buckets. Unlike
+    :class:`~telegram.ext.AIORateLimiter`, this class doesn't require any additional libraries.
+
+    The limits are applied like in :class:`~telegram.ext.AIORateLimiter`: Requests with a
+    ``chat_id`` parameter are limited by :paramref:`overall_max_rate` and requests to groups and
+    channels, i.e. with a negative or a ``@username`` ``chat_id``, are additionally limited by
+    :paramref:`group_max_rate` per group. The same caveats apply.
+
+    Each limit is a bucket holding up to ``max_rate`` tokens, which is refilled with
+    ``max_rate / time_period`` tokens per second, measured with :func:`time.monotonic`. Every
+    request takes one token. If the bucket is empty, the request waits until the token is
+    refilled. Waiting requests are processed in the order of their arrival.
+
+    The buckets of the groups are kept in least recently used order. Buckets that have been
+    refilled completely no longer limit anything and are dropped, starting from the least recently
+    used one. If there are more than :paramref:`max_groups` buckets, the least recently used one is
+    dropped as well. All of this takes constant time per request, regardless of the number of
+    groups.
+
+    .. seealso:: :wiki:`Avoiding Flood Limits <Avoiding-flood-limits>`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        overall_max_rate (:obj:`float`): The maximum number of requests allowed for the entire bot
+            per :paramref:`overall_time_period`. When set to 0, no rate limiting will be applied.
+            Defaults to ``30``.
+        overall_time_period (:obj:`float`): The time period (in seconds) during which the
+            :paramref:`overall_max_rate` is enforced.  When set to 0, no rate limiting will be
+            applied. Defaults to 1.
+        group_max_rate (:obj:`float`): The maximum number of requests allowed for requests related
+            to groups and channels per :paramref:`group_time_period`.  When set to 0, no rate
+            limiting will be applied. Defaults to 20.
+        group_time_period (:obj:`float`): The time period (in seconds) during which the
+            :paramref:`group_max_rate` is enforced.  When set to 0, no rate limiting will be
+            applied. Defaults to 60.
+        max_retries (:obj:`int`): The maximum number of retries to be made in case of a
+            :exc:`~telegram.error.RetryAfter` exception.
+            If set to 0, no retries will be made. Defaults to ``0``.
+        max_groups (:obj:`int`): The maximum number of groups whose buckets are kept. Defaults to
+            ``100_000``.
+
+    """
+
+    __slots__ = (
+        "_delayed_requests",
+        "_group_buckets",
+        "_group_max_rate",
+        "_group_rate",
+        "_max_groups",
+        "_max_retries",
+        "_max_wait_time",
+        "_overall_bucket",
+        "_queue_depth",
+        "_retry_after_event",
+        "_wait_time",
+    )
+
+    def __init__(
+        self,
+        overall_max_rate: float = 30,
+        overall_time_period: float = 1,
+        group_max_rate: float = 20,
+        group_time_period: float = 60,
+        max_retries: int = 0,
+        max_groups: int = 100_000,
+    ) -> None:
+        if overall_max_rate and overall_time_period:
+            self._overall_bucket: Optional[_TokenBucket] = _TokenBucket(
+                overall_max_rate, overall_max_rate / overall_time_period, time.monotonic()
+            )
+        else:
+            self._overall_bucket = None
+
+        if group_max_rate and group_time_period:
+            self._group_max_rate: float = group_max_rate
+            self._group_rate: float = group_max_rate / group_time_period
+        else:
+            self._group_max_rate = 0
+            self._group_rate = 0
+
+        self._group_buckets: OrderedDict[Union[str, int], _TokenBucket] = OrderedDict()
+        self._max_groups: int = max_groups
+        self._max_retries: int = max_retries
+        self._retry_after_event = asyncio.Event()
+        self._retry_after_event.set()
+
+        self._queue_depth: int = 0
+        self._delayed_requests: int = 0
+        self._wait_time: float = 0
+        self._max_wait_time: float = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """:obj:`int`: The number of requests that are currently waiting for the rate limits."""
+        return self._queue_depth
+
+    @property
+    def delayed_requests(self) -> int:
+        """:obj:`int`: The number of requests that had to wait for the rate limits so far."""
+        return self._delayed_requests
+
+    @property
+    def wait_time(self) -> float:
+        """:obj:`float`: The total number of seconds that requests waited for the rate limits.
+        Divide by :attr:`delayed_requests` for the average wait time of a delayed request.
+        """
+        return self._wait_time
+
+    @property
+    def max_wait_time(self) -> float:
+        """:obj:`float`: The longest time in seconds that a request waited for the rate limits."""
+        return self._max_wait_time
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def shutdown(self) -> None:
+        """Does nothing."""
+
+    def _get_group_bucket(self, group_id: Union[str, int], now: float) -> _TokenBucket:
+        buckets = self._group_buckets
+        bucket = buckets.get(group_id)
+        if bucket is not None:
+            buckets.move_to_end(group_id)
+            return bucket
+
+        # Drop the buckets that have been refilled completely, starting with the least recently
+        # used one. Each bucket is dropped at most once, so this takes constant amortized time
+        while buckets:
+            oldest_id = next(iter(buckets))
+            if len(buckets) < self._max_groups and not buckets[oldest_id].is_full(now):
+                break
+            del buckets[oldest_id]
+
+        bucket = buckets[group_id] = _TokenBucket(self._group_max_rate, self._group_rate, now)
+        return bucket
+
+    async def _wait_for(self, bucket: _TokenBucket) -> None:
+        now = time.monotonic()
+        delay = bucket.reserve(now)
+        if not delay:
+            return
+
+        self._queue_depth += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            bucket.refund()
+            raise
+        finally:
+            self._queue_depth -= 1
+            waited = time.monotonic() - now
+            self._delayed_requests += 1
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+
+    async def _run_request(
+        self,
+        chat: bool,
+        group: Union[str, int, bool],
+        callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, List[JSONDict]]]],
+        args: Any,
+        kwargs: Dict[str, Any],
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        if group and self._group_max_rate:
+            await self._wait_for(self._get_group_bucket(group, time.monotonic()))
+        if chat and self._overall_bucket:
+            await self._wait_for(self._overall_bucket)
+
+        # In case a retry_after was hit, we wait with processing the request
+        await self._retry_after_event.wait()
+
+        return await callback(*args, **kwargs)
+
+    # mypy doesn't understand that the last run of the for loop raises an exception
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, List[JSONDict]]]],
+        args: Any,
+        kwargs: Dict[str, Any],
+        endpoint: str,  # noqa: ARG002
+        data: Dict[str, Any],
+        rate_limit_args: Optional[int],
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        """
+        Processes a request by applying rate limiting.
+
+        See :meth:`telegram.ext.BaseRateLimiter.process_request` for detailed information on the
+        arguments.
+
+        Args:
+            rate_limit_args (:obj:`None` | :obj:`int`): If set, specifies the maximum number of
+                retries to be made in case of a :exc:`~telegram.error.RetryAfter` exception.
+                Defaults to :paramref:`SimpleRateLimiter.max_retries`.
+        """
+        max_retries = rate_limit_args or self._max_retries
+
+        group: Union[int, str, bool] = False
+        chat: bool = False
+        chat_id = data.get("chat_id")
+        if chat_id is not None:
+            chat = True
+
+        # In case user passes integer chat id as string
+        with contextlib.suppress(ValueError, TypeError):
+            chat_id = int(chat_id)
+
+        if (isinstance(chat_id, int) and chat_id < 0) or isinstance(chat_id, str):
+            # string chat_id only works for channels and supergroups
+            # We can't really tell channels from groups though ...
+            group = chat_id
+
+        for i in range(max_retries + 1):
+            try:
+                return await self._run_request(
+                    chat=chat, group=group, callback=callback, args=args, kwargs=kwargs
+                )
+            except RetryAfter as exc:
+                if i == max_retries:
+                    _LOGGER.exception(
+                        "Rate limit hit after maximum of %d retries", max_retries, exc_info=exc
+                    )
+                    raise
+
+                sleep = exc.retry_after + 0.1
+                _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
+                # Make sure we don't allow other requests to be processed
+                self._retry_after_event.clear()
+                await asyncio.sleep(sleep)
+            finally:
+                # Allow other requests to be processed
+                self._retry_after_event.set()
+        return None  # type: ignore[return-value]
@@ -0,0 +1,423 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the SQLitePersistence class."""
+import asyncio
+import io
+import json
+import pickle
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from telegram._utils.types import FilePathInput
+from telegram.ext import BasePersistence, PersistenceInput
+from telegram.ext._contexttypes import ContextTypes
+from telegram.ext._picklepersistence import _BotPickler, _BotUnpickler
+from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
+
+_RT = TypeVar("_RT")
+# A row of one of the tables is addressed by the name of the table and its primary key
+_RowKey = Tuple[str, Tuple[Union[int, str], ...]]
+
+_DELETED = object()
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS user_data (user_id INTEGER PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS chat_data (chat_id INTEGER PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS conversations (
+    name TEXT NOT NULL, key TEXT NOT NULL, state BLOB NOT NULL, PRIMARY KEY (name, key)
+);
+CREATE TABLE IF NOT EXISTS singletons (name TEXT PRIMARY KEY, data BLOB NOT NULL);
+"""
+_UPSERT_STATEMENTS: Dict[str, str] = {
+    "user_data": "INSERT OR REPLACE INTO user_data (user_id, data) VALUES (?, ?)",
+    "chat_data": "INSERT OR REPLACE INTO chat_data (chat_id, data) VALUES (?, ?)",
+    "conversations": "INSERT OR REPLACE INTO conversations (name, key, state) VALUES (?, ?, ?)",
+    "singletons": "INSERT OR REPLACE INTO singletons (name, data) VALUES (?, ?)",
+}
+_DELETE_STATEMENTS: Dict[str, str] = {
+    "user_data": "DELETE FROM user_data WHERE user_id = ?",
+    "chat_data": "DELETE FROM chat_data WHERE chat_id = ?",
+    "conversations": "DELETE FROM conversations WHERE name = ? AND key = ?",
+    "singletons": "DELETE FROM singletons WHERE name = ?",
+}
+_SELECT_STATEMENTS: Dict[str, str] = {
+    "user_data": "SELECT data FROM user_data WHERE user_id = ?",
+    "chat_data": "SELECT data FROM chat_data WHERE chat_id = ?",
+    "singletons": "SELECT data FROM singletons WHERE name = ?",
+}
+
+
+class SQLitePersistence(BasePersistence[UD, CD, BD]):
+    """Using python's builtin :mod:`sqlite3` for making your bot persistent.
+
+    The data of every user and chat, the bot data, the callback data and every conversation state
+    are stored in separate rows, pickled in the same way as :class:`PicklePersistence` does it.
+    Only changed rows are written: all changes of one run of
+    :meth:`telegram.ext.Application.update_persistence` are committed in a single transaction.
+    All database operations run on a dedicated thread, such that the event loop is never blocked.
+
+    Attention:
+        The interface provided by this class is intended to be accessed exclusively by
+        :class:`~telegram.ext.Application`. Calling any of the methods below manually might
+        interfere with the integration of persistence into :class:`~telegram.ext.Application`.
+
+    Tip:
+        This class implements :meth:`load_user_data` and :meth:`load_chat_data`, so the data of
+        users and chats can be loaded on first use with
+        :meth:`telegram.ext.ApplicationBuilder.lazy_data_loading` instead of at startup.
+
+    .. seealso:: :wiki:`Making Your Bot Persistent <Making-your-bot-persistent>`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        database (:obj:`str` | :obj:`pathlib.Path`): The path of the database file. It is created
+            if it does not exist.
+        store_data (:class:`~telegram.ext.PersistenceInput`, optional): Specifies which kinds of
+            data will be saved by this persistence instance. By default, all available kinds of
+            data will be saved.
+        update_interval (:obj:`int` | :obj:`float`, optional): The
+            :class:`~telegram.ext.Application` will update
+            the persistence in regular intervals. This parameter specifies the time (in seconds) to
+            wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
+        context_types (:class:`telegram.ext.ContextTypes`, optional): Pass an instance
+            of :class:`telegram.ext.ContextTypes` to customize the types used in the
+            ``context`` interface. If not passed, the defaults documented in
+            :class:`telegram.ext.ContextTypes` will be used.
+
+    Attributes:
+        database (:class:`pathlib.Path`): The path of the database file.
+        store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
+            be saved by this persistence instance.
+        context_types (:class:`telegram.ext.ContextTypes`): Container for the types used
+            in the ``context`` interface.
+    """
+
+    __slots__ = (
+        "_batch",
+        "_bot_data",
+        "_callback_data",
+        "_connection",
+        "_executor",
+        "context_types",
+        "database",
+    )
+
+    @overload
+    def __init__(
+        self: "SQLitePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]",
+        database: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+    ): ...
+
+    @overload
+    def __init__(
+        self: "SQLitePersistence[UD, CD, BD]",
+        database: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+    ): ...
+
+    def __init__(
+        self,
+        database: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+    ):
+        super().__init__(store_data=store_data, update_interval=update_interval)
+        self.database: Path = Path(database)
+        self.context_types: ContextTypes[Any, UD, CD, BD] = cast(
+            ContextTypes[Any, UD, CD, BD], context_types or ContextTypes()
+        )
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # only accessed from the thread of the executor
+        self._connection: Optional[sqlite3.Connection] = None
+        # The changes that will be committed in the next transaction, together with the task
+        # that commits them
+        self._batch: Optional[Tuple[Dict[_RowKey, object], asyncio.Task]] = None
+        # the last written versions, used to skip writing unchanged data
+        self._bot_data: Optional[BD] = None
+        self._callback_data: Optional[CDCData] = None
+
+    async def _run(self, function: Callable[..., _RT], *args: object) -> _RT:
+        """Runs :paramref:`function` on the database thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="SQLitePersistence"
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.database)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def _dumps(self, obj: object) -> bytes:
+        buffer = io.BytesIO()
+        _BotPickler(self.bot, buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+        return buffer.getvalue()
+
+    def _loads(self, data: bytes) -> Any:
+        try:
+            return _BotUnpickler(self.bot, io.BytesIO(data)).load()
+        except Exception as exc:
+            raise TypeError(f"Database {self.database.name} contains invalid pickle data") from exc
+
+    def _select_one(self, table: str, key: Union[int, str]) -> Any:
+        row = self._get_connection().execute(_SELECT_STATEMENTS[table], (key,)).fetchone()
+        return None if row is None else self._loads(row[0])
+
+    def _commit(self, changes: Dict[_RowKey, object]) -> None:
+        upserts: Dict[str, List[Tuple[Any, ...]]] = defaultdict(list)
+        deletes: Dict[str, List[Tuple[Any, ...]]] = defaultdict(list)
+        for (table, key), value in changes.items():
+            if value is _DELETED:
+                deletes[table].append(key)
+            else:
+                upserts[table].append((*key, self._dumps(value)))
+
+        connection = self._get_connection()
+        with connection:
+            for table, keys in deletes.items():
+                connection.executemany(_DELETE_STATEMENTS[table], keys)
+            for table, rows in upserts.items():
+                connection.executemany(_UPSERT_STATEMENTS[table], rows)
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def _write(self, table: str, key: Tuple[Union[int, str], ...], value: object) -> None:
+        """Adds a change to the current batch and waits until the batch is committed. All calls
+        made before the event loop gets to commit the batch end up in the same transaction, in
+        particular all calls of one run of :meth:`telegram.ext.Application.update_persistence`.
+        """
+        if self._batch is None:
+            changes: Dict[_RowKey, object] = {}
+            # The task only starts after the coroutines that are already scheduled ran
+            self._batch = (changes, asyncio.create_task(self._commit_batch(changes)))
+        self._batch[0][(table, key)] = value
+        await asyncio.shield(self._batch[1])
+
+    async def _commit_batch(self, changes: Dict[_RowKey, object]) -> None:
+        self._batch = None
+        await self._run(self._commit, changes)
+
+    def _load_table(self, table: str) -> Dict[int, Any]:
+        rows = self._get_connection().execute(f"SELECT * FROM {table}")  # noqa: S608
+        return {key: self._loads(data) for key, data in rows}
+
+    def _load_conversations(self, name: str) -> ConversationDict:
+        rows = self._get_connection().execute(
+            "SELECT key, state FROM conversations WHERE name = ?", (name,)
+        )
+        return {tuple(json.loads(key)): self._loads(state) for key, state in rows}
+
+    async def get_user_data(self) -> Dict[int, UD]:
+        """Returns the user_data from the database.
+
+        Returns:
+            Dict[:obj:`int`, :obj:`dict`]: The restored user data.
+        """
+        return await self._run(self._load_table, "user_data")
+
+    async def get_chat_data(self) -> Dict[int, CD]:
+        """Returns the chat_data from the database.
+
+        Returns:
+            Dict[:obj:`int`, :obj:`dict`]: The restored chat data.
+        """
+        return await self._run(self._load_table, "chat_data")
+
+    async def get_bot_data(self) -> BD:
+        """Returns the bot_data from the database if it exists or an empty object of type
+        :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`: The restored bot data.
+        """
+        bot_data = await self._run(self._select_one, "singletons", "bot_data")
+        self._bot_data = bot_data
+        if bot_data is None:
+            return self.context_types.bot_data()
+        return deepcopy(bot_data)
+
+    async def get_callback_data(self) -> Optional[CDCData]:
+        """Returns the callback data from the database if it exists or :obj:`None`.
+
+        Returns:
+            Tuple[List[Tuple[:obj:`str`, :obj:`float`, Dict[:obj:`str`, :class:`object`]]],
+            Dict[:obj:`str`, :obj:`str`]] | :obj:`None`: The restored metadata or :obj:`None`,
+            if no data was stored.
+        """
+        callback_data = await self._run(self._select_one, "singletons", "callback_data")
+        self._callback_data = callback_data
+        if callback_data is None:
+            return None
+        return deepcopy(callback_data)
+
+    async def get_conversations(self, name: str) -> ConversationDict:
+        """Returns the conversations of the handler from the database.
+
+        Args:
+            name (:obj:`str`): The handlers name.
+
+        Returns:
+            :obj:`dict`: The restored conversations for the handler.
+        """
+        return await self._run(self._load_conversations, name)
+
+    async def update_conversation(
+        self, name: str, key: ConversationKey, new_state: Optional[object]
+    ) -> None:
+        """Will update the state of the conversation in the database. Ended conversations are
+        deleted.
+
+        Args:
+            name (:obj:`str`): The handler's name.
+            key (:obj:`tuple`): The key the state is changed for.
+            new_state (:class:`object`): The new state for the given key.
+        """
+        row_key = (name, json.dumps(key))
+        await self._write("conversations", row_key, _DELETED if new_state is None else new_state)
+
+    async def update_user_data(self, user_id: int, data: UD) -> None:
+        """Will update the user_data in the database.
+
+        Args:
+            user_id (:obj:`int`): The user the data might have been changed for.
+            data (:obj:`dict`): The :attr:`telegram.ext.Application.user_data` ``[user_id]``.
+        """
+        await self._write("user_data", (user_id,), data)
+
+    async def update_chat_data(self, chat_id: int, data: CD) -> None:
+        """Will update the chat_data in the database.
+
+        Args:
+            chat_id (:obj:`int`): The chat the data might have been changed for.
+            data (:obj:`dict`): The :attr:`telegram.ext.Application.chat_data` ``[chat_id]``.
+        """
+        await self._write("chat_data", (chat_id,), data)
+
+    async def update_bot_data(self, data: BD) -> None:
+        """Will update the bot_data in the database, if it has changed.
+
+        Args:
+            data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`): The
+                :attr:`telegram.ext.Application.bot_data`.
+        """
+        if self._bot_data == data:
+            return
+        await self._write("singletons", ("bot_data",), data)
+        # Only remembered once committed, so that equal data is written again after a failure
+        self._bot_data = data
+
+    async def update_callback_data(self, data: CDCData) -> None:
+        """Will update the callback_data in the database, if it has changed.
+
+        Args:
+            data (Tuple[List[Tuple[:obj:`str`, :obj:`float`, \
+                Dict[:obj:`str`, :class:`object`]]], Dict[:obj:`str`, :obj:`str`]]):
+                The relevant data to restore :class:`telegram.ext.CallbackDataCache`.
+        """
+        if self._callback_data == data:
+            return
+        await self._write("singletons", ("callback_data",), data)
+        self._callback_data = data
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        """Will delete the specified chat from the database.
+
+        Args:
+            chat_id (:obj:`int`): The chat id to delete from the persistence.
+        """
+        await self._write("chat_data", (chat_id,), _DELETED)
+
+    async def drop_user_data(self, user_id: int) -> None:
+        """Will delete the specified user from the database.
+
+        Args:
+            user_id (:obj:`int`): The user id to delete from the persistence.
+        """
+        await self._write("user_data", (user_id,), _DELETED)
+
+    async def refresh_user_data(self, user_id: int, user_data: UD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_user_data`
+        """
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: CD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_chat_data`
+        """
+
+    async def load_user_data(self, user_id: int) -> Optional[UD]:
+        """Returns the stored data of a single user from the database.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.load_user_data`
+        """
+        return await self._run(self._select_one, "user_data", user_id)
+
+    async def load_chat_data(self, chat_id: int) -> Optional[CD]:
+        """Returns the stored data of a single chat from the database.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.load_chat_data`
+        """
+        return await self._run(self._select_one, "chat_data", chat_id)
+
+    async def refresh_bot_data(self, bot_data: BD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_bot_data`
+        """
+
+    async def flush(self) -> None:
+        """Waits for pending writes and closes the database connection. It is reopened on the
+        next access.
+        """
+        if self._batch is not None:
+            await asyncio.shield(self._batch[1])
+        if self._executor is not None:
+            await self._run(self._close)
+            self._executor.shutdown()
+            self._executor = None
@@ -27,6 +27,7 @@ Warning:
 """
 from typing import FrozenSet, Optional
 
+from telegram._update import Update
 from telegram._utils.types import SCT
 
 
@@ -48,3 +49,13 @@ def parse_username(username: Optional[SCT[str]]) -> FrozenSet[str]:
     if isinstance(username, str):
         return frozenset({username[1:] if username.startswith("@") else username})
     return frozenset({usr[1:] if usr.startswith("@") else usr for usr in username})
+
+
+def get_update_type(update: Update) -> Optional[str]:
+    """Returns the name of the attribute of :paramref:`update` that is set, i.e. one of
+    :attr:`telegram.Update.ALL_TYPES`, or :obj:`None` if the update is of an unknown type.
+    """
+    for update_type in Update.ALL_TYPES:
+        if getattr(update, update_type) is not None:
+            return update_type
+    return None
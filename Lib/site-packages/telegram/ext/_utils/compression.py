@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper functions for reading and writing compressed files as streams,
+such that the uncompressed data never needs to be held in memory as a whole.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import gzip
+import io
+import lzma
+import zlib
+from contextlib import nullcontext
+from pathlib import Path
+from typing import BinaryIO, ContextManager, Final, Optional, Tuple, Type
+
+COMPRESSIONS: Final[Tuple[str, ...]] = ("gzip", "lzma", "zlib")
+# zlib's default level. gzip defaults to the maximum level 9, which is much slower but hardly
+# smaller for pickled data
+_LEVEL: Final[int] = 6
+_CHUNK_SIZE: Final[int] = 64 * 1024
+_GZIP_MAGIC: Final[bytes] = b"\x1f\x8b"
+_XZ_MAGIC: Final[bytes] = b"\xfd7zXZ\x00"
+# Raised when reading corrupted files. Note that gzip.BadGzipFile is a subclass of OSError
+DECOMPRESSION_ERRORS: Final[Tuple[Type[Exception], ...]] = (
+    EOFError,
+    gzip.BadGzipFile,
+    lzma.LZMAError,
+    zlib.error,
+)
+
+
+class _ZlibWriter(io.RawIOBase):
+    """Compresses everything written to it into a zlib stream in :paramref:`file`. Closing it
+    doesn't close :paramref:`file`.
+    """
+
+    def __init__(self, file: BinaryIO):
+        super().__init__()
+        self._file = file
+        self._compressor = zlib.compressobj(_LEVEL)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._file.write(self._compressor.compress(data))
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._file.write(self._compressor.flush())
+        finally:
+            super().close()
+
+
+class _ZlibReader(io.RawIOBase):
+    """Decompresses the zlib stream in :paramref:`file` chunk by chunk while it is read."""
+
+    def __init__(self, file: BinaryIO):
+        super().__init__()
+        self._file = file
+        self._decompressor = zlib.decompressobj()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:  # type: ignore[override]
+        while not self._decompressor.eof:
+            if self._decompressor.unconsumed_tail:
+                compressed = self._decompressor.unconsumed_tail
+            else:
+                compressed = self._file.read(_CHUNK_SIZE)
+                if not compressed:
+                    raise EOFError("Compressed file ended before the end of the stream")
+            data = self._decompressor.decompress(compressed, len(buffer))
+            if data:
+                buffer[: len(data)] = data
+                return len(data)
+        return 0
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file.close()
+            super().close()
+
+
+def compressing_writer(file: BinaryIO, compression: Optional[str]) -> ContextManager[BinaryIO]:
+    """Returns a context manager for writing to :paramref:`file`, compressing with
+    :paramref:`compression`, if given. Leaving the context finishes the compressed stream, but
+    doesn't close :paramref:`file`.
+    """
+    if compression is None:
+        return nullcontext(file)
+    if compression == "gzip":
+        # Passing the filename explicitly keeps the name of a temporary file out of the header
+        return gzip.GzipFile(  # type: ignore[return-value]
+            filename="", mode="wb", compresslevel=_LEVEL, fileobj=file
+        )
+    if compression == "lzma":
+        return lzma.LZMAFile(file, "wb")  # type: ignore[return-value]
+    if compression == "zlib":
+        return io.BufferedWriter(_ZlibWriter(file), _CHUNK_SIZE)  # type: ignore[return-value]
+    raise ValueError(f"Unknown compression {compression!r}. Choose one of {COMPRESSIONS}.")
+
+
+def open_for_reading(path: Path) -> BinaryIO:
+    """Opens :paramref:`path` for reading. The compression, if any, is detected from the first
+    bytes of the file, so files can be read regardless of the compression they were written with.
+    """
+    with path.open("rb") as file:
+        head = file.read(len(_XZ_MAGIC))
+    if head.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if head.startswith(_XZ_MAGIC):
+        return lzma.open(path, "rb")  # type: ignore[return-value]
+    # The first two bytes of a zlib stream with the default window size, as number, are a
+    # multiple of 31. Pickles of protocol 2 and newer start with 0x80 instead.
+    if len(head) >= 2 and head[0] == 0x78 and int.from_bytes(head[:2], "big") % 31 == 0:
+        return io.BufferedReader(_ZlibReader(path.open("rb")), _CHUNK_SIZE)  # type: ignore
+    return path.open("rb")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the DataCache class, which holds the user and chat data of the
+application when they are loaded lazily from the persistence.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import asyncio
+import time
+from collections.abc import MutableMapping
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    OrderedDict,
+    Set,
+    TypeVar,
+)
+
+_VT = TypeVar("_VT")
+_MISSING = object()
+
+
+class DataCache(OrderedDict[int, _VT]):
+    """Mapping of ids to the user or chat data, ordered from least to most recently used.
+
+    Like :class:`collections.defaultdict`, accessing a missing id inserts a new default value.
+    Data are loaded from the persistence with :meth:`load`, which inserts the stored value or
+    merges it into a value that was inserted in the meantime. While an id is :meth:`acquired
+    <acquire>`, it is not evicted by :meth:`evict`.
+    """
+
+    __slots__ = (
+        "_default_factory",
+        "_in_use",
+        "_last_used",
+        "_loading",
+        "_without_entry",
+        "loaded",
+    )
+
+    def __init__(self, default_factory: Callable[[], _VT]):
+        super().__init__()
+        self._default_factory: Callable[[], _VT] = default_factory
+        # the ids whose data is in memory are authoritative, i.e. must not be loaded again
+        self.loaded: Set[int] = set()
+        self._loading: Dict[int, asyncio.Future] = {}
+        self._in_use: Dict[int, int] = {}
+        # time.monotonic() of the last use of each id. Ascending in the order of the mapping
+        self._last_used: Dict[int, float] = {}
+        # ids in `loaded` that may have no entry, e.g. because it was removed with pop(), see
+        # `evict`
+        self._without_entry: Set[int] = set()
+
+    def __missing__(self, key: int) -> _VT:
+        value = self[key] = self._default_factory()
+        self._last_used[key] = time.monotonic()
+        return value
+
+    def __delitem__(self, key: int) -> None:
+        super().__delitem__(key)
+        self._last_used.pop(key, None)
+
+    def pop(self, key: int, default: Any = _MISSING) -> Any:
+        # OrderedDict.pop doesn't call __delitem__
+        if key in self:
+            self._last_used.pop(key, None)
+            if key in self.loaded:
+                self._without_entry.add(key)
+        if default is _MISSING:
+            return super().pop(key)
+        return super().pop(key, default)
+
+    def _touch(self, key: int) -> None:
+        self.move_to_end(key)
+        self._last_used[key] = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    async def load(self, key: int, loader: Callable[[int], Awaitable[Optional[_VT]]]) -> None:
+        """Loads the data of :paramref:`key` with :paramref:`loader` unless it was already loaded
+        and marks it as most recently used. Concurrent calls for the same id wait for the same
+        call of :paramref:`loader`.
+        """
+        if key in self.loaded:
+            if key in self:
+                self._touch(key)
+            return
+        if key in self._loading:
+            await asyncio.shield(self._loading[key])
+            return
+
+        future = self._loading[key] = asyncio.get_running_loop().create_future()
+        try:
+            stored = await loader(key)
+        except Exception as exc:
+            future.set_exception(exc)
+            # the exception is raised in the concurrent calls, if any, but not in the future
+            future.exception()
+            raise
+        else:
+            future.set_result(None)
+        finally:
+            del self._loading[key]
+
+        self.loaded.add(key)
+        if stored is None:
+            pass
+        elif key not in self:
+            self[key] = stored
+        elif isinstance(current := self[key], MutableMapping):
+            # Values set while loading are newer than the stored ones
+            for name, value in stored.items():  # type: ignore[attr-defined]
+                current.setdefault(name, value)
+        else:
+            self[key] = stored
+        if key in self:
+            self._touch(key)
+        else:
+            self._without_entry.add(key)
+
+    def acquire(self, key: int) -> None:
+        """Protects the data of :paramref:`key` from eviction until :meth:`release` is called."""
+        self._in_use[key] = self._in_use.get(key, 0) + 1
+
+    def release(self, key: int) -> None:
+        count = self._in_use.pop(key) - 1
+        if count:
+            self._in_use[key] = count
+
+    def evict(
+        self,
+        max_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        keep: Collection[int] = (),
+    ) -> List[int]:
+        """Removes the least recently used data until at most :paramref:`max_size` entries are
+        left, as well as all data that was not used for :paramref:`idle_timeout` seconds. Data
+        that is acquired, currently loading or contained in :paramref:`keep` is never removed.
+
+        Returns:
+            List[:obj:`int`]: The removed ids.
+        """
+        evicted: List[int] = []
+        excess = len(self) - max_size if max_size is not None else 0
+        idle_since = time.monotonic() - idle_timeout if idle_timeout is not None else None
+        if excess > 0 or idle_since is not None:
+            # Only the least recently used entries are visited. The mapping is not copied, as
+            # that would cost as much as the number of all entries on every run
+            for key in self:
+                if len(evicted) >= excess and (
+                    idle_since is None or self._last_used.get(key, 0) > idle_since
+                ):
+                    # all following entries were used more recently
+                    break
+                if key in self._in_use or key in self._loading or key in keep:
+                    continue
+                evicted.append(key)
+            for key in evicted:
+                del self[key]
+                self.loaded.discard(key)
+
+        # ids whose data was dropped from memory no longer need to be protected from loading,
+        # once the drop is persisted
+        for key in [key for key in self._without_entry if key not in keep]:
+            self._without_entry.discard(key)
+            if key not in self:
+                self.loaded.discard(key)
+        return evicted
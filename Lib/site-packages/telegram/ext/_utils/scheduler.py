@@ -0,0 +1,543 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the scheduler of :class:`telegram.ext.SimpleJobQueue`, which runs jobs
+on timers of the asyncio event loop without depending on APScheduler.
+
+The scheduler and its jobs provide the parts of the interface of
+:class:`apscheduler.schedulers.asyncio.AsyncIOScheduler` and :class:`apscheduler.job.Job` that
+:class:`telegram.ext.JobQueue` and :class:`telegram.ext.Job` rely on, such that the scheduling
+methods of :class:`telegram.ext.JobQueue` work with both.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import asyncio
+import calendar
+import datetime
+import heapq
+import inspect
+import itertools
+import math
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from telegram._utils.logging import get_logger
+
+_LOGGER = get_logger(__name__, class_name="SimpleJobQueue")
+_UTC: Final[datetime.timezone] = datetime.timezone.utc
+_WEEKDAYS: Final[Tuple[str, ...]] = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+# Upper bound of the days to search for the next run of a cron job. The longest gap between two
+# matching days is the one between two 31st of a month
+_MAX_CRON_DAYS: Final[int] = 62
+# The event loop measures time with a monotonic clock, while jobs are scheduled in wall-clock
+# time. Waking up at least this often keeps the two from drifting apart for long.
+_MAX_WAIT: Final[float] = 600
+# The heap is rebuilt once more than this share of its entries belongs to removed jobs
+_MAX_STALE_SHARE: Final[float] = 0.5
+_job_ids: Iterator[int] = itertools.count()
+
+_HeapEntry = Tuple[float, int, "ScheduledJob"]
+
+
+def localize(date_time: datetime.datetime, tzinfo: datetime.tzinfo) -> datetime.datetime:
+    """Attaches :paramref:`tzinfo` to the naive :paramref:`date_time`. ``pytz`` time zones must
+    be attached with their ``localize`` method to pick the correct UTC offset.
+    """
+    if hasattr(tzinfo, "localize"):
+        return tzinfo.localize(date_time)  # type: ignore[no-any-return]
+    return date_time.replace(tzinfo=tzinfo)
+
+
+def _to_utc(date_time: datetime.datetime, tzinfo: datetime.tzinfo) -> datetime.datetime:
+    if date_time.tzinfo is None:
+        date_time = localize(date_time, tzinfo)
+    return date_time.astimezone(_UTC)
+
+
+class DateTrigger:
+    """Fires once at :paramref:`run_date`."""
+
+    __slots__ = ("run_date",)
+
+    def __init__(self, run_date: datetime.datetime):
+        self.run_date: datetime.datetime = run_date
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} (run_date='{self.run_date}')>"
+
+    def get_next_fire_time(
+        self, previous_fire_time: Optional[datetime.datetime], now: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        return None if previous_fire_time else self.run_date
+
+
+class IntervalTrigger:
+    """Fires every :paramref:`interval`, starting at :paramref:`start_date` and ending at
+    :paramref:`end_date`, if given. Missed runs are skipped.
+    """
+
+    __slots__ = ("end_date", "interval", "start_date")
+
+    def __init__(
+        self,
+        interval: datetime.timedelta,
+        start_date: datetime.datetime,
+        end_date: Optional[datetime.datetime] = None,
+    ):
+        if interval <= datetime.timedelta(0):
+            raise ValueError("The interval must be positive")
+        self.interval: datetime.timedelta = interval
+        self.start_date: datetime.datetime = start_date
+        self.end_date: Optional[datetime.datetime] = end_date
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} (interval={self.interval!r})>"
+
+    def get_next_fire_time(
+        self, previous_fire_time: Optional[datetime.datetime], now: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        next_fire_time = (
+            previous_fire_time + self.interval if previous_fire_time else self.start_date
+        )
+        if next_fire_time < now:
+            next_fire_time += math.ceil((now - next_fire_time) / self.interval) * self.interval
+        if self.end_date and next_fire_time > self.end_date:
+            return None
+        return next_fire_time
+
+
+class CronTrigger:
+    """Fires at :paramref:`time_of_day` on the days of the week in :paramref:`weekdays`
+    (``0-6`` correspond to monday - sunday) and on the :paramref:`day` of the month, where ``-1``
+    is the last day of the month.
+    """
+
+    __slots__ = ("day", "time_of_day", "timezone", "weekdays")
+
+    def __init__(
+        self,
+        time_of_day: datetime.time,
+        timezone: datetime.tzinfo,
+        weekdays: Optional[FrozenSet[int]] = None,
+        day: Optional[int] = None,
+    ):
+        self.time_of_day: datetime.time = time_of_day
+        self.timezone: datetime.tzinfo = timezone
+        self.weekdays: Optional[FrozenSet[int]] = weekdays
+        self.day: Optional[int] = day
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} (time_of_day='{self.time_of_day}', "
+            f"weekdays={sorted(self.weekdays or range(7))}, day={self.day})>"
+        )
+
+    def _matches(self, date: datetime.date) -> bool:
+        if self.weekdays is not None and date.weekday() not in self.weekdays:
+            return False
+        if self.day == -1:
+            return date.day == calendar.monthrange(date.year, date.month)[1]
+        return self.day is None or date.day == self.day
+
+    def get_next_fire_time(
+        self, previous_fire_time: Optional[datetime.datetime], now: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        earliest = now
+        if previous_fire_time:
+            earliest = max(now, previous_fire_time + datetime.timedelta(microseconds=1))
+        date = earliest.astimezone(self.timezone).date()
+        for _ in range(_MAX_CRON_DAYS):
+            if self._matches(date):
+                fire_time = localize(
+                    datetime.datetime.combine(date, self.time_of_day), self.timezone
+                )
+                if fire_time >= earliest:
+                    return fire_time
+            date += datetime.timedelta(days=1)
+        return None
+
+
+def _create_cron_trigger(
+    timezone: datetime.tzinfo,
+    day_of_week: Optional[str] = None,
+    day: Union[int, str, None] = None,
+    hour: int = 0,
+    minute: int = 0,
+    second: int = 0,
+) -> CronTrigger:
+    weekdays = None
+    if day_of_week is not None and day_of_week != "*":
+        weekdays = frozenset(_WEEKDAYS.index(name.strip()) for name in day_of_week.split(","))
+    return CronTrigger(
+        datetime.time(hour, minute, second),
+        timezone,
+        weekdays=weekdays,
+        day=-1 if day == "last" else None if day is None else int(day),
+    )
+
+
+class ScheduledJob:
+    """A job of the :class:`Scheduler`. Like :class:`apscheduler.job.Job`, it calls :attr:`func`
+    with :attr:`args` and :attr:`kwargs` whenever its :attr:`trigger` fires.
+    """
+
+    __slots__ = (
+        "_entry",
+        "_next_fire_time",
+        "_running",
+        "_scheduler",
+        "args",
+        "func",
+        "id",
+        "kwargs",
+        "max_instances",
+        "misfire_grace_time",
+        "name",
+        "timezone",
+        "trigger",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        scheduler: "Scheduler",
+        func: Callable[..., object],
+        trigger: Any,
+        args: Tuple[object, ...],
+        kwargs: Dict[str, object],
+        job_id: str,
+        name: str,
+        timezone: datetime.tzinfo,
+        max_instances: int,
+        misfire_grace_time: Optional[float],
+    ):
+        self._scheduler: Scheduler = scheduler
+        self.func: Callable[..., object] = func
+        self.trigger: Any = trigger
+        self.args: Tuple[object, ...] = args
+        self.kwargs: Dict[str, object] = kwargs
+        self.id: str = job_id  # pylint: disable=invalid-name
+        self.name: str = name
+        self.timezone: datetime.tzinfo = timezone
+        self.max_instances: int = max_instances
+        self.misfire_grace_time: Optional[float] = misfire_grace_time
+        self._next_fire_time: Optional[datetime.datetime] = None
+        # The heap entry of the next run. Entries of removed or rescheduled jobs are left in the
+        # heap and recognized by not being the entry of their job anymore
+        self._entry: Optional[_HeapEntry] = None
+        self._running = 0
+
+    def __repr__(self) -> str:
+        return f"<Job (id={self.id} name={self.name})>"
+
+    @property
+    def next_run_time(self) -> Optional[datetime.datetime]:
+        """:obj:`datetime.datetime`: The time of the next run in :attr:`timezone` or
+        :obj:`None`, if the job is paused or won't run again.
+        """
+        if self._next_fire_time is None:
+            return None
+        return self._next_fire_time.astimezone(self.timezone)
+
+    def pause(self) -> None:
+        self._scheduler.pause_job(self.id)
+
+    def resume(self) -> None:
+        self._scheduler.resume_job(self.id)
+
+    def remove(self) -> None:
+        self._scheduler.remove_job(self.id)
+
+    def reschedule(self, trigger: Any, **trigger_args: Any) -> None:
+        self._scheduler.reschedule_job(self.id, trigger, **trigger_args)
+
+
+class Scheduler:
+    """Schedules jobs on a heap ordered by their next run time, such that adding a job takes
+    O(log n) time and removing it amortized O(1). A single timer of the event loop waits for the
+    earliest run. Jobs that are due run in their own task.
+
+    Missed runs, e.g. because the event loop was blocked, are coalesced into one run. Runs that
+    are late by more than the ``misfire_grace_time`` of their job are skipped. A run is also
+    skipped while ``max_instances`` runs of the job are still running.
+    """
+
+    __slots__ = (
+        "_handle",
+        "_heap",
+        "_jobs",
+        "_stale",
+        "_tasks",
+        "_wakeup_at",
+        "running",
+        "timezone",
+    )
+
+    def __init__(self, timezone: datetime.tzinfo = _UTC):
+        self.timezone: datetime.tzinfo = timezone
+        self.running: bool = False
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[_HeapEntry] = []
+        self._stale = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._wakeup_at: Optional[float] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def configure(self, timezone: datetime.tzinfo = _UTC) -> None:
+        self.timezone = timezone
+
+    def _create_trigger(
+        self, trigger: Any, timezone: datetime.tzinfo, trigger_args: Dict[str, Any]
+    ) -> Any:
+        if not isinstance(trigger, str):
+            # Any object implementing the interface of apscheduler.triggers.base.BaseTrigger
+            if not hasattr(trigger, "get_next_fire_time") or trigger_args:
+                raise TypeError(
+                    "trigger must be 'date', 'interval', 'cron' or an object with a "
+                    "get_next_fire_time method"
+                )
+            return trigger
+        try:
+            if trigger == "date":
+                return DateTrigger(_to_utc(trigger_args.pop("run_date"), timezone))
+            if trigger == "interval":
+                start_date = trigger_args.pop("start_date", None)
+                end_date = trigger_args.pop("end_date", None)
+                interval = datetime.timedelta(**trigger_args)
+                trigger_args.clear()
+                return IntervalTrigger(
+                    interval,
+                    (
+                        _to_utc(start_date, timezone)
+                        if start_date
+                        else datetime.datetime.now(_UTC) + interval
+                    ),
+                    _to_utc(end_date, timezone) if end_date else None,
+                )
+            if trigger == "cron":
+                cron_trigger = _create_cron_trigger(timezone, **trigger_args)
+                trigger_args.clear()
+                return cron_trigger
+        except (KeyError, TypeError) as exc:
+            raise TypeError(
+                f"Unsupported arguments for the {trigger!r} trigger of SimpleJobQueue: {exc}"
+            ) from exc
+        raise ValueError(f"Unsupported trigger {trigger!r}. Use 'date', 'interval' or 'cron'.")
+
+    def add_job(  # pylint: disable=too-many-arguments
+        self,
+        func: Callable[..., object],
+        trigger: Any = "date",
+        args: Tuple[object, ...] = (),
+        kwargs: Optional[Dict[str, object]] = None,
+        id: Optional[str] = None,  # pylint: disable=redefined-builtin
+        name: Optional[str] = None,
+        misfire_grace_time: Optional[float] = None,
+        max_instances: int = 1,
+        replace_existing: bool = False,
+        timezone: Optional[datetime.tzinfo] = None,
+        **trigger_args: Any,
+    ) -> ScheduledJob:
+        """Adds a job, accepting the arguments of
+        :meth:`apscheduler.schedulers.base.BaseScheduler.add_job` that are listed here.
+        ``trigger`` may be ``"date"`` with ``run_date``, ``"interval"`` with ``start_date``,
+        ``end_date`` and the arguments of :class:`datetime.timedelta`, ``"cron"`` with
+        ``day_of_week``, ``day``, ``hour``, ``minute`` and ``second`` or a trigger object of
+        APScheduler.
+        """
+        if id is not None and id in self._jobs:
+            if not replace_existing:
+                raise ValueError(f"A job with the id {id!r} already exists")
+            self.remove_job(id)
+
+        timezone = timezone or self.timezone
+        job = ScheduledJob(
+            self,
+            func,
+            self._create_trigger(trigger, timezone, dict(trigger_args)),
+            tuple(args),
+            kwargs or {},
+            id or f"{next(_job_ids):x}",
+            name or getattr(func, "__name__", repr(func)),
+            timezone,
+            max_instances,
+            misfire_grace_time,
+        )
+        next_fire_time = job.trigger.get_next_fire_time(None, datetime.datetime.now(_UTC))
+        self._jobs[job.id] = job
+        if next_fire_time is None:
+            # APScheduler also removes jobs that will never run right away
+            del self._jobs[job.id]
+        else:
+            self._push(job, next_fire_time)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ScheduledJob]:
+        return self._jobs.get(job_id)
+
+    def get_jobs(self) -> List[ScheduledJob]:
+        """Returns the jobs ordered by their next run time, with paused jobs last."""
+        return sorted(
+            self._jobs.values(),
+            key=lambda job: (job._next_fire_time is None, job._entry[:2] if job._entry else ()),
+        )
+
+    def remove_job(self, job_id: str) -> None:
+        """Removes the job. Removing a job that was already removed does nothing."""
+        job = self._jobs.pop(job_id, None)
+        if job is not None:
+            self._pop(job)
+
+    def pause_job(self, job_id: str) -> None:
+        self._pop(self._jobs[job_id])
+
+    def resume_job(self, job_id: str) -> None:
+        job = self._jobs[job_id]
+        if job._entry is not None:
+            return
+        next_fire_time = job.trigger.get_next_fire_time(None, datetime.datetime.now(_UTC))
+        if next_fire_time is None:
+            self.remove_job(job_id)
+        else:
+            self._push(job, next_fire_time)
+
+    def reschedule_job(self, job_id: str, trigger: Any = "date", **trigger_args: Any) -> None:
+        job = self._jobs[job_id]
+        job.trigger = self._create_trigger(trigger, job.timezone, trigger_args)
+        self._pop(job)
+        self.resume_job(job_id)
+
+    def _push(self, job: ScheduledJob, next_fire_time: datetime.datetime) -> None:
+        if job._entry is not None:
+            self._pop(job)
+        job._next_fire_time = next_fire_time
+        entry = job._entry = (next_fire_time.timestamp(), next(_job_ids), job)
+        heapq.heappush(self._heap, entry)
+        if self._wakeup_at is None or entry[0] < self._wakeup_at:
+            self._schedule_wakeup()
+
+    def _pop(self, job: ScheduledJob) -> None:
+        job._next_fire_time = None
+        if job._entry is None:
+            return
+        job._entry = None
+        self._stale += 1
+        if self._stale > len(self._heap) * _MAX_STALE_SHARE:
+            self._heap = [entry for entry in self._heap if entry[2]._entry is entry]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _schedule_wakeup(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._wakeup_at = None
+        if not self.running or not self._heap:
+            return
+        self._wakeup_at = self._heap[0][0]
+        delay = min(max(self._wakeup_at - time.time(), 0), _MAX_WAIT)
+        self._handle = asyncio.get_running_loop().call_later(delay, self._process_jobs)
+
+    def _process_jobs(self) -> None:
+        self._handle = None
+        # the timer is scheduled once all due jobs are processed
+        self._wakeup_at = -math.inf
+        now = datetime.datetime.now(_UTC)
+        timestamp = now.timestamp()
+        while self._heap and self._heap[0][0] <= timestamp:
+            entry = heapq.heappop(self._heap)
+            job = entry[2]
+            if job._entry is not entry:
+                self._stale -= 1
+                continue
+            job._entry = None
+            fire_time = job._next_fire_time
+            next_fire_time = job.trigger.get_next_fire_time(fire_time, now)
+            # coalesce missed runs
+            while next_fire_time is not None and fire_time < next_fire_time < now:
+                fire_time, next_fire_time = next_fire_time, job.trigger.get_next_fire_time(
+                    next_fire_time, now
+                )
+            self._run_job(job, fire_time, now)  # type: ignore[arg-type]
+            if next_fire_time is None:
+                job._next_fire_time = None
+                self._jobs.pop(job.id, None)
+            else:
+                self._push(job, next_fire_time)
+        self._schedule_wakeup()
+
+    def _run_job(
+        self, job: ScheduledJob, fire_time: datetime.datetime, now: datetime.datetime
+    ) -> None:
+        if job.misfire_grace_time is not None and (
+            (now - fire_time).total_seconds() > job.misfire_grace_time
+        ):
+            _LOGGER.warning("Run time of job %r was missed by %s", job, now - fire_time)
+            return
+        if job._running >= job.max_instances:
+            _LOGGER.warning(
+                "Execution of job %r skipped: maximum number of running instances reached (%d)",
+                job,
+                job.max_instances,
+            )
+            return
+        job._running += 1
+        task = asyncio.create_task(self._run_func(job), name=f"SimpleJobQueue:{job.id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run_func(job: ScheduledJob) -> None:
+        try:
+            result = job.func(*job.args, **job.kwargs)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            _LOGGER.exception("Job %r raised an exception", job)
+        finally:
+            job._running -= 1
+
+    def start(self) -> None:
+        self.running = True
+        self._schedule_wakeup()
+
+    async def shutdown(self, wait: bool = True) -> None:
+        """Stops running jobs. Waits for the currently running jobs to finish if :paramref:`wait`
+        is :obj:`True` and cancels them otherwise.
+        """
+        self.running = False
+        self._schedule_wakeup()
+        if not wait:
+            for task in self._tasks:
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
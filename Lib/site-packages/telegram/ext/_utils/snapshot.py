@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a faster alternative to :func:`copy.deepcopy` for taking snapshots of
+the data handed over to the persistence.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import datetime
+import decimal
+import gc
+from copy import deepcopy
+from typing import Any, Dict, FrozenSet, TypeVar
+
+_T = TypeVar("_T")
+
+# Immutable types whose instances can be shared between the original and the snapshot. Same as
+# the types that copy.deepcopy treats as atomic, plus some common immutable ones.
+_IMMUTABLE_TYPES: FrozenSet[type] = frozenset(
+    {
+        type(None),
+        type(Ellipsis),
+        type(NotImplemented),
+        bool,
+        bytes,
+        complex,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        decimal.Decimal,
+        float,
+        int,
+        range,
+        str,
+        type,
+    }
+)
+_MISSING = object()
+
+
+def snapshot(obj: _T) -> _T:
+    """Returns a deep copy of :paramref:`obj`, just like :func:`copy.deepcopy`.
+
+    Builtin containers and immutable values, which usually make up most of ``user_data``,
+    ``chat_data`` and ``bot_data``, are handled without the overhead of :func:`copy.deepcopy`.
+    All other objects are copied by :func:`copy.deepcopy`, sharing the memo, so that objects
+    referenced multiple times are copied once, just like with :func:`copy.deepcopy`.
+
+    The garbage collector is paused while copying. Otherwise, the many new containers trigger
+    collections that repeatedly traverse the growing copy, which costs about as much as the
+    copying itself for large data.
+    """
+    if not gc.isenabled():
+        return _snapshot(obj, {})
+
+    gc.disable()
+    try:
+        return _snapshot(obj, {})
+    finally:
+        gc.enable()
+
+
+def _snapshot(obj: Any, memo: Dict[int, Any]) -> Any:
+    # pylint: disable=too-many-return-statements,unidiomatic-typecheck
+    cls = type(obj)
+    if cls in _IMMUTABLE_TYPES:
+        return obj
+
+    copied = memo.get(id(obj), _MISSING)
+    if copied is not _MISSING:
+        return copied
+
+    if cls is dict:
+        result: Any = {}
+        memo[id(obj)] = result
+        # calling _snapshot only for values that are not immutable saves most of the calls
+        for key, value in obj.items():
+            if type(key) not in _IMMUTABLE_TYPES:
+                key = _snapshot(key, memo)  # noqa: PLW2901
+            if type(value) not in _IMMUTABLE_TYPES:
+                value = _snapshot(value, memo)  # noqa: PLW2901
+            result[key] = value
+        return result
+
+    if cls is list:
+        result = obj.copy()
+        memo[id(obj)] = result
+        for index, item in enumerate(obj):
+            if type(item) not in _IMMUTABLE_TYPES:
+                result[index] = _snapshot(item, memo)
+        return result
+
+    if cls is tuple or cls is frozenset:
+        items = [_snapshot(item, memo) for item in obj]
+        # a tuple may contain itself through a mutable container
+        copied = memo.get(id(obj), _MISSING)
+        if copied is not _MISSING:
+            return copied
+        if all(item is original for item, original in zip(items, obj)):
+            result = obj
+        else:
+            result = cls(items)
+        memo[id(obj)] = result
+        return result
+
+    if cls is set:
+        result = {_snapshot(item, memo) for item in obj}
+        memo[id(obj)] = result
+        return result
+
+    return deepcopy(obj, memo)
@@ -14,11 +14,24 @@ Press Ctrl-C on the command line or send a signal to the process to stop the
 bot.
 """
 
+import asyncio
+import copy
+import csv
+import hashlib
 import logging
 import json
+import os
+import pickle
+import tempfile
+import uuid
+from collections import defaultdict
+from pathlib import Path
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.constants import FileSizeLimit, InlineKeyboardMarkupLimit
+from telegram.error import BadRequest
 from telegram.ext import (
     Application,
+    BasePersistence,
     CommandHandler,
     ContextTypes,
     ConversationHandler,
@@ -40,28 +53,484 @@ logger = logging.getLogger(__name__)
 
 THEME, LEVEL, QUESTIONS, QUESTION, ANSWERS, ANSWER, CORRECT_ANSWER = range(7)
 
+# Answer buttons carry the 1-based answer number, e.g. button_3.
+ANSWER_BUTTON_PATTERN = r"^button_(\d+)$"
+ANSWER_BUTTONS_PER_ROW = 4
+
+
+class QuizStore:
+    """Stores every created test as its own JSON record, one directory per author.
+
+    Records are queued by :meth:`save` and written by a background task in a worker thread,
+    each through a temporary file that is atomically renamed over the target. An in-memory
+    index by theme and level is kept up to date by the writer, so lookups never touch the disk.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._index = defaultdict(list)
+        self._queue = asyncio.Queue()
+        self._writer = None
+
+    async def start(self):
+        """Builds the theme and level index from the stored records and starts the writer."""
+        for record_path, theme, level in await asyncio.to_thread(self._scan):
+            self._index[(theme, level)].append(record_path)
+        self._writer = asyncio.create_task(self._write_records())
+
+    async def stop(self):
+        """Waits until all queued records are written and stops the writer."""
+        await self._queue.join()
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+
+    def save(self, author_id, theme, level, questions):
+        """Queues a test for writing and returns the path of its future record."""
+        record_path = self.directory / str(author_id) / f"{uuid.uuid4().hex}.json"
+        # The questions are written later from another thread, while the caller may go on
+        # changing them.
+        record = {
+            'author': author_id,
+            'theme': theme,
+            'level': level,
+            'questions': copy.deepcopy(questions),
+        }
+        self._queue.put_nowait((record_path, record))
+        return record_path
+
+    async def save_streamed(self, author_id, theme, level, questions):
+        """Writes a test whose questions are taken one at a time from the iterator
+        ``questions`` in a worker thread, so that they never need to be in memory as a whole.
+
+        Returns the path of the record, or ``None`` if there were no questions, and the number
+        of questions. Exceptions raised by ``questions`` are passed on and nothing is written.
+        """
+        record_path = self.directory / str(author_id) / f"{uuid.uuid4().hex}.json"
+        record = {'author': author_id, 'theme': theme, 'level': level}
+        count = await asyncio.to_thread(self._write_streamed, record_path, record, questions)
+        if not count:
+            return None, count
+        self._index[(theme, level)].append(record_path)
+        return record_path, count
+
+    def find(self, theme, level):
+        """Returns the paths of all written records with the given theme and level."""
+        return list(self._index.get((theme, level), ()))
+
+    def _scan(self):
+        records = []
+        for record_path in self.directory.glob("*/*.json"):
+            try:
+                with open(record_path, encoding='utf-8') as record_file:
+                    record = json.load(record_file)
+                records.append((record_path, record['theme'], record['level']))
+            except (OSError, ValueError, KeyError):
+                logger.warning("Skipping unreadable test record %s.", record_path)
+        return records
+
+    @staticmethod
+    def _write_streamed(record_path, record, questions):
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = record_path.with_suffix(".tmp")
+        count = 0
+        try:
+            with open(temporary_path, 'w', encoding='utf-8') as record_file:
+                # The record is the same JSON object that save() writes, with the questions last.
+                record_file.write(json.dumps(record, ensure_ascii=False)[:-1] + ', "questions": [')
+                for question in questions:
+                    if count:
+                        record_file.write(", ")
+                    json.dump(question, record_file, ensure_ascii=False)
+                    count += 1
+                record_file.write("]}")
+            if count:
+                os.replace(temporary_path, record_path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+        return count
+
+    async def _write_records(self):
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                for record_path, record in await asyncio.to_thread(self._write_batch, batch):
+                    self._index[(record['theme'], record['level'])].append(record_path)
+            except Exception:
+                # The writer must keep running, otherwise stop() waits for the queue forever.
+                logger.exception("Failed to write test records.")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write_batch(batch):
+        """Writes the records of the batch and returns those that were written."""
+        written = []
+        for record_path, record in batch:
+            temporary_path = record_path.with_suffix(".tmp")
+            try:
+                record_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temporary_path, 'w', encoding='utf-8') as record_file:
+                    json.dump(record, record_file, ensure_ascii=False)
+                os.replace(temporary_path, record_path)
+                written.append((record_path, record))
+            except Exception:
+                # A broken record must not keep the others of the batch from being written.
+                logger.exception("Failed to write the test record %s.", record_path)
+                temporary_path.unlink(missing_ok=True)
+        return written
+
+
+class DraftJournal:
+    """Journals the steps of unfinished tests, so that drafts survive a restart.
+
+    Every step appends a small delta record to a JSON lines file instead of serialising the
+    whole draft. A background task writes the records in batches from a worker thread and
+    periodically compacts the journal into a single record per draft.
+    """
+
+    def __init__(self, path, compact_interval=300):
+        self.path = Path(path)
+        self.compact_interval = compact_interval
+        self._drafts = {}
+        self._queue = asyncio.Queue()
+        self._task = None
+        self._dirty = False
+
+    async def start(self):
+        """Replays the journal, starts the background task and returns the recovered drafts."""
+        for record in await asyncio.to_thread(self._read):
+            self._apply(record['user'], record['op'], record.get('value'))
+        self._task = asyncio.create_task(self._write_records())
+        return copy.deepcopy(self._drafts)
+
+    async def stop(self):
+        """Waits until all records are written, compacts the journal and stops the task."""
+        if self._task is not None:
+            # The task may be in the middle of a compaction, which must finish before the
+            # final one starts, so it is asked to stop instead of being cancelled.
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+        await asyncio.to_thread(self._rewrite, self._snapshot())
+
+    def has_draft(self, user_id):
+        """Tells whether the user has an unfinished draft."""
+        return user_id in self._drafts
+
+    def record(self, user_id, op, value=None):
+        """Appends a step of the user's draft to the journal."""
+        if self._apply(user_id, op, value):
+            self._queue.put_nowait({'user': user_id, 'op': op, 'value': value})
+
+    def _apply(self, user_id, op, value):
+        drafts = self._drafts
+        try:
+            match op:
+                case 'draft':
+                    drafts[user_id] = value
+                case 'start':
+                    drafts[user_id] = {'theme': "", 'level': "", 'questions': []}
+                case 'end':
+                    drafts.pop(user_id, None)
+                case 'theme' | 'level':
+                    drafts[user_id][op] = value
+                case 'question':
+                    drafts[user_id]['questions'].append({'question': list(value), 'answers': [], 'correct_answer': ""})
+                case 'answer':
+                    drafts[user_id]['questions'][-1]['answers'].append(value)
+                case 'answers':
+                    drafts[user_id]['questions'][-1]['answers'] = list(value)
+                case 'correct_answer':
+                    drafts[user_id]['questions'][-1]['correct_answer'] = value
+        except (KeyError, IndexError):
+            # Drafts started before the journal existed can't be journaled.
+            logger.warning("No draft of user %s to apply %s to.", user_id, op)
+            return False
+        return True
+
+    def _snapshot(self):
+        return [
+            json.dumps({'user': user_id, 'op': 'draft', 'value': draft}, ensure_ascii=False)
+            for user_id, draft in self._drafts.items()
+        ]
+
+    def _read(self):
+        records = []
+        try:
+            with open(self.path, encoding='utf-8') as journal_file:
+                for line in journal_file:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        logger.warning("Skipping a broken record of the draft journal.")
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _append(self, lines):
+        with open(self.path, 'a', encoding='utf-8') as journal_file:
+            journal_file.writelines(line + "\n" for line in lines)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def _rewrite(self, lines):
+        temporary_path = self.path.with_suffix(".tmp")
+        with open(temporary_path, 'w', encoding='utf-8') as journal_file:
+            journal_file.writelines(line + "\n" for line in lines)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temporary_path, self.path)
+
+    async def _write_records(self):
+        loop = asyncio.get_running_loop()
+        compact_at = loop.time() + self.compact_interval
+        while True:
+            try:
+                batch = [await asyncio.wait_for(self._queue.get(), max(compact_at - loop.time(), 0))]
+            except TimeoutError:
+                batch = []
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # None is queued by stop() to end the task.
+            stopping = None in batch
+            if stopping:
+                batch.remove(None)
+                self._queue.task_done()
+            try:
+                if loop.time() >= compact_at:
+                    # The in-memory drafts already contain every queued record.
+                    compact_at = loop.time() + self.compact_interval
+                    if self._dirty or batch:
+                        await asyncio.to_thread(self._rewrite, self._snapshot())
+                        self._dirty = False
+                elif batch:
+                    lines = [json.dumps(record, ensure_ascii=False) for record in batch]
+                    await asyncio.to_thread(self._append, lines)
+                    self._dirty = True
+            except OSError:
+                logger.exception("Failed to write the draft journal.")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stopping:
+                return
+
+
+class FilePersistence(BasePersistence):
+    """Keeps the data of every user and chat, the bot data and every conversation state in
+    separate pickle files below a directory.
+
+    User and chat data are loaded lazily on their first use through the refresh hooks instead of
+    at startup. At startup, only the ids that have stored data are listed, so that the first use
+    of a new id doesn't need a worker thread. Files are written from a worker thread through a
+    temporary file, and only if their content has actually changed since the last write.
+    """
+
+    def __init__(self, directory, update_interval=60):
+        super().__init__(update_interval=update_interval)
+        self.directory = Path(directory)
+        self._loaded = {'user_data': set(), 'chat_data': set()}
+        self._stored = {'user_data': set(), 'chat_data': set()}
+        self._digests = {}
+
+    def _path(self, *parts):
+        return self.directory.joinpath(*map(str, parts)).with_suffix(".pickle")
+
+    @staticmethod
+    def _conversation_file_name(key):
+        return "_".join(map(str, key))
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path, 'rb') as data_file:
+                return pickle.load(data_file)
+        except FileNotFoundError:
+            return None
+
+    def _list_ids(self, kind):
+        return {int(path.stem) for path in self.directory.joinpath(kind).glob("*.pickle")}
+
+    def _load_conversations(self, name):
+        conversations = {}
+        for path in self.directory.joinpath('conversations', name).glob("*.pickle"):
+            key, state = self._load(path)
+            conversations[key] = state
+        return conversations
+
+    def _dump(self, path, data):
+        content = pickle.dumps(data)
+        digest = hashlib.blake2b(content).digest()
+        if self._digests.get(path) == digest:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_suffix(".tmp")
+        with open(temporary_path, 'wb') as data_file:
+            data_file.write(content)
+        os.replace(temporary_path, path)
+        self._digests[path] = digest
+
+    def _drop(self, path):
+        self._digests.pop(path, None)
+        path.unlink(missing_ok=True)
+
+    async def _refresh(self, kind, data_id, data):
+        if data_id in self._loaded[kind]:
+            return
+        self._loaded[kind].add(data_id)
+        if data_id not in self._stored[kind]:
+            return
+        stored = await asyncio.to_thread(self._load, self._path(kind, data_id))
+        # Anything already in memory is newer than what was stored.
+        for key, value in (stored or {}).items():
+            data.setdefault(key, value)
+
+    async def get_user_data(self):
+        self._stored['user_data'] = await asyncio.to_thread(self._list_ids, 'user_data')
+        return {}
+
+    async def get_chat_data(self):
+        self._stored['chat_data'] = await asyncio.to_thread(self._list_ids, 'chat_data')
+        return {}
+
+    async def get_bot_data(self):
+        return await asyncio.to_thread(self._load, self._path('bot_data')) or {}
+
+    async def get_callback_data(self):
+        return await asyncio.to_thread(self._load, self._path('callback_data'))
+
+    async def get_conversations(self, name):
+        return await asyncio.to_thread(self._load_conversations, name)
+
+    async def update_conversation(self, name, key, new_state):
+        path = self._path('conversations', name, self._conversation_file_name(key))
+        if new_state is None:
+            await asyncio.to_thread(self._drop, path)
+        else:
+            await asyncio.to_thread(self._dump, path, (key, new_state))
+
+    async def update_user_data(self, user_id, data):
+        self._loaded['user_data'].add(user_id)
+        self._stored['user_data'].add(user_id)
+        await asyncio.to_thread(self._dump, self._path('user_data', user_id), data)
+
+    async def update_chat_data(self, chat_id, data):
+        self._loaded['chat_data'].add(chat_id)
+        self._stored['chat_data'].add(chat_id)
+        await asyncio.to_thread(self._dump, self._path('chat_data', chat_id), data)
+
+    async def update_bot_data(self, data):
+        await asyncio.to_thread(self._dump, self._path('bot_data'), data)
+
+    async def update_callback_data(self, data):
+        await asyncio.to_thread(self._dump, self._path('callback_data'), data)
+
+    async def drop_user_data(self, user_id):
+        self._stored['user_data'].discard(user_id)
+        await asyncio.to_thread(self._drop, self._path('user_data', user_id))
+
+    async def drop_chat_data(self, chat_id):
+        self._stored['chat_data'].discard(chat_id)
+        await asyncio.to_thread(self._drop, self._path('chat_data', chat_id))
+
+    async def refresh_user_data(self, user_id, user_data):
+        await self._refresh('user_data', user_id, user_data)
+
+    async def refresh_chat_data(self, chat_id, chat_data):
+        await self._refresh('chat_data', chat_id, chat_data)
+
+    async def refresh_bot_data(self, bot_data):
+        pass
+
+    async def flush(self):
+        # Every update is written right away.
+        pass
+
+
+def parse_question(question, answers, correct_answer):
+    """Validates an imported question and converts it into the stored question structure."""
+    if not isinstance(question, str) or not question.split():
+        raise ValueError("пустой вопрос")
+    if not isinstance(answers, list):
+        raise ValueError("ответы должны быть списком")
+    answers = [answer for answer in map(str, answers) if answer.strip()]
+    if len(answers) <= 1:
+        answers = ["True", "False"]
+    if len(answers) > InlineKeyboardMarkupLimit.TOTAL_BUTTON_NUMBER:
+        raise ValueError("слишком много ответов")
+    if correct_answer not in answers:
+        raise ValueError("правильного ответа нет среди ответов")
+    return {'question': question.split(), 'answers': answers, 'correct_answer': correct_answer}
+
+
+def read_questions(path):
+    """Reads the questions of an imported test one at a time.
+
+    A ``.jsonl`` file holds one ``{"question": ..., "answers": [...], "correct_answer": ...}``
+    object per line. A ``.csv`` file holds one question per row: the question, the correct
+    answer and then the answers.
+    """
+    # utf-8-sig also skips the byte order mark that e.g. Excel puts at the start of CSV files
+    with open(path, encoding='utf-8-sig', newline='') as import_file:
+        if path.suffix == ".csv":
+            rows = enumerate(csv.reader(import_file), start=1)
+        else:
+            rows = enumerate(import_file, start=1)
+        for line_number, row in rows:
+            try:
+                if path.suffix == ".csv":
+                    if not row:
+                        continue
+                    yield parse_question(row[0], row[2:], row[1] if len(row) > 1 else "")
+                else:
+                    if not row.strip():
+                        continue
+                    item = json.loads(row)
+                    yield parse_question(item['question'], item.get('answers', []), item.get('correct_answer'))
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"строка {line_number}: {exc}") from exc
+
+
+def restore_draft(user_data, draft):
+    """Puts a recovered draft back into the user data."""
+    questions = draft['questions']
+    finished = not questions or bool(questions[-1]['correct_answer'])
+    user_data['theme'] = draft['theme']
+    user_data['level'] = draft['level']
+    user_data['questions'] = questions
+    user_data['question_number'] = len(questions) if finished else len(questions) - 1
+    user_data['enter_question'] = finished
+    user_data['answers_number'] = 0 if finished else len(questions[-1]['answers'])
+
+
+quiz_store = QuizStore("quizzes")
+draft_journal = DraftJournal("drafts.jsonl")
+
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Starts creating a test."""
     
     context.user_data['user_name'] = update.message.from_user
     
-    context.user_data['theme'] = ""
-    context.user_data['level'] = ""
-    context.user_data['questions'] = []
-    context.user_data['question_number'] = 0
-    context.user_data['enter_question'] = True
-    
     buttons = [
         [
             InlineKeyboardButton(text="Новый тест", callback_data='new_test'),
             InlineKeyboardButton(text="Закончить", callback_data='end'),
         ],
     ]
+    text = "Этот бот предназначен для создания тестов для HomeOfLanguagesBot. "
+    if draft_journal.has_draft(update.effective_user.id):
+        # The draft is only replaced once a new test is started.
+        buttons.insert(0, [InlineKeyboardButton(text="Продолжить черновик", callback_data='resume_draft')])
+        text += "\n\nЕсть незаконченный тест. "
     keyboard = InlineKeyboardMarkup(buttons)
 
     await update.message.reply_text(
-        "Этот бот предназначен для создания тестов для HomeOfLanguagesBot. ",
+        text,
         reply_markup=keyboard,
     )
 
@@ -72,6 +541,13 @@ async def ask_for_theme(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     
     logger.info("User %s is starting to create a new test.", context.user_data.get('user_name').first_name)
     
+    context.user_data['theme'] = ""
+    context.user_data['level'] = ""
+    context.user_data['questions'] = []
+    context.user_data['question_number'] = 0
+    context.user_data['enter_question'] = True
+    draft_journal.record(update.effective_user.id, 'start')
+
     text = "Какая тема?"
 
     await update.callback_query.answer()
@@ -80,10 +556,53 @@ async def ask_for_theme(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     return LEVEL
 
 
+async def resume_draft(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Continues a recovered draft at the step where it was left."""
+
+    user_data = context.user_data
+    logger.info("User %s is continuing a draft.", user_data.get('user_name').first_name)
+
+    await update.callback_query.answer()
+    if not user_data.get('theme'):
+        await update.callback_query.edit_message_text(text="Какая тема?")
+        return LEVEL
+    if not user_data.get('level'):
+        await update.callback_query.edit_message_text(text="Какой уровень?")
+        return QUESTIONS
+    if user_data.get('enter_question'):
+        buttons = [
+            [
+                InlineKeyboardButton(text="Добавить новый вопрос", callback_data='new_question'),
+                InlineKeyboardButton(text="Закончить", callback_data='end_questions'),
+            ],
+        ]
+        await update.callback_query.edit_message_text(
+            "Добавить новый вопрос? ",
+            reply_markup=InlineKeyboardMarkup(buttons),
+        )
+        return QUESTION
+
+    buttons = [
+        [
+            InlineKeyboardButton(text="Добавить новый ответ", callback_data='new_answer'),
+            InlineKeyboardButton(text="Закончить", callback_data='end'),
+        ],
+    ]
+    if user_data['answers_number'] >= InlineKeyboardMarkupLimit.TOTAL_BUTTON_NUMBER:
+        del buttons[0][0]
+    await update.callback_query.edit_message_text(
+        "*Количество ответов: " + str(user_data.get('answers_number')) + ".*\n\nДобавить новый ответ? ",
+        reply_markup=InlineKeyboardMarkup(buttons),
+        parse_mode='Markdown'
+    )
+    return ANSWER
+
+
 async def save_theme_and_ask_for_level(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Saves the theme and asks for a test level."""
     
     context.user_data['theme'] = update.message.text
+    draft_journal.record(update.effective_user.id, 'theme', update.message.text)
     logger.info("A theme is %s.", context.user_data.get('theme'))
 
     await update.message.reply_text(
@@ -96,6 +615,7 @@ async def questions(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Stores the selected level and asks for questions."""
 
     context.user_data['level'] = update.message.text
+    draft_journal.record(update.effective_user.id, 'level', update.message.text)
     logger.info("A level is %s.", context.user_data.get('level'))
     
     buttons = [
@@ -138,9 +658,11 @@ async def answers(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         questions.append(question_with_answers)
         context.user_data['enter_question'] = False
         context.user_data['answers_number'] = 0
+        draft_journal.record(update.effective_user.id, 'question', question_with_answers['question'])
     else:
         questions[question_number]['answers'].append(update.message.text)
         context.user_data['answers_number'] += 1
+        draft_journal.record(update.effective_user.id, 'answer', update.message.text)
     context.user_data['questions'] = questions
     logger.info("Current question with answers are %s.", questions)
     
@@ -150,6 +672,9 @@ async def answers(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
             InlineKeyboardButton(text="Закончить", callback_data='end'),
         ],
     ]
+    if len(questions[question_number]['answers']) >= InlineKeyboardMarkupLimit.TOTAL_BUTTON_NUMBER:
+        # No more answers fit into the keyboard for choosing the correct one.
+        del buttons[0][0]
     keyboard = InlineKeyboardMarkup(buttons)
 
     await update.message.reply_text(
@@ -171,13 +696,14 @@ async def answer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     return ANSWERS
 
 async def generate_buttons(answers):
-    "Generates the answers buttons for choosing correct answer."
-    num_buttons = len(answers)
-    buttons = []
-    for i in range(1, num_buttons + 1):
-        button = InlineKeyboardButton(text=answers[i - 1], callback_data=f'button_{i}')
-        buttons.append(button)
-    return [buttons]
+    "Generates the answers buttons for choosing correct answer, split into rows."
+    answers = answers[:InlineKeyboardMarkupLimit.TOTAL_BUTTON_NUMBER]
+    buttons = [
+        InlineKeyboardButton(text=answer, callback_data=f'button_{i}')
+        for i, answer in enumerate(answers, start=1)
+    ]
+    per_row = min(ANSWER_BUTTONS_PER_ROW, InlineKeyboardMarkupLimit.BUTTONS_PER_ROW)
+    return [buttons[i:i + per_row] for i in range(0, len(buttons), per_row)]
 
 async def end_answers(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Asks for a correct answer."""
@@ -198,6 +724,7 @@ async def end_answers(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
         questions[question_number]['answers'].append("True")
         questions[question_number]['answers'].append("False")
         context.user_data['questions'] = questions
+        draft_journal.record(update.effective_user.id, 'answers', questions[question_number]['answers'])
 
     keyboard = InlineKeyboardMarkup( await generate_buttons(questions[question_number]['answers']) )
 
@@ -213,18 +740,17 @@ async def correct_answer(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     questions = context.user_data.get('questions')
     question_number = context.user_data.get('question_number')
+    answers = questions[question_number]['answers']
+    # The handler pattern has already parsed the answer number.
+    answer_index = int(context.match.group(1)) - 1
+    if not 0 <= answer_index < len(answers):
+        # A button of an outdated keyboard was pressed.
+        await update.callback_query.answer()
+        return CORRECT_ANSWER
     context.user_data['question_number'] = question_number + 1
-    correct_answer_button_name = update.callback_query.data
-    match str(correct_answer_button_name):
-        case "button_1":
-            questions[question_number]['correct_answer'] = questions[question_number]['answers'][0]
-        case "button_2":
-            questions[question_number]['correct_answer'] = questions[question_number]['answers'][1]
-        case "button_3":
-            questions[question_number]['correct_answer'] = questions[question_number]['answers'][2]
-        case "button_4":
-            questions[question_number]['correct_answer'] = questions[question_number]['answers'][3]
+    questions[question_number]['correct_answer'] = answers[answer_index]
     context.user_data['questions'] = questions
+    draft_journal.record(update.effective_user.id, 'correct_answer', questions[question_number]['correct_answer'])
     logger.info("Correct answer is %s.", questions[question_number]['correct_answer'])
     
     buttons = [
@@ -248,10 +774,14 @@ async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Cancels and ends the test creating. Saves data."""
     
     if not context.user_data.get('questions') is None:
-        with open('test_data.json', 'w', encoding='utf-8') as test_data_json_file:
-            json.dump([context.user_data.get('theme'), context.user_data.get('level')], test_data_json_file, ensure_ascii=False)
-        with open('questions.json', 'w', encoding='utf-8') as questions_json_file:
-            json.dump(context.user_data.get('questions'), questions_json_file, ensure_ascii=False)
+        record_path = quiz_store.save(
+            update.effective_user.id,
+            context.user_data.get('theme'),
+            context.user_data.get('level'),
+            context.user_data.get('questions'),
+        )
+        logger.info("The test is queued for saving to %s.", record_path)
+    draft_journal.record(update.effective_user.id, 'end')
     
     text = "До скорой встречи!"
 
@@ -261,10 +791,65 @@ async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     return  ConversationHandler.END
 
 
-def main() -> None:
-    """Run the bot."""
-    # Create the Application and pass it your bot's token.
-    application = Application.builder().token("7422563960:AAFYrkWObqC3iKx6mT7qg5qhzYUSdUW8cy4").build()
+async def import_test(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Creates a whole test from an uploaded JSON lines or CSV document."""
+
+    caption = (update.message.caption or "").splitlines()
+    if len(caption) < 2:
+        await update.message.reply_text(
+            "Укажите в подписи к файлу тему в первой строке и уровень во второй.",
+        )
+        return
+    theme, level = caption[0].strip(), caption[1].strip()
+
+    document = update.message.document
+    if document.file_size and document.file_size > FileSizeLimit.FILESIZE_DOWNLOAD:
+        await update.message.reply_text(
+            f"Файл слишком большой. Максимальный размер: {FileSizeLimit.FILESIZE_DOWNLOAD // 10**6} МБ.",
+        )
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        import_path = Path(directory) / ("import" + Path(document.file_name).suffix.lower())
+        try:
+            await (await document.get_file()).download_to_drive(import_path)
+        except BadRequest as exc:
+            logger.warning("Failed to download an imported test: %s", exc)
+            await update.message.reply_text("Не удалось скачать файл.")
+            return
+        try:
+            record_path, count = await quiz_store.save_streamed(
+                update.effective_user.id, theme, level, read_questions(import_path)
+            )
+        except ValueError as exc:
+            await update.message.reply_text(f"Не удалось загрузить тест: {exc}.")
+            return
+
+    if not count:
+        await update.message.reply_text("В файле нет вопросов.")
+        return
+    logger.info("An imported test with %s questions is saved to %s.", count, record_path)
+
+    await update.message.reply_text(
+        f"Тест загружен. Количество вопросов: {count}.\n"
+        f"Тестов с этой темой и уровнем: {len(quiz_store.find(theme, level))}."
+    )
+
+
+async def post_init(application: Application) -> None:
+    """Starts the test store and recovers unfinished drafts."""
+    await quiz_store.start()
+    for user_id, draft in (await draft_journal.start()).items():
+        restore_draft(application.user_data[user_id], draft)
+
+
+async def post_shutdown(application: Application) -> None:
+    """Flushes the test store and the draft journal."""
+    await quiz_store.stop()
+    await draft_journal.stop()
+
+
+def add_handlers(application: Application) -> None:
+    """Registers the handlers for creating tests."""
 
     filterwarnings(action="ignore", message=r".*CallbackQueryHandler", category=PTBUserWarning)
 
@@ -272,7 +857,8 @@ def main() -> None:
     conv_handler = ConversationHandler(
         entry_points=[CommandHandler("start", start)],
         states={
-            THEME: [CallbackQueryHandler(ask_for_theme, pattern="^new_test$")],
+            THEME: [CallbackQueryHandler(ask_for_theme, pattern="^new_test$"),
+                    CallbackQueryHandler(resume_draft, pattern="^resume_draft$")],
             LEVEL: [MessageHandler(filters.TEXT, save_theme_and_ask_for_level)],
             QUESTIONS: [MessageHandler(filters.TEXT, questions)],
             QUESTION: [CallbackQueryHandler(question, pattern="^new_question$"),
@@ -280,12 +866,34 @@ def main() -> None:
             ANSWERS: [MessageHandler(filters.TEXT, answers)],
             ANSWER: [CallbackQueryHandler(answer, pattern="^new_answer$"),
                      CallbackQueryHandler(end_answers, pattern="^end$")],
-            CORRECT_ANSWER: [CallbackQueryHandler(correct_answer, pattern="^button_1|button_2|button_3|button_4$")],
+            CORRECT_ANSWER: [CallbackQueryHandler(correct_answer, pattern=ANSWER_BUTTON_PATTERN)],
         },
         fallbacks=[CommandHandler("cancel", cancel)],
+        name="test_creation",
+        persistent=True,
     )
 
     application.add_handler(conv_handler)
+    application.add_handler(
+        MessageHandler(
+            filters.Document.FileExtension("jsonl") | filters.Document.FileExtension("csv"),
+            import_test,
+        )
+    )
+
+
+def main() -> None:
+    """Run the bot."""
+    # Create the Application and pass it your bot's token.
+    application = (
+        Application.builder()
+        .token("7422563960:AAFYrkWObqC3iKx6mT7qg5qhzYUSdUW8cy4")
+        .persistence(FilePersistence("persistence"))
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
+    add_handlers(application)
 
     # Run the bot until the user presses Ctrl-C
     application.run_polling(allowed_updates=Update.ALL_TYPES)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+
+"""
+Compares the file size and the throughput of the compression codecs of PicklePersistence.
+
+The chat_data of a number of synthetic chats, each holding some messages and a dictionary like
+the one app.py stores, is written and read once per codec. Throughput is measured in MB of
+uncompressed pickle data per second. Data is generated from a fixed seed, so runs are
+reproducible.
+
+Usage:
+python compressionbench.py --chats 2000 --messages 5
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import random
+import tempfile
+import time
+
+from telegram import Chat, Message, MessageEntity, User
+from telegram.ext import ExtBot, PersistenceInput, PicklePersistence
+
+CODECS = (None, "gzip", "lzma", "zlib")
+WORDS = ("Question", "Answer", "Theme", "Level", "correct", "the", "a", "of", "end", "new")
+STORE_DATA = PersistenceInput(bot_data=False, user_data=False, callback_data=False)
+
+
+def build_chat_data(chats, messages, seed):
+    """Builds chat_data with some messages and a test in the format of app.py per chat."""
+    rng = random.Random(seed)
+    date = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    chat_data = {}
+    for chat_id in range(1000, 1000 + chats):
+        chat = Chat(chat_id, Chat.PRIVATE, first_name=f"User{chat_id}")
+        user = User(chat_id, f"User{chat_id}", False, language_code="en")
+        history = [
+            Message(
+                message_id,
+                date + datetime.timedelta(seconds=rng.randrange(10**7)),
+                chat,
+                from_user=user,
+                text=" ".join(rng.choices(WORDS, k=rng.randrange(1, 20))),
+                entities=[MessageEntity(MessageEntity.BOLD, 0, 4)],
+            )
+            for message_id in range(messages)
+        ]
+        test = {
+            "theme": f"Theme {rng.randrange(10)}",
+            "level": f"Level {rng.randrange(6)}",
+            "questions": [
+                {
+                    "question": f"Question {number}: I Answer here",
+                    "answers": [f"Answer {answer}" for answer in range(4)],
+                    "correct": [rng.randrange(4)],
+                }
+                for number in range(rng.randrange(1, 10))
+            ],
+        }
+        chat_data[chat_id] = {"history": history, "test": test}
+    return chat_data
+
+
+async def measure(directory, codec, chat_data, bot):
+    """Writes and reads chat_data once with the codec. Returns size, dump and load time."""
+    filepath = os.path.join(directory, f"persistence_{codec}")
+    persistence = PicklePersistence(
+        filepath, store_data=STORE_DATA, on_flush=True, compression=codec
+    )
+    persistence.set_bot(bot)
+    persistence.chat_data = chat_data
+
+    started = time.perf_counter()
+    await persistence.flush()
+    dump_time = time.perf_counter() - started
+
+    reader = PicklePersistence(filepath, store_data=STORE_DATA)
+    reader.set_bot(bot)
+    started = time.perf_counter()
+    # get_chat_data would add the time of copying the loaded data, which is the same for all
+    # codecs
+    reader._load_singlefile()  # pylint: disable=protected-access
+    load_time = time.perf_counter() - started
+    return os.path.getsize(filepath), dump_time, load_time
+
+
+async def run(chats, messages, seed):
+    bot = ExtBot("1:TEST")
+    chat_data = build_chat_data(chats, messages, seed)
+    print(f"chats: {chats}, messages per chat: {messages}")
+    print(f"{'codec':<6} {'size':>10} {'ratio':>6} {'dump MB/s':>10} {'load MB/s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        uncompressed = None
+        for codec in CODECS:
+            size, dump_time, load_time = await measure(directory, codec, chat_data, bot)
+            uncompressed = uncompressed or size
+            megabytes = uncompressed / 10**6
+            print(
+                f"{codec or 'none':<6} {size / 1024:>7.0f} KiB {uncompressed / size:>6.1f} "
+                f"{megabytes / dump_time:>10.1f} {megabytes / load_time:>10.1f}"
+            )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chats", type=int, default=2000, help="number of chats")
+    parser.add_argument("--messages", type=int, default=5, help="messages stored per chat")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated data")
+    args = parser.parse_args()
+    asyncio.run(run(args.chats, args.messages, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+
+"""
+Replays synthetic test authoring sessions through the conversation of app.py and measures how
+many updates per second one process can handle.
+
+Every simulated user goes through /start, theme, level, a number of questions with answers and
+the choice of the correct answers and finally ends the test. The Bot API is faked in-process by
+an httpx.MockTransport, so the run is fully offline. Sessions are generated from a fixed seed,
+so runs are reproducible.
+
+Usage:
+python loadtest.py --users 100 --questions 5 --answers 4
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+from urllib.parse import parse_qsl
+
+import httpx
+from telegram import Update
+from telegram.ext import Application
+from telegram.request import HTTPXRequest
+
+import app
+
+BOT_USER = {"id": 1, "is_bot": True, "first_name": "Bot", "username": "set_test_bot"}
+
+
+def fake_bot_api(request: httpx.Request) -> httpx.Response:
+    """Answers the Bot API requests of the bot without any network access."""
+    method = request.url.path.rsplit("/", 1)[-1]
+    parameters = dict(parse_qsl(request.content.decode()))
+    if method == "getMe":
+        result = BOT_USER
+    elif method in ("sendMessage", "editMessageText"):
+        result = {
+            "message_id": int(parameters.get("message_id", 1)),
+            "date": 0,
+            "chat": {"id": int(parameters["chat_id"]), "type": "private"},
+            "text": parameters.get("text", ""),
+        }
+    else:
+        result = True
+    return httpx.Response(200, json={"ok": True, "result": result})
+
+
+class FakeBotAPIRequest(HTTPXRequest):
+    """HTTPXRequest that sends all requests to :func:`fake_bot_api`."""
+
+    def __init__(self):
+        super().__init__(connection_pool_size=256)
+        self._client_kwargs["transport"] = httpx.MockTransport(fake_bot_api)
+        self._client = self._build_client()
+
+
+class Session:
+    """Builds the updates that one simulated user sends while creating a test."""
+
+    def __init__(self, application, user_id, update_ids):
+        self.application = application
+        self.user = {"id": user_id, "is_bot": False, "first_name": f"User{user_id}"}
+        self.chat = {"id": user_id, "type": "private"}
+        self.update_ids = update_ids
+
+    def message(self, text):
+        message = {"message_id": 1, "date": 0, "chat": self.chat, "from": self.user, "text": text}
+        if text.startswith("/"):
+            message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text)}]
+        return Update.de_json(
+            {"update_id": next(self.update_ids), "message": message}, self.application.bot
+        )
+
+    def callback(self, data):
+        callback_query = {
+            "id": str(next(self.update_ids)),
+            "from": self.user,
+            "chat_instance": str(self.chat["id"]),
+            "data": data,
+            "message": {"message_id": 1, "date": 0, "chat": self.chat, "from": BOT_USER, "text": ""},
+        }
+        return Update.de_json(
+            {"update_id": next(self.update_ids), "callback_query": callback_query},
+            self.application.bot,
+        )
+
+    def updates(self, rng, questions, answers):
+        """Yields the updates of a whole authoring session."""
+        yield self.message("/start")
+        yield self.callback("new_test")
+        yield self.message(f"Theme {rng.randrange(10)}")
+        yield self.message(f"Level {rng.randrange(6)}")
+        for question_number in range(questions):
+            yield self.callback("new_question")
+            yield self.message(f"Question {question_number}: I Answer here")
+            for answer_number in range(answers):
+                yield self.callback("new_answer")
+                yield self.message(f"Answer {answer_number}")
+            yield self.callback("end")
+            yield self.callback(f"button_{rng.randrange(answers) + 1}")
+        yield self.callback("end_questions")
+
+
+async def run_session(session, updates, latencies):
+    for update in updates:
+        started = time.perf_counter()
+        await session.application.process_update(update)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(users, questions, answers, seed):
+    application = (
+        Application.builder()
+        .token("1:TEST")
+        .request(FakeBotAPIRequest())
+        .persistence(app.FilePersistence("persistence"))
+        .updater(None)
+        .build()
+    )
+    app.add_handlers(application)
+
+    rng = random.Random(seed)
+    update_ids = itertools.count(1)
+    sessions = [Session(application, user_id, update_ids) for user_id in range(1000, 1000 + users)]
+    workload = [(session, list(session.updates(rng, questions, answers))) for session in sessions]
+    latencies = []
+
+    await application.initialize()
+    await app.post_init(application)
+    started = time.perf_counter()
+    await asyncio.gather(*(run_session(session, updates, latencies) for session, updates in workload))
+    elapsed = time.perf_counter() - started
+    await app.post_shutdown(application)
+    await application.shutdown()
+
+    latencies.sort()
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"users:        {users}")
+    print(f"updates:      {len(latencies)}")
+    print(f"elapsed:      {elapsed:.3f} s")
+    print(f"updates/sec:  {len(latencies) / elapsed:.1f}")
+    print(f"p50 latency:  {percentiles[49] * 1000:.3f} ms")
+    print(f"p99 latency:  {percentiles[98] * 1000:.3f} ms")
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=100, help="number of concurrent authors")
+    parser.add_argument("--questions", type=int, default=5, help="questions per test")
+    parser.add_argument("--answers", type=int, default=4, help="answers per question")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated sessions")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    # All files of the stores and the persistence go to a throwaway directory.
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            asyncio.run(run(args.users, args.questions, args.answers, args.seed))
+        finally:
+            os.chdir(working_directory)
+
+
+if __name__ == "__main__":
+    main()